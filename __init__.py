@@ -25,10 +25,22 @@ __all__ = ["Gema"]
 
 from typing import Optional
 from pathlib import Path
+from gem5.utils.gema.aggregate import GemaStatsAggregator
+from gem5.utils.gema.archive import GemaOutputArchiver
+from gem5.utils.gema.checkpoints import GemaCheckpointCache
 from gem5.utils.gema.config import GemaConfigGenerator
+from gem5.utils.gema.files import GemaOutputFiles
+from gem5.utils.gema.logs import GemaLogCollector
 from gem5.utils.gema.manager import GemaSimulationManager
+from gem5.utils.gema.metrics import GemaMetricsSampler
 from gem5.utils.gema.options import GemaOptionRetreiver
+from gem5.utils.gema.persistence import GemaStateStore
+from gem5.utils.gema.registry import GemaComponentRegistry
+from gem5.utils.gema.resources import GemaResourceCache
+from gem5.utils.gema.results import GemaResultCache
 from gem5.utils.gema.rpc import GemaServer
+from gem5.utils.gema.stats import GemaStatsReader
+from gem5.utils.gema.sweep import GemaSweepGenerator
 
 
 class Gema:
@@ -47,7 +59,30 @@ class Gema:
             lifecycle management.
         server (GemaServer): Provides RPC interface for remote control and
             monitoring.
-        sims (list): Maintains list of active simulation instances.
+        results (GemaResultCache): Maps configuration content hashes to the
+            outputs of finished simulations.
+        resources (GemaResourceCache): Resolves resources ahead of the
+            simulations that use them.
+        checkpoints (GemaCheckpointCache): Warm-up checkpoints shared by
+            simulations of switchable processors.
+        logs (GemaLogCollector): Captures the output of every simulation into
+            a rotated log in its output directory.
+        files (GemaOutputFiles): Serves simulation output files by byte range.
+        archive (GemaOutputArchiver): Compacts the outputs of exited
+            simulations and applies the retention policies.
+        sweeper (GemaSweepGenerator): Expands parameter sweeps and submits
+            them as batches.
+        metrics (GemaMetricsSampler): Samples the host resource usage of
+            running simulations.
+        stats (GemaStatsReader): Parses and queries the stats files of
+            simulations.
+        aggregator (GemaStatsAggregator): Tabulates stats across simulations.
+        sims (list): All simulations, in creation order, see
+            ``GemaSimulationManager.all_sims``.
+        registry (GemaComponentRegistry): The gem5 components that can be
+            configured, shared by the configurator and the retriever.
+        state (GemaStateStore): Optional on-disk store that every mutation is
+            written through to, replayed on startup.
 
     Note:
         The Gema class follows a composition pattern, delegating specific
@@ -55,7 +90,26 @@ class Gema:
         centralized coordination.
     """
 
-    def __init__(self, port: int, m5_override: Optional[Path]=None):
+    def __init__(
+        self,
+        port: int,
+        m5_override: Optional[Path]=None,
+        workers: int = 4,
+        sim_limit: Optional[int] = None,
+        state: Optional[Path] = None,
+        metrics_interval: float = 1.0,
+        progress_interval: float = 5.0,
+        checkpoint_dir: Optional[Path] = None,
+        checkpoint_limit: Optional[int] = None,
+        log_limit: int = 10 * 1024 * 1024,
+        archive_workers: int = 2,
+        retain_age: Optional[float] = None,
+        retain_size: Optional[int] = None,
+        warm_workers: int = 0,
+        resource_cache: Optional[Path] = None,
+        resource_dir: Optional[Path] = None,
+        pin_cores: int = 0,
+    ):
         """Initialize a new gEMA instance.
 
         Creates and initializes all component managers and controllers needed
@@ -65,12 +119,91 @@ class Gema:
         Args:
             port (int): Network port number for the RPC server. This port
                 must be available for the server to start successfully.
+            m5_override (Optional[Path]): Override directory for simulation
+                output.
+            workers (int): Number of RPC requests served concurrently. A value
+                of 1 serves requests one at a time.
+            sim_limit (Optional[int]): Maximum number of simulations running
+                at once. Defaults to the number of physical cores.
+            state (Optional[Path]): SQLite file that configurations, simulations,
+                sweeps and cached results are written through to. Existing state
+                in the file is restored on startup. Nothing is persisted if None.
+            metrics_interval (float): Seconds between two host metric samples of
+                the running simulations.
+            progress_interval (float): Host seconds between two progress reports
+                of a running simulation.
+            checkpoint_dir (Optional[Path]): Directory of the warm-up checkpoint
+                cache. Warm-ups are not cached if None.
+            checkpoint_limit (Optional[int]): Size limit of the checkpoint cache
+                in bytes. Unlimited if None.
+            log_limit (int): Size in bytes at which the log of a simulation is
+                rotated.
+            archive_workers (int): Threads compacting the outputs of exited
+                simulations. Outputs are not compacted if 0.
+            retain_age (Optional[float]): Seconds after which the outputs of a
+                simulation are pruned. Kept regardless of age if None.
+            retain_size (Optional[int]): Total size in bytes of all outputs
+                beyond which the oldest are pruned. Unlimited if None.
+            warm_workers (int): gem5 children kept started ahead of time, so
+                new simulations skip the startup of gem5. Disabled if 0.
+            resource_cache (Optional[Path]): Directory of the content-addressed
+                resource cache. Defaults to ~/.cache/gema/resources.
+            resource_dir (Optional[Path]): Directory of stand-in resources used
+                instead of gem5's resource sources, without network access.
+            pin_cores (int): Physical host cores every simulation is pinned to,
+                along with the NUMA node they belong to. Simulations are not
+                pinned if 0.
         """
+        self.state = GemaStateStore(state)
+        self.registry = GemaComponentRegistry()
+        self.resources = GemaResourceCache(self, resource_cache, resource_dir)
         self.configurator = GemaConfigGenerator(self)
         self.retriever = GemaOptionRetreiver(self)
-        self.manager = GemaSimulationManager(self, m5_override)
-        self.server = GemaServer(self, port)
-        self.sims = []
+        self.results = GemaResultCache(self)
+        self.checkpoints = GemaCheckpointCache(
+            self, checkpoint_dir, checkpoint_limit
+        )
+        self.logs = GemaLogCollector(self, log_limit)
+        self.manager = GemaSimulationManager(
+            self,
+            m5_override,
+            sim_limit,
+            progress_interval,
+            warm_workers,
+            pin_cores,
+        )
+        self.sweeper = GemaSweepGenerator(self)
+        self.metrics = GemaMetricsSampler(self, metrics_interval)
+        self.stats = GemaStatsReader(self)
+        self.aggregator = GemaStatsAggregator(self)
+        self.files = GemaOutputFiles(self)
+        self.archive = GemaOutputArchiver(
+            self, archive_workers, max_age=retain_age, max_size=retain_size
+        )
+        self.server = GemaServer(self, port, workers)
+        self._restore_state()
+
+    def _restore_state(self) -> None:
+        """Replay the contents of the state store into the components."""
+        snapshot = self.state.load()
+        self.configurator.restore(snapshot.config_ids)
+        self.sweeper.restore(snapshot.sweeps)
+        self.manager.restore(snapshot.sim_ids, snapshot.active_sims)
+        self.archive.resume()
+
+    @property
+    def sims(self) -> list:
+        return self.manager.all_sims()
+
+    def __getstate__(self) -> dict:
+        """Return the state needed by spawned gem5 children.
+
+        Simulations run in children started by gem5's spawn-based
+        multiprocessing, which pickles the simulation manager and, through it,
+        this object. A child only needs the configuration generator to build
+        its board, so the stores, caches, threads and the server stay behind.
+        """
+        return {"configurator": self.configurator}
 
     def run(self):
         """Start the gEMA instance and begin serving requests.
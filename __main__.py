@@ -19,8 +19,23 @@ from gem5.utils.gema import *
 parser = argparse.ArgumentParser("gEMA host")
 parser.add_argument("port", help="Port to use for API", type=int)
 parser.add_argument("--m5_override", help="Override directory for simulation output", required=False, type=Path)
+parser.add_argument("--workers", help="Number of RPC requests served concurrently", required=False, type=int, default=4)
+parser.add_argument("--sim_limit", help="Maximum number of simulations running at once (default: physical core count)", required=False, type=int)
+parser.add_argument("--state", help="SQLite file to persist configurations and simulations in; restored on startup", required=False, type=Path)
+parser.add_argument("--metrics_interval", help="Seconds between host metric samples of running simulations", required=False, type=float, default=1.0)
+parser.add_argument("--progress_interval", help="Host seconds between progress reports of running simulations", required=False, type=float, default=5.0)
+parser.add_argument("--checkpoint_dir", help="Directory to cache warm-up checkpoints of switchable processors in; disabled if not given", required=False, type=Path)
+parser.add_argument("--checkpoint_limit", help="Size limit of the checkpoint cache in MB; least recently used checkpoints are evicted beyond it", required=False, type=float)
+parser.add_argument("--log_limit", help="Size in MB at which the output log of a simulation is rotated", required=False, type=float, default=10.0)
+parser.add_argument("--archive_workers", help="Threads compressing the outputs of exited simulations; 0 disables compaction", required=False, type=int, default=2)
+parser.add_argument("--retain_days", help="Prune the outputs of simulations that ended this many days ago", required=False, type=float)
+parser.add_argument("--retain_size", help="Prune the outputs of the oldest simulations while all outputs exceed this many GB", required=False, type=float)
+parser.add_argument("--warm_workers", help="Number of gem5 processes kept started ahead of new simulations to cut their launch latency", required=False, type=int, default=0)
+parser.add_argument("--resource_cache", help="Directory of the content-addressed resource cache (default: ~/.cache/gema/resources)", required=False, type=Path)
+parser.add_argument("--resource_dir", help="Directory of stand-in resources named <name> or <name>-<version>, used without network access", required=False, type=Path)
+parser.add_argument("--pin_cores", help="Pin every simulation to this many physical cores of its own and their NUMA node (default: 0, not pinned)", required=False, type=int, default=0)
 args = parser.parse_args()
 
 if __name__ == "__m5_main__":
-    app = Gema(port=args.port, m5_override=args.m5_override)
+    app = Gema(port=args.port, m5_override=args.m5_override, workers=args.workers, sim_limit=args.sim_limit, state=args.state, metrics_interval=args.metrics_interval, progress_interval=args.progress_interval, checkpoint_dir=args.checkpoint_dir, checkpoint_limit=int(args.checkpoint_limit * 2**20) if args.checkpoint_limit is not None else None, log_limit=int(args.log_limit * 2**20), archive_workers=args.archive_workers, retain_age=args.retain_days * 86400 if args.retain_days is not None else None, retain_size=int(args.retain_size * 2**30) if args.retain_size is not None else None, warm_workers=args.warm_workers, resource_cache=args.resource_cache, resource_dir=args.resource_dir, pin_cores=args.pin_cores)
     app.run()
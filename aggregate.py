@@ -0,0 +1,239 @@
+# ----------------------------------------------------------------------------
+# File: <aggregate>.py
+#
+# Description:
+# <Tabulates and reduces stats across simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import math
+from dataclasses import asdict
+from pathlib import Path
+
+from gem5.utils.gema.results import GemaResultCache
+from gem5.utils.gema.rpc_data import GemaSimulation
+from gem5.utils.gema.stats import compile_patterns
+
+
+def _numbers(column: list) -> list[float]:
+    """Return the finite numeric values of a column."""
+    return [
+        value
+        for value in column
+        if isinstance(value, (int, float))
+        and not isinstance(value, bool)
+        and math.isfinite(value)
+    ]
+
+
+def _mean(values: list[float]) -> Optional[float]:
+    return math.fsum(values) / len(values) if values else None
+
+
+def _geomean(values: list[float]) -> Optional[float]:
+    if not values or any(value <= 0 for value in values):
+        return None
+    return math.exp(math.fsum(map(math.log, values)) / len(values))
+
+
+class GemaStatsAggregator:
+    """Builds tables of stats across many simulations.
+
+    The table has one row per simulation and is returned column by column:
+    the simulation ID, the configuration parameters and the requested
+    stats. Stats come from the parsed stats files cached by the
+    GemaStatsReader, so repeated queries over a sweep do not parse anything
+    again.
+
+    Rows can be grouped by parameter columns, and every stat column reduced
+    per group. Reductions skip missing and non-finite values. Each reduction
+    works on a whole column at once.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+    """
+
+    REDUCTIONS = {
+        "mean": _mean,
+        "min": lambda values: min(values, default=None),
+        "max": lambda values: max(values, default=None),
+        "geomean": _geomean,
+        "count": len,
+    }
+
+    def __init__(self, root: Gema) -> None:
+        self.root = root
+
+    def aggregate(
+        self,
+        stats: list[str],
+        sim_ids: Optional[list[int]] = None,
+        sweep_id: Optional[int] = None,
+        params: Optional[list[str]] = None,
+        group_by: Optional[list[str]] = None,
+        reductions: Optional[list[str]] = None,
+        dump: int = -1,
+    ) -> dict:
+        """Tabulate stats across simulations, optionally grouped and reduced.
+
+        Args:
+            stats (list[str]): Stat names, globs, or regexes prefixed with "re:".
+            sim_ids (Optional[list[int]]): The simulations to tabulate.
+            sweep_id (Optional[int]): Tabulate the simulations of this sweep.
+                Combined with ``sim_ids`` if both are given.
+            params (Optional[list[str]]): Dotted configuration fields to add as
+                columns, e.g. "cache.l2_size". Defaults to the axes of the
+                sweep, or else to the fields that differ between the
+                simulations.
+            group_by (Optional[list[str]]): Parameter columns to group rows by.
+            reductions (Optional[list[str]]): Reductions applied to every stat
+                column per group. Defaults to mean when grouping.
+            dump (int): The stats dump to read from every simulation. Defaults
+                to the last one.
+
+        Returns:
+            dict: ``columns``, the column names in order, ``data``, the values
+                 of each column, and ``missing``, the simulations without
+                 that dump. Reduced tables have one row per group, a
+                 ``sim_count`` column, and name their stat columns
+                 ``<stat>:<reduction>``.
+
+        Raises:
+            ValueError: If a simulation, sweep, parameter or reduction is
+                unknown.
+        """
+        sims = self._select(sim_ids, sweep_id)
+        matches = compile_patterns(stats)
+        reductions = list(reductions or (["mean"] if group_by else []))
+        for name in reductions:
+            if name not in self.REDUCTIONS:
+                known = ", ".join(self.REDUCTIONS)
+                raise ValueError(f"Unknown reduction '{name}'. Known: {known}.")
+
+        configs = [_flatten(asdict(sim.config)) for sim in sims]
+        if params is None:
+            sweep = self.root.sweeper.get_sweep(sweep_id) if sweep_id is not None else None
+            if sweep:
+                # Sweeps also accept "resource.name" for the resource
+                params = [
+                    "resource" if axis == "resource.name" else axis
+                    for axis in sweep.axes
+                ]
+            else:
+                params = _varying(configs)
+        params = list(dict.fromkeys([*params, *(group_by or [])]))
+        for param in params:
+            if not configs or param not in configs[0]:
+                raise ValueError(f"Unknown configuration field '{param}'.")
+
+        # One dump per simulation, then the union of the matching stat names
+        # in the order they first appear
+        dumps, missing = [], []
+        for sim in sims:
+            sim_dumps = self.root.stats.get_dumps(
+                Path(sim.path) / GemaResultCache.STATS_FILE
+            )
+            try:
+                dumps.append(sim_dumps[dump])
+            except IndexError:
+                dumps.append({})
+                missing.append(sim.sim_id)
+        names = list(
+            dict.fromkeys(name for d in dumps for name in d if matches(name))
+        )
+
+        data = {"sim_id": [sim.sim_id for sim in sims]}
+        for param in params:
+            data[param] = [config[param] for config in configs]
+        for name in names:
+            data[name] = [d.get(name) for d in dumps]
+
+        if group_by or reductions:
+            data = self._reduce(data, group_by or [], names, reductions)
+        return {"columns": list(data), "data": data, "missing": missing}
+
+    def _select(
+        self, sim_ids: Optional[list[int]], sweep_id: Optional[int]
+    ) -> list[GemaSimulation]:
+        """Resolve the requested simulations, in the order given."""
+        ids = list(sim_ids or [])
+        if sweep_id is not None:
+            sweep = self.root.sweeper.get_sweep(sweep_id)
+            if sweep is None:
+                raise ValueError(f"Sweep {sweep_id} does not exist.")
+            ids.extend(sweep.sim_ids)
+        if not ids:
+            raise ValueError("No simulations were selected.")
+
+        sims = []
+        for sim_id in dict.fromkeys(ids):
+            sim = self.root.manager.get_sim(sim_id)
+            if sim is None:
+                raise ValueError(f"Simulation {sim_id} does not exist.")
+            sims.append(sim)
+        return sims
+
+    def _reduce(
+        self,
+        data: dict[str, list],
+        group_by: list[str],
+        names: list[str],
+        reductions: list[str],
+    ) -> dict[str, list]:
+        """Group the rows of a table and reduce its stat columns per group."""
+        groups: dict[tuple, list[int]] = {}
+        for row in range(len(data["sim_id"])):
+            key = tuple(data[col][row] for col in group_by)
+            groups.setdefault(key, []).append(row)
+
+        reduced = {col: [key[i] for key in groups] for i, col in enumerate(group_by)}
+        reduced["sim_count"] = [len(rows) for rows in groups.values()]
+        for name in names:
+            column = data[name]
+            for reduction in reductions:
+                reduce = self.REDUCTIONS[reduction]
+                reduced[f"{name}:{reduction}"] = [
+                    reduce(_numbers([column[row] for row in rows]))
+                    for rows in groups.values()
+                ]
+        return reduced
+
+
+def _flatten(config: dict) -> dict[str, Any]:
+    """Flatten a configuration dictionary into dotted field names."""
+    flat = {}
+    for key, value in config.items():
+        if key == "config_id":
+            continue
+        if isinstance(value, dict):
+            for attr, item in value.items():
+                flat[f"{key}.{attr}"] = (
+                    tuple(item) if isinstance(item, list) else item
+                )
+        else:
+            flat[key] = value
+    return flat
+
+
+def _varying(configs: list[dict]) -> list[str]:
+    """Return the fields whose values differ between configurations."""
+    if not configs:
+        return []
+    return [
+        field
+        for field in configs[0]
+        if any(config[field] != configs[0][field] for config in configs[1:])
+    ]
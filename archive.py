@@ -0,0 +1,398 @@
+# ----------------------------------------------------------------------------
+# File: <archive>.py
+#
+# Description:
+# <Compacts the outputs of exited simulations and applies retention policies>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterator, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import gzip
+import os
+import threading
+import time
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from gem5.utils.gema.checkpoints import _directory_size
+from gem5.utils.gema.progress import read_json, write_json_atomic
+from gem5.utils.gema.rpc_data import GemaSimulation, SimStatus
+
+# Lists the compacted files of an output directory, see compress_file
+ARCHIVE_INDEX = "gema_archive.json"
+ARCHIVE_SUFFIX = ".gz"
+BLOCK_SIZE = 1024 * 1024
+
+# Outputs that retention keeps, so stats queries and cached results still work
+RETAINED = ("stats.txt", "config.ini", "config.json")
+
+# Suffixes of files that do not compress any further
+_COMPRESSED = (".gz", ".bz2", ".xz", ".zst", ".zip", ".png", ".jpg", ".tmp")
+
+
+def compress_file(path: Path, block_size: int = BLOCK_SIZE) -> dict:
+    """Compress a file into ``<path>.gz`` as a series of independent blocks.
+
+    Every block of ``block_size`` input bytes is its own gzip member, so the
+    result is still a regular gzip file, and any byte range can be read by
+    decompressing only the blocks that hold it. The original is left in
+    place for the caller to remove once the index entry is written.
+
+    Args:
+        path (Path): The file to compress.
+        block_size (int): Uncompressed bytes per block.
+
+    Returns:
+        dict: The index entry of the file, with its original ``size`` and
+             ``mtime``, the ``block_size`` and the ``offsets`` at which the
+             blocks start in the compressed file, followed by its size.
+    """
+    target = path.with_name(path.name + ARCHIVE_SUFFIX)
+    partial = target.with_name(f"{target.name}.tmp")
+    stat = path.stat()
+    offsets = [0]
+    try:
+        with open(path, "rb") as src, open(partial, "wb") as dst:
+            while True:
+                block = src.read(block_size)
+                if not block:
+                    break
+                dst.write(gzip.compress(block, mtime=0))
+                offsets.append(dst.tell())
+        os.replace(partial, target)
+    except OSError:
+        partial.unlink(missing_ok=True)
+        raise
+    return {
+        "size": stat.st_size,
+        "mtime": stat.st_mtime,
+        "block_size": block_size,
+        "offsets": offsets,
+    }
+
+
+class ArchivedFile:
+    """A compacted output file, read by byte range without unpacking it.
+
+    Attributes:
+        path (Path): The compressed file.
+        size (int): The size of the original file.
+    """
+
+    def __init__(self, path: Path, entry: dict) -> None:
+        self.path = path
+        self.size = entry["size"]
+        self._block_size = entry["block_size"]
+        self._offsets = entry["offsets"]
+
+    def read(self, offset: int, length: int) -> bytes:
+        """Return up to ``length`` original bytes starting at ``offset``."""
+        return b"".join(self.iter_range(offset, offset + length))
+
+    def iter_range(self, start: int, stop: int) -> Iterator[bytes]:
+        """Yield the original bytes from ``start`` up to ``stop``, by block."""
+        stop = min(stop, self.size)
+        with open(self.path, "rb") as f:
+            for index in range(start // self._block_size, len(self._offsets) - 1):
+                block_start = index * self._block_size
+                if block_start >= stop:
+                    break
+                f.seek(self._offsets[index])
+                block = zlib.decompress(
+                    f.read(self._offsets[index + 1] - self._offsets[index]),
+                    wbits=16 + zlib.MAX_WBITS,
+                )
+                yield block[max(start - block_start, 0) : stop - block_start]
+
+
+def read_archive_index(directory: Path) -> dict:
+    """Return the index entries of the compacted files of an output directory.
+
+    Args:
+        directory (Path): The output directory.
+
+    Returns:
+        dict: Index entries by path relative to the directory.
+    """
+    index = read_json(Path(directory) / ARCHIVE_INDEX) or {}
+    return index.get("files", {})
+
+
+def open_archived(directory: Path, relative: str) -> Optional[ArchivedFile]:
+    """Return a compacted file of an output directory, or None if there is none.
+
+    Args:
+        directory (Path): The output directory.
+        relative (str): The original path of the file, relative to it.
+    """
+    entry = read_archive_index(directory).get(relative)
+    path = Path(directory) / (relative + ARCHIVE_SUFFIX)
+    if entry is None or not path.is_file():
+        return None
+    return ArchivedFile(path, entry)
+
+
+def output_exists(path: Path) -> bool:
+    """Return whether an output file exists, either as is or compacted."""
+    path = Path(path)
+    return path.is_file() or path.with_name(path.name + ARCHIVE_SUFFIX).is_file()
+
+
+class GemaOutputArchiver:
+    """Compacts the output directories of exited simulations.
+
+    Once a simulation has been reaped, its large text outputs (stats.txt,
+    config.ini, traces, ...) are compressed by a pool of worker threads with
+    ``compress_file``, and listed in ARCHIVE_INDEX in the output directory.
+    Stats queries and file downloads read compacted files directly, so they
+    never need to be unpacked. gEMA's own files, gem5 checkpoints and files
+    below ``min_size`` are left as they are.
+
+    Retention policies then bound the disk space of all outputs. Once
+    enabled, the outputs of simulations that ended longer than ``max_age``
+    ago are pruned, as are those of the oldest simulations while the total
+    size of all outputs exceeds ``max_size``. Pruning deletes everything but
+    the RETAINED files and gEMA's own files.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+        min_size (int): Smallest file in bytes that is compressed.
+        max_age (Optional[float]): Seconds after which outputs are pruned, or
+            None to keep them regardless of age.
+        max_size (Optional[int]): Total size in bytes of all outputs beyond
+            which the oldest are pruned, or None for no limit.
+    """
+
+    def __init__(
+        self,
+        root: Gema,
+        workers: int = 2,
+        min_size: int = 64 * 1024,
+        max_age: Optional[float] = None,
+        max_size: Optional[int] = None,
+    ) -> None:
+        self.root = root
+        self.min_size = min_size
+        self.max_age = max_age
+        self.max_size = max_size
+        self._pool = (
+            ThreadPoolExecutor(max_workers=workers, thread_name_prefix="gema-archive")
+            if workers > 0
+            else None
+        )
+        # IDs of the simulations waiting to be compacted
+        self._pending: set[int] = set()
+        self._lock = threading.Lock()
+        self._retention_lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self._pool is not None
+
+    def submit(self, sim: GemaSimulation) -> bool:
+        """Queue the outputs of an exited simulation for compaction.
+
+        Args:
+            sim (GemaSimulation): The exited simulation.
+
+        Returns:
+            bool: True if the simulation was queued.
+        """
+        if (
+            not self.enabled
+            or sim.status not in SimStatus.DONE
+            or sim.archived is not None
+        ):
+            return False
+        with self._lock:
+            if sim.sim_id in self._pending:
+                return False
+            self._pending.add(sim.sim_id)
+        self._pool.submit(self._archive, sim)
+        return True
+
+    def resume(self) -> None:
+        """Queue the simulations a previous server left uncompacted."""
+        if not self.enabled:
+            return
+        sim_ids = self.root.state.find_sim_ids(
+            f"archived IS NULL AND status IN ({', '.join('?' * len(SimStatus.DONE))})",
+            SimStatus.DONE,
+        )
+        for sim_id in sim_ids:
+            sim = self.root.manager.get_sim(sim_id)
+            if sim is not None:
+                self.submit(sim)
+
+    def set_retention(
+        self, max_age: Optional[float], max_size: Optional[int]
+    ) -> int:
+        """Change the retention policies and apply them right away.
+
+        Args:
+            max_age (Optional[float]): The new age limit in seconds, or None.
+            max_size (Optional[int]): The new size limit in bytes, or None.
+
+        Returns:
+            int: The number of simulations whose outputs were pruned.
+        """
+        self.max_age, self.max_size = max_age, max_size
+        return self.apply_retention()
+
+    def compact(self, sim: GemaSimulation) -> int:
+        """Compress the large outputs of a simulation.
+
+        Every file is compressed, added to the index, and only then deleted,
+        so readers find it either as is or compacted at any time.
+
+        Args:
+            sim (GemaSimulation): The exited simulation. A simulation without
+                an output directory is marked as compacted, so it is not
+                queued again on every restart.
+
+        Returns:
+            int: The number of files compressed.
+        """
+        directory = Path(sim.path)
+        if not directory.is_dir():
+            self.root.manager.set_archived(sim, "compacted", 0)
+            return 0
+        index = read_json(directory / ARCHIVE_INDEX) or {"files": {}}
+        compressed = 0
+        for parent, dirs, names in os.walk(directory):
+            if "m5.cpt" in names:
+                # gem5 checkpoints must stay restorable
+                dirs[:] = []
+                continue
+            dirs.sort()
+            for name in sorted(names):
+                path = Path(parent) / name
+                if not self._compressible(path):
+                    continue
+                relative = path.relative_to(directory).as_posix()
+                try:
+                    index["files"][relative] = compress_file(path)
+                    write_json_atomic(directory / ARCHIVE_INDEX, index)
+                    path.unlink()
+                except OSError as e:
+                    print(f"Could not compact {path}: {e}")
+                    continue
+                compressed += 1
+
+        self.root.manager.set_archived(
+            sim, "compacted", _directory_size(directory)
+        )
+        return compressed
+
+    def apply_retention(self) -> int:
+        """Prune outputs according to the retention policies.
+
+        Returns:
+            int: The number of simulations whose outputs were pruned.
+        """
+        if self.max_age is None and self.max_size is None:
+            return 0
+        with self._retention_lock:
+            archived = sorted(
+                (sim for sim in self.root.manager.all_sims() if sim.archived),
+                key=lambda sim: sim.ended_on or "",
+            )
+            total = sum(sim.output_size or 0 for sim in archived)
+            now = time.time()
+            pruned = 0
+            for sim in archived:
+                if sim.archived == "pruned":
+                    continue
+                expired = (
+                    self.max_age is not None
+                    and now - _timestamp(sim.ended_on) > self.max_age
+                )
+                oversized = self.max_size is not None and total > self.max_size
+                if not (expired or oversized):
+                    continue
+                total -= sim.output_size or 0
+                self.prune(sim)
+                total += sim.output_size
+                pruned += 1
+            return pruned
+
+    def prune(self, sim: GemaSimulation) -> None:
+        """Delete all outputs of a simulation but the RETAINED and gEMA files.
+
+        Args:
+            sim (GemaSimulation): The simulation, which must have exited.
+        """
+        directory = Path(sim.path)
+        index = read_json(directory / ARCHIVE_INDEX) or {"files": {}}
+        keep = {
+            name + suffix for name in RETAINED for suffix in ("", ARCHIVE_SUFFIX)
+        }
+        for parent, dirs, names in os.walk(directory, topdown=False):
+            for name in names:
+                path = Path(parent) / name
+                if parent == str(directory) and (
+                    name in keep or name.startswith("gema")
+                ):
+                    continue
+                relative = path.relative_to(directory).as_posix()
+                try:
+                    path.unlink()
+                except OSError:
+                    continue
+                index["files"].pop(relative, None)
+                if relative.endswith(ARCHIVE_SUFFIX):
+                    index["files"].pop(relative[: -len(ARCHIVE_SUFFIX)], None)
+            if parent != str(directory):
+                try:
+                    os.rmdir(parent)
+                except OSError:
+                    pass
+        if directory.is_dir():
+            write_json_atomic(directory / ARCHIVE_INDEX, index)
+
+        self.root.manager.set_archived(sim, "pruned", _directory_size(directory))
+
+    def _archive(self, sim: GemaSimulation) -> None:
+        """Compact a simulation and apply retention. Runs on a pool thread."""
+        try:
+            self.compact(sim)
+            self.apply_retention()
+        except Exception as e:
+            print(f"Could not archive the outputs of simulation {sim.sim_id}: {e}")
+        finally:
+            with self._lock:
+                self._pending.discard(sim.sim_id)
+
+    def _compressible(self, path: Path) -> bool:
+        if (
+            path.name.startswith("gema")
+            or path.name.endswith(_COMPRESSED)
+            or path.is_symlink()
+        ):
+            return False
+        try:
+            return path.stat().st_size >= self.min_size
+        except OSError:
+            return False
+
+
+def _timestamp(date: Optional[str]) -> float:
+    """Convert a date recorded by the manager into a Unix timestamp."""
+    if not date:
+        return time.time()
+    return datetime.strptime(date, "%Y-%m-%d %H:%M:%S").timestamp()
+
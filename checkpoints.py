@@ -0,0 +1,291 @@
+# ----------------------------------------------------------------------------
+# File: <checkpoints>.py
+#
+# Description:
+# <Caches warm-up checkpoints shared between simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import os
+import shutil
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+
+from gem5.utils.gema.identity import warmup_content_hash
+from gem5.utils.gema.progress import read_json, write_json_atomic
+from gem5.utils.gema.rpc_data import GemaCheckpoint, GemaSimulation
+
+# Written into a checkpoint directory once the checkpoint is complete
+CHECKPOINT_META_FILE = "gema_checkpoint.json"
+
+
+def save_checkpoint(simulator, target: Path, tick: int, insts: int) -> bool:
+    """Take a checkpoint into a checkpoint cache entry. Runs in the gem5 child.
+
+    The checkpoint is written next to the entry and renamed into place, so
+    the cache never sees a partial checkpoint. If another simulation
+    published the same entry first, the new checkpoint is discarded.
+
+    Args:
+        simulator: The running gem5 Simulator.
+        target (Path): The directory of the cache entry.
+        tick (int): The current tick.
+        insts (int): Instructions committed by the leading core so far.
+
+    Returns:
+        bool: True if the checkpoint was published.
+    """
+    partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+    try:
+        simulator.save_checkpoint(partial)
+        write_json_atomic(
+            partial / CHECKPOINT_META_FILE,
+            {
+                "tick": tick,
+                "insts": insts,
+                "created_on": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+            },
+        )
+        os.rename(partial, target)
+        return True
+    except OSError as e:
+        print(f"Could not cache the checkpoint in {target}: {e}")
+        shutil.rmtree(partial, ignore_errors=True)
+        return False
+
+
+def read_checkpoint_meta(path: Path) -> Optional[dict]:
+    """Return the metadata of a checkpoint directory, or None if incomplete."""
+    return read_json(Path(path) / CHECKPOINT_META_FILE)
+
+
+class GemaCheckpointCache:
+    """A size-bounded cache of warm-up checkpoints.
+
+    Simulations of switchable processors fast-forward on the atomic CPU
+    before they switch to the detailed one. Sweep points that only differ
+    in the detailed CPU or the cache hierarchy run the same fast-forward,
+    so it is done once: the first simulation takes a checkpoint right
+    before it switches, and later ones restore it and switch immediately.
+    Entries are keyed by ``identity.warmup_content_hash``.
+
+    Each entry is a directory below the cache directory, named after its
+    key, so the cache survives restarts without being persisted. When the
+    entries exceed the size limit, the least recently used ones that no
+    running simulation is restoring from are deleted.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+        directory (Optional[Path]): The cache directory. The cache is
+            disabled if None.
+        limit (Optional[int]): Maximum total size of the entries in bytes,
+            or None for no limit.
+    """
+
+    def __init__(
+        self,
+        root: Gema,
+        directory: Optional[Path] = None,
+        limit: Optional[int] = None,
+    ) -> None:
+        self.root = root
+        self.directory = Path(directory) if directory is not None else None
+        self.limit = limit
+        self._entries: dict[str, GemaCheckpoint] = {}
+        # key -> number of running simulations using the entry
+        self._pins: dict[str, int] = {}
+        # Keys a running simulation is currently taking a checkpoint for
+        self._saving: set[str] = set()
+        self._lock = threading.RLock()
+        if self.directory is not None:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            self._scan()
+
+    @property
+    def enabled(self) -> bool:
+        return self.directory is not None
+
+    def get_entries(self) -> list[GemaCheckpoint]:
+        """Return all cached checkpoints, least recently used first."""
+        with self._lock:
+            return sorted(self._entries.values(), key=lambda e: e.last_used)
+
+    def prepare(self, sim: GemaSimulation) -> None:
+        """Decide whether a simulation restores or takes a warm-up checkpoint.
+
+        Called right before the simulation is started. Sets
+        ``sim.checkpoint`` and ``sim.checkpoint_restored`` accordingly. A
+        simulation takes a checkpoint only if no other running simulation is
+        already taking the same one.
+
+        Args:
+            sim (GemaSimulation): The simulation about to start.
+        """
+        sim.checkpoint, sim.checkpoint_restored = None, False
+        processor = sim.config.processor
+        if (
+            not self.enabled
+            or processor.type not in self.root.registry.switchable_processors
+        ):
+            return
+
+        config = sim.config
+        digest = None
+        if config.resource is not None:
+            digest = self.root.resources.digest(
+                config.resource, config.resource_version
+            )
+        key = warmup_content_hash(config, resource_digest=digest)
+        if key is None:
+            # Without a version or a digest, the resource cannot be told
+            # apart from other releases, so neither can its checkpoints
+            return
+        with self._lock:
+            entry = self._lookup(key)
+            if entry is not None:
+                entry.last_used = time.time()
+                # Keeps the LRU order across restarts, see _scan
+                try:
+                    os.utime(entry.path)
+                except OSError:
+                    pass
+                sim.checkpoint, sim.checkpoint_restored = entry.path, True
+            elif key not in self._saving:
+                self._saving.add(key)
+                sim.checkpoint = str(self.directory / key)
+            else:
+                return
+            self._pins[key] = self._pins.get(key, 0) + 1
+
+    def release(self, sim: GemaSimulation) -> None:
+        """Account for the checkpoint of a simulation that has exited.
+
+        Registers the checkpoint the simulation took, if any, and evicts
+        entries beyond the size limit.
+
+        Args:
+            sim (GemaSimulation): The exited simulation.
+        """
+        if sim.checkpoint is None:
+            return
+        key = Path(sim.checkpoint).name
+        with self._lock:
+            pins = self._pins.get(key, 0) - 1
+            if pins > 0:
+                self._pins[key] = pins
+            else:
+                self._pins.pop(key, None)
+            if not sim.checkpoint_restored:
+                self._saving.discard(key)
+                self._add(key)
+            self._evict()
+
+    def set_limit(self, limit: Optional[int]) -> int:
+        """Change the size limit and evict entries beyond it.
+
+        Args:
+            limit (Optional[int]): The new limit in bytes, or None for none.
+
+        Returns:
+            int: The number of entries evicted.
+        """
+        with self._lock:
+            self.limit = limit
+            return self._evict()
+
+    def clear(self) -> int:
+        """Delete all cached checkpoints that are not in use.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key not in self._pins]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+
+    def _lookup(self, key: str) -> Optional[GemaCheckpoint]:
+        """Return the entry of a key, dropping it if its directory is gone."""
+        entry = self._entries.get(key)
+        if entry is not None and read_checkpoint_meta(entry.path) is None:
+            del self._entries[key]
+            return None
+        return entry
+
+    def _add(self, key: str) -> Optional[GemaCheckpoint]:
+        """Register the entry directory of a key, if it holds a checkpoint."""
+        path = self.directory / key
+        meta = read_checkpoint_meta(path)
+        if meta is None:
+            return None
+        entry = GemaCheckpoint(
+            key=key,
+            path=str(path),
+            size=_directory_size(path),
+            created_on=meta.get("created_on", ""),
+            last_used=time.time(),
+            tick=meta.get("tick", 0),
+            insts=meta.get("insts", 0),
+        )
+        self._entries[key] = entry
+        return entry
+
+    def _evict(self) -> int:
+        """Delete least recently used entries until the size limit is met."""
+        if self.limit is None:
+            return 0
+        evicted = 0
+        total = sum(entry.size for entry in self._entries.values())
+        for entry in self.get_entries():
+            if total <= self.limit:
+                break
+            if entry.key in self._pins:
+                continue
+            total -= entry.size
+            self._remove(entry.key)
+            evicted += 1
+        return evicted
+
+    def _remove(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        shutil.rmtree(entry.path, ignore_errors=True)
+
+    def _scan(self) -> None:
+        """Load the entries left in the cache directory by earlier runs."""
+        for path in self.directory.iterdir():
+            if path.name.endswith(".tmp"):
+                # Left behind by a simulation that died while checkpointing
+                shutil.rmtree(path, ignore_errors=True)
+            elif path.is_dir():
+                entry = self._add(path.name)
+                if entry is not None:
+                    entry.last_used = path.stat().st_mtime
+        self._evict()
+
+
+def _directory_size(path: Path) -> int:
+    """Return the total size in bytes of the files below a directory."""
+    total = 0
+    for directory, _, files in os.walk(path):
+        for name in files:
+            try:
+                total += os.stat(os.path.join(directory, name)).st_size
+            except OSError:
+                pass
+    return total
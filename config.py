@@ -14,12 +14,16 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Optional
 
 if TYPE_CHECKING:
     from gem5.utils.gema import Gema
 
-from gem5.utils.gema.options import *
+import copy
+import threading
+
+from gem5.resources.resource import BinaryResource, obtain_resource
+from gem5.utils.gema.index import GemaConfigIndex
 from gem5.utils.gema.rpc_data import *
 
 
@@ -30,11 +34,62 @@ class GemaConfigGenerator:
     configurations through a high-level interface. It manages multiple configuration
     objects and provides methods to set various simulation parameters including board,
     processor, memory, and cache specifications.
+
+    Configurations are kept in a GemaConfigIndex, which provides constant-time
+    access by ID and indexed filtering on common fields. All access to the
+    store is serialized through an internal re-entrant lock so the generator
+    can be shared by concurrent RPC handlers.
+
+    Component names are resolved through the shared GemaComponentRegistry.
+    ``add_config`` and the ``set_*`` methods validate what they are given
+    against the registry and the gem5 constructor signatures, so problems are
+    rejected when a value is set rather than inside a simulation process.
     """
 
     def __init__(self, root: Gema):
         self.root = root
-        self.configs = []
+        # Kept on the generator so spawned children can build from it too
+        self.registry = root.registry
+        self.configs = GemaConfigIndex()
+        self._lock = threading.RLock()
+
+    def __getstate__(self) -> dict:
+        """Return the picklable state of the generator.
+
+        The generator is pickled into every spawned gem5 child, which only
+        uses it to build the gem5 objects of its own configuration. The stored
+        configurations are therefore left behind, and the lock, which cannot
+        cross the process boundary, is recreated in ``__setstate__``.
+        """
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["configs"] = GemaConfigIndex()
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def get_configs(
+        self, filters: Optional[dict] = None
+    ) -> list[GemaConfiguration]:
+        """Return a snapshot of the stored configurations.
+
+        Args:
+            filters (Optional[dict]): Mapping of indexed field names to required
+                values (e.g. ``{"board.type": "SimpleBoard"}``). See
+                GemaConfigIndex.INDEXED_FIELDS for the supported fields.
+
+        Returns:
+            list[GemaConfiguration]: The matching configurations in insertion order.
+
+        Raises:
+            ValueError: If a filter refers to a field that is not indexed.
+        """
+        with self._lock:
+            if filters:
+                return self.configs.filter(filters)
+            return list(self.configs)
 
     def add_config(
         self, config_id: int, d_data: Optional[dict] = None
@@ -51,18 +106,65 @@ class GemaConfigGenerator:
 
         Returns:
             bool: True if the configuration was successfully added, False if a configuration
-                 with the given ID already exists.
+                 with the given ID already exists or the data is invalid.
         """
-        if self._get_config_by_id(config_id) != None:
+        if d_data != None and self.root.retriever.check_config_data(d_data):
             return False
 
-        if d_data != None:
-            self.configs.append(
-                self._convert_dict_to_gema(config_id=config_id, data=d_data)
+        with self._lock:
+            if self._get_config_by_id(config_id) != None:
+                return False
+
+            if d_data != None:
+                config = self._convert_dict_to_gema(
+                    config_id=config_id, data=d_data
+                )
+            else:
+                config = GemaConfiguration(config_id=config_id)
+            self.configs.add(config)
+            self.root.state.save_configs([config])
+            return True
+
+    def add_configs(self, d_datas: list[dict]) -> list[int]:
+        """Create several configurations at once under newly allocated IDs.
+
+        The IDs are allocated above the highest ID stored so far, and all
+        configurations are inserted while holding the lock once, so concurrent
+        callers can never observe or claim a partially created batch. The data
+        is expected to have been validated by the caller.
+
+        Args:
+            d_datas (list[dict]): One configuration dictionary per configuration,
+                                in the format accepted by ``add_config``.
+
+        Returns:
+            list[int]: The IDs of the new configurations, in the order given.
+        """
+        with self._lock:
+            first_id = self.configs.last_id + 1
+            new_configs = [
+                self._convert_dict_to_gema(config_id=first_id + i, data=data)
+                for i, data in enumerate(d_datas)
+            ]
+            for config in new_configs:
+                self.configs.add(config)
+            self.root.state.save_configs(new_configs)
+            return [config.config_id for config in new_configs]
+
+    def restore(self, config_ids: list[int]) -> None:
+        """Register the configurations stored in the state store at startup.
+
+        They are loaded from the store when they are first used.
+
+        Args:
+            config_ids (list[int]): The IDs of the stored configurations, in
+                                  their original insertion order.
+        """
+        state = self.root.state
+        with self._lock:
+            self.configs.restore(
+                config_ids, state.load_configs, state.load_config_index
             )
-        else:
-            self.configs.append(GemaConfiguration(config_id=config_id))
-        return True
 
     def _convert_dict_to_gema(
         self, config_id: int, data: dict
@@ -75,7 +177,8 @@ class GemaConfigGenerator:
         Args:
             config_id (int): The unique identifier for the configuration.
             data (dict): Dictionary containing configuration parameters for all components
-                        (board, processor, memory, cache, and resource).
+                        (board, processor, memory, cache, budget, exit handlers
+                        and resource).
 
         Returns:
             GemaConfiguration: A fully populated configuration object with all specified
@@ -84,10 +187,13 @@ class GemaConfigGenerator:
         return GemaConfiguration(
             config_id=config_id,
             resource=data.get("resource", {}).get("name"),
+            resource_version=data.get("resource", {}).get("version"),
             board=GemaBoard(**data.get("board", {})),
             processor=GemaProcessor(**data.get("processor", {})),
             memory=GemaMemory(**data.get("memory", {})),
             cache=GemaCache(**data.get("cache", {})),
+            budget=GemaBudget(**data.get("budget", {})),
+            exit_handlers=GemaExitHandlers(**data.get("exit_handlers", {})),
         )
 
     def delete_config(self, config_id: int) -> bool:
@@ -100,17 +206,15 @@ class GemaConfigGenerator:
             bool: True if the configuration was found and deleted, False if no configuration
                  with the given ID exists.
         """
-        config = self._get_config_by_id(config_id)
-
-        if config is None:
-            return False
-
-        self.configs = [
-            cfg for cfg in self.configs if cfg.config_id != config_id
-        ]
-        return True
-
-    def set_board(self, config_id: int, type: str, clk: float) -> bool:
+        with self._lock:
+            if self.configs.remove(config_id) is None:
+                return False
+            self.root.state.delete_config(config_id)
+            return True
+
+    def set_board(
+        self, config_id: int, type: str, clk: float
+    ) -> Optional[list[dict]]:
         """Configure the board settings for a specific configuration.
 
         Args:
@@ -119,42 +223,58 @@ class GemaConfigGenerator:
             clk (float): The clock frequency in GHz.
 
         Returns:
-            bool: True if the board settings were successfully updated, False if the
-                 configuration doesn't exist or if the clock frequency is invalid (≤ 0).
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
         """
-        config = self._get_config_by_id(config_id)
-        if config is None or clk <= 0:
-            return False
-
-        config.board = GemaBoard(type=type, clk=clk)
-        return True
+        return self._set_component(
+            config_id, "board", GemaBoard(type=type, clk=clk)
+        )
 
     def set_processor(
-        self, config_id: int, isa: str, type: str, cpu: str, ncores: int
-    ) -> bool:
+        self,
+        config_id: int,
+        isa: str,
+        type: str,
+        cpu: str,
+        ncores: int,
+        switch_after_insts: Optional[int] = None,
+        switch_on: Optional[str] = None,
+    ) -> Optional[list[dict]]:
         """Configure the processor settings for a specific configuration.
 
         Args:
             config_id (int): The unique identifier of the configuration to modify.
             isa (str): The instruction set architecture (e.g., 'X86', 'ARM').
             type (str): The type of processor (e.g., 'SimpleProcessor').
-            cpu (str): The CPU model to use.
+            cpu (str): The CPU model to use. Switchable processors start on the
+                      atomic CPU and switch to this one.
             ncores (int): The number of CPU cores.
+            switch_after_insts (Optional[int]): Switchable processors only:
+                      switch after this many instructions per core.
+            switch_on (Optional[str]): Switchable processors only: switch at
+                      this exit event, e.g. 'workbegin'.
 
         Returns:
-            bool: True if the processor settings were successfully updated, False if the
-                 configuration doesn't exist or if the number of cores is invalid (≤ 0).
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
         """
-        config = self._get_config_by_id(config_id)
-        if config is None or ncores <= 0:
-            return False
-
-        config.processor = GemaProcessor(
-            isa=isa, type=type, cpu=cpu, ncores=ncores
+        processor = GemaProcessor(
+            isa=isa,
+            type=type,
+            cpu=cpu,
+            ncores=ncores,
+            switch_after_insts=switch_after_insts,
+            switch_on=switch_on,
         )
-        return True
+        return self._set_component(config_id, "processor", processor)
 
-    def set_memory(self, config_id: int, type: str, size: int) -> bool:
+    def set_memory(
+        self, config_id: int, type: str, size: int
+    ) -> Optional[list[dict]]:
         """Configure the memory settings for a specific configuration.
 
         Args:
@@ -163,15 +283,14 @@ class GemaConfigGenerator:
             size (int): The size of memory in MB.
 
         Returns:
-            bool: True if the memory settings were successfully updated, False if the
-                 configuration doesn't exist or if the memory size is invalid (≤ 0).
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
         """
-        config = self._get_config_by_id(config_id)
-        if config is None or size <= 0:
-            return False
-
-        config.memory = GemaMemory(type=type, size=size)
-        return True
+        return self._set_component(
+            config_id, "memory", GemaMemory(type=type, size=size)
+        )
 
     def set_cache(
         self,
@@ -183,7 +302,7 @@ class GemaConfigGenerator:
         l1d_assoc: Optional[int] = None,
         l1i_assoc: Optional[int] = None,
         l2_assoc: Optional[int] = None,
-    ) -> bool:
+    ) -> Optional[list[dict]]:
         """Configure the cache hierarchy for a specific configuration.
 
         This method sets up the cache hierarchy with the specified parameters. It supports
@@ -201,14 +320,12 @@ class GemaConfigGenerator:
             l2_assoc (Optional[int]): The associativity of the L2 cache, if applicable.
 
         Returns:
-            bool: True if the cache settings were successfully updated, False if the
-                 configuration doesn't exist or if the cache sizes are invalid (≤ 0).
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
         """
-        config = self._get_config_by_id(config_id)
-        if config is None:
-            return False
-
-        config.cache = GemaCache(
+        cache = GemaCache(
             type=type,
             l1d_size=l1d_size,
             l1i_size=l1i_size,
@@ -217,27 +334,97 @@ class GemaConfigGenerator:
             l1i_assoc=l1i_assoc,
             l2_assoc=l2_assoc,
         )
-        return True
+        return self._set_component(config_id, "cache", cache)
 
-    def set_resource(self, config_id: int, resource: str) -> bool:
+    def set_resource(
+        self, config_id: int, resource: str, version: Optional[str] = None
+    ) -> Optional[list[dict]]:
         """Set the simulation resource (workload) for a specific configuration.
 
         Args:
             config_id (int): The unique identifier of the configuration to modify.
             resource (str): The name of the resource/workload to use.
+            version (Optional[str]): The resource version to use. If None, the
+                                   latest compatible version is obtained.
 
         Returns:
-            bool: True if the resource was successfully set, False if the configuration
-                 doesn't exist.
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
         """
-        config = self._get_config_by_id(config_id)
-        if config == None:
-            return False
+        problems = self._check("resource", {"name": resource, "version": version})
+        if problems:
+            return problems
+        with self._lock:
+            config = self._get_config_by_id(config_id)
+            if config is None:
+                return None
+
+            config.resource = resource
+            config.resource_version = version
+            self.root.state.save_configs([config])
+            # Fetched now, so simulations of the configuration find it ready
+            self.root.resources.prefetch(resource, version)
+            return []
+
+    def set_budget(
+        self,
+        config_id: int,
+        max_ticks: Optional[int] = None,
+        max_insts: Optional[int] = None,
+        timeout: Optional[float] = None,
+    ) -> Optional[list[dict]]:
+        """Limit how long simulations of a specific configuration may run.
 
-        config.resource = resource
-        return True
+        Args:
+            config_id (int): The unique identifier of the configuration to modify.
+            max_ticks (Optional[int]): Stop the simulation after this many ticks.
+            max_insts (Optional[int]): Stop the simulation once any core has
+                                     committed this many instructions.
+            timeout (Optional[float]): Terminate the simulation after this many
+                                     wall-clock seconds.
+
+        Returns:
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
+        """
+        budget = GemaBudget(
+            max_ticks=max_ticks, max_insts=max_insts, timeout=timeout
+        )
+        return self._set_component(config_id, "budget", budget)
+
+    def set_exit_handlers(
+        self,
+        config_id: int,
+        workbegin: Optional[list[str]] = None,
+        workend: Optional[list[str]] = None,
+        m5_exit: Optional[list[str]] = None,
+    ) -> Optional[list[dict]]:
+        """Set the actions taken when simulations of a configuration hit exit events.
+
+        Args:
+            config_id (int): The unique identifier of the configuration to modify.
+            workbegin (Optional[list[str]]): Actions on a workbegin event.
+            workend (Optional[list[str]]): Actions on a workend event.
+            m5_exit (Optional[list[str]]): Actions on an m5 exit event.
+
+        Returns:
+            Optional[list[dict]]: The problems found (see
+                 GemaOptionRetreiver.check_component), empty if the settings were
+                 applied, or None if the configuration doesn't exist. Nothing is
+                 changed if there are problems.
+        """
+        handlers = GemaExitHandlers(
+            workbegin=workbegin, workend=workend, m5_exit=m5_exit
+        )
+        return self._set_component(config_id, "exit_handlers", handlers)
 
-    def generate_gem5_config(self, gema_obj: GemaConfiguration):
+    def generate_gem5_config(
+        self, gema_obj: GemaConfiguration, resource_path: Optional[str] = None
+    ):
         """Generate a complete gem5 configuration from a GemaConfiguration object.
 
         This method creates a fully specified gem5 configuration by combining all the
@@ -247,6 +434,9 @@ class GemaConfigGenerator:
         Args:
             gema_obj (GemaConfiguration): A complete GemaConfiguration object containing
                                         all necessary simulation parameters.
+            resource_path (Optional[str]): Local path of the resource, already
+                                         resolved by GemaResourceCache. The
+                                         resource is obtained here if None.
 
         Returns:
             The complete gem5 configuration object if successful, None if any validation
@@ -289,13 +479,13 @@ class GemaConfigGenerator:
                 )
 
             # Extract and format configuration fields
-            brd = eval(gema_obj.board.type)
+            brd = self.registry.get("board", gema_obj.board.type)
             clk = f"{gema_obj.board.clk}GHz"
-            proc = eval(gema_obj.processor.type)
-            cpu_type = CPUTypes[gema_obj.processor.cpu.upper()]
-            isa = ISA[gema_obj.processor.isa.upper()]
+            proc = self.registry.get("processor", gema_obj.processor.type)
+            cpu_type = self.registry.get("cpu", gema_obj.processor.cpu)
+            isa = self.registry.get("isa", gema_obj.processor.isa)
             ncores = gema_obj.processor.ncores
-            mem_type = eval(gema_obj.memory.type)
+            mem_type = self.registry.get("memory", gema_obj.memory.type)
             msize = f"{gema_obj.memory.size}MB"
             cache = self.get_cache_configuration(gema_obj.cache)
 
@@ -305,16 +495,36 @@ class GemaConfigGenerator:
                     "Cache configuration is invalid or incomplete"
                 )
 
+            # Switchable processors fast-forward before switching to cpu_type
+            if gema_obj.processor.type in self.registry.switchable_processors:
+                processor = proc(
+                    starting_core_type=self.registry.SWITCH_FROM_CPU,
+                    switch_core_type=cpu_type,
+                    isa=isa,
+                    num_cores=ncores,
+                )
+            else:
+                processor = proc(cpu_type=cpu_type, isa=isa, num_cores=ncores)
+
             # Create and return the gem5 configuration
             configuration = brd(
                 clk_freq=clk,
-                processor=proc(cpu_type=cpu_type, isa=isa, num_cores=ncores),
+                processor=processor,
                 memory=mem_type(size=msize),
                 cache_hierarchy=cache,
             )
-            configuration.set_se_binary_workload(
-                obtain_resource(gema_obj.resource)
-            )
+            if resource_path is not None:
+                workload = BinaryResource(
+                    local_path=resource_path,
+                    id=gema_obj.resource,
+                    resource_version=gema_obj.resource_version,
+                )
+            else:
+                workload = obtain_resource(
+                    gema_obj.resource,
+                    resource_version=gema_obj.resource_version,
+                )
+            configuration.set_se_binary_workload(workload)
 
             return configuration
 
@@ -338,7 +548,7 @@ class GemaConfigGenerator:
             invalid or an error occurs during creation.
         """
         try:
-            cache_class = globals()[cache_config.type]
+            cache_class = self.registry.get("cache", cache_config.type)
             init_params = {
                 "l1d_size": (
                     f"{cache_config.l1d_size}KiB"
@@ -370,6 +580,40 @@ class GemaConfigGenerator:
         except (KeyError, ValueError, TypeError):
             return None
 
+    def _check(self, name: str, component) -> list[dict]:
+        """Return the problems of a component about to be set."""
+        return self.root.retriever.check_component(name, component)
+
+    def _set_component(
+        self, config_id: int, name: str, component
+    ) -> Optional[list[dict]]:
+        """Check a component and set it on a configuration if it is valid.
+
+        The component is checked before taking the lock, since checks may
+        inspect gem5 constructors.
+
+        Args:
+            config_id (int): The unique identifier of the configuration to modify.
+            name (str): The attribute of the component, e.g. "board".
+            component: The new component.
+
+        Returns:
+            Optional[list[dict]]: The problems found, empty if the component was
+                                set, or None if the configuration doesn't exist.
+        """
+        problems = self._check(name, component)
+        if problems:
+            return problems
+        with self._lock:
+            config = self._get_config_by_id(config_id)
+            if config is None:
+                return None
+
+            setattr(config, name, component)
+            self.configs.reindex(config)
+            self.root.state.save_configs([config])
+            return []
+
     def _get_config_by_id(self, config_id: int) -> Optional[GemaConfiguration]:
         """Retrieve a configuration object by its ID.
 
@@ -379,7 +623,23 @@ class GemaConfigGenerator:
         Returns:
             Optional[GemaConfiguration]: The configuration object if found, None otherwise.
         """
-        for cfg in self.configs:
-            if cfg.config_id == config_id:
-                return cfg
-        return None
+        with self._lock:
+            return self.configs.get(config_id)
+
+    def snapshot_config(self, config_id: int) -> Optional[GemaConfiguration]:
+        """Return an independent copy of a configuration.
+
+        Simulations keep a snapshot of the configuration they were started
+        with, so later ``set_*`` calls on the same ID do not rewrite the record
+        of a simulation that is already queued or running.
+
+        Args:
+            config_id (int): The unique identifier of the configuration to copy.
+
+        Returns:
+            Optional[GemaConfiguration]: A deep copy of the configuration if found,
+                                       None otherwise.
+        """
+        with self._lock:
+            config = self._get_config_by_id(config_id)
+            return copy.deepcopy(config) if config is not None else None
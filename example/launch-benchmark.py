@@ -0,0 +1,122 @@
+# ----------------------------------------------------------------------------
+# File: <launch-benchmark>.py
+#
+# Description:
+# <Measures the launch latency of simulations with and without warm workers>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import argparse
+import json
+import re
+import statistics
+import time
+from xmlrpc.client import ServerProxy
+
+# The speedup of warm workers has not been measured on a real gem5 build yet.
+# It was only exercised against a stand-in for the gem5 child, whose import
+# cost says nothing about gem5's, so no expected numbers are given here.
+
+
+def create_config(gema_server: ServerProxy, config_id: int) -> bool:
+    """Creates an empty configuration, unless the ID is already taken."""
+    response = json.loads(gema_server.add_config(config_id))
+    return "successfully created" in response
+
+
+def configure(gema_server: ServerProxy, config_id: int, args):
+    """Sets up a small configuration whose simulations end almost at once."""
+    gema_server.set_board(config_id, "SimpleBoard", 3.5)
+    gema_server.set_processor(config_id, "x86", "SimpleProcessor", "atomic", 1)
+    gema_server.set_memory(config_id, "SingleChannelDDR3_1600", 1024)
+    gema_server.set_cache(
+        config_id, "PrivateL1PrivateL2CacheHierarchy", 64, 64, 256
+    )
+    gema_server.set_resource(config_id, args.resource)
+    gema_server.set_budget(config_id, args.max_ticks)
+
+
+def wait_for_idle_workers(gema_server: ServerProxy, count: int):
+    """Waits until the pool holds the requested number of idle workers."""
+    while True:
+        status = json.loads(gema_server.get_queue_status())
+        if status["idle_workers"] == count and not status["running"]:
+            return
+        time.sleep(0.1)
+
+
+def run_once(gema_server: ServerProxy, config_id: int) -> float:
+    """Runs one simulation and returns the seconds until it has exited."""
+    start = time.perf_counter()
+    response = json.loads(gema_server.run_simulation(config_id, True))
+    match = re.search(r"simulation (\d+)", response)
+    if match is None:
+        raise RuntimeError(response)
+    sim_id = int(match.group(1))
+    while True:
+        status = json.loads(gema_server.get_queue_status())
+        if sim_id not in status["running"] and sim_id not in status["queued"]:
+            return time.perf_counter() - start
+        time.sleep(0.01)
+
+
+def benchmark(gema_server: ServerProxy, config_id: int, warm: int, runs: int):
+    """Runs simulations one after another with ``warm`` warm workers."""
+    print(json.loads(gema_server.set_warm_workers(warm)))
+    wait_for_idle_workers(gema_server, warm)
+    latencies = []
+    for _ in range(runs):
+        latencies.append(run_once(gema_server, config_id))
+        # Measure every run against a full pool
+        wait_for_idle_workers(gema_server, warm)
+    print(
+        f"warm_workers={warm}: mean {statistics.mean(latencies):.2f}s, "
+        f"median {statistics.median(latencies):.2f}s, "
+        f"min {min(latencies):.2f}s, max {max(latencies):.2f}s "
+        f"over {runs} run(s)"
+    )
+
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare the end-to-end latency of short simulations "
+        "launched in fresh gem5 processes and on warm workers."
+    )
+    parser.add_argument("--port", type=int, default=8000)
+    parser.add_argument("--runs", type=int, default=10)
+    parser.add_argument("--warm", type=int, default=2)
+    parser.add_argument("--config_id", type=int, default=900)
+    parser.add_argument("--resource", default="x86-hello64-static")
+    parser.add_argument(
+        "--max_ticks",
+        type=int,
+        default=10**9,
+        help="Tick budget of every simulation, keep it small",
+    )
+    args = parser.parse_args()
+
+    server = ServerProxy(f"http://localhost:{args.port}")
+    previous = json.loads(server.get_queue_status())["warm_workers"]
+    # Never touch a configuration the script did not create
+    if not create_config(server, args.config_id):
+        parser.error(
+            f"Config {args.config_id} already exists; pick a free ID with "
+            "--config_id."
+        )
+    try:
+        configure(server, args.config_id, args)
+        for warm in (0, args.warm):
+            benchmark(server, args.config_id, warm, args.runs)
+    finally:
+        server.set_warm_workers(previous)
+        server.delete_config(args.config_id)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,252 @@
+# ----------------------------------------------------------------------------
+# File: <exits>.py
+#
+# Description:
+# <Configurable exit event handlers and CPU switches of gem5 simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from dataclasses import fields
+from pathlib import Path
+from typing import Optional
+
+from gem5.utils.gema.checkpoints import save_checkpoint
+from gem5.utils.gema.rpc_data import GemaConfiguration, GemaExitHandlers
+
+# GemaExitHandlers field -> name of the gem5 ExitEvent it handles
+EXIT_EVENTS = {
+    "workbegin": "WORKBEGIN",
+    "workend": "WORKEND",
+    "m5_exit": "EXIT",
+}
+# Actions a handler may take, run in the order they are given
+EXIT_ACTIONS = ("reset_stats", "dump_stats", "stop")
+# Exit events a switchable processor may switch CPUs at
+SWITCH_EVENTS = ("workbegin", "workend")
+# What the gem5 Simulator does at these events when nothing else is configured
+DEFAULT_ACTIONS = {"workbegin": ["reset_stats"], "workend": ["dump_stats"]}
+
+
+class GemaExitEventDispatcher:
+    """Runs the exit handlers and CPU switches of a configuration in the gem5 child.
+
+    Each configured event gets an exit event generator that runs its actions
+    in order every time the event fires. The simulation stops if the actions
+    include "stop" and continues otherwise. Events without configured actions
+    keep the default behaviour of the gem5 Simulator.
+
+    Switchable processors are switched to the detailed CPU at their
+    ``switch_on`` event or after ``switch_after_insts`` instructions,
+    whichever comes first. The instruction budget then only starts counting
+    on the detailed cores, so the dispatcher also owns the instruction stops:
+    before the switch at most the switch point is scheduled, and the rest of
+    the budget once the CPUs have been switched. A switch event without
+    configured actions keeps its DEFAULT_ACTIONS, run after the switch, so
+    the stats of the region of interest are still reset at workbegin.
+
+    Given a checkpoint cache entry, the dispatcher takes a checkpoint into it
+    right before switching. A simulation restored from such a checkpoint
+    switches as soon as it starts.
+
+    Attributes:
+        handlers (GemaExitHandlers): The configured handlers.
+        switched (bool): Whether the processor has switched CPUs.
+        stopped_by (Optional[str]): The event whose handler stopped the
+            simulation, e.g. "workend", or None.
+    """
+
+    def __init__(
+        self,
+        config: GemaConfiguration,
+        board,
+        checkpoint: Optional[Path] = None,
+    ) -> None:
+        """Prepare the handlers of a configuration.
+
+        Args:
+            config (GemaConfiguration): The configuration being simulated.
+            board: The gem5 board built from it.
+            checkpoint (Optional[Path]): Checkpoint cache entry to take a
+                checkpoint into before switching CPUs.
+        """
+        self.handlers = config.exit_handlers
+        self.board = board
+        self.max_insts = config.budget.max_insts
+        self.switch_after_insts = config.processor.switch_after_insts
+        self.switch_on = config.processor.switch_on
+        self.checkpoint = checkpoint
+        self.switched = False
+        self.stopped_by: Optional[str] = None
+        self._simulator = None
+        # Instructions the leading core committed before the switch
+        self._switched_at = 0
+
+    def on_exit_event(self) -> dict:
+        """Build the ``on_exit_event`` entries of the configured handlers.
+
+        Returns:
+            dict: ExitEvent -> generator, for every event with actions or a
+                 CPU switch.
+        """
+        from gem5.simulate.exit_event import ExitEvent
+
+        events = {
+            f.name: getattr(self.handlers, f.name)
+            for f in fields(self.handlers)
+            if getattr(self.handlers, f.name) is not None
+        }
+        if self.switch_on is not None:
+            events.setdefault(
+                self.switch_on, list(DEFAULT_ACTIONS[self.switch_on])
+            )
+
+        generators = {
+            getattr(ExitEvent, EXIT_EVENTS[event]): self._handle(event, actions)
+            for event, actions in events.items()
+        }
+        if self.switch_after_insts is not None:
+            generators[ExitEvent.MAX_INSTS] = self._on_max_insts()
+        return generators
+
+    def schedule(self, simulator, restored: Optional[dict] = None) -> None:
+        """Schedule the first instruction stop. Call once the board is instantiated.
+
+        Args:
+            simulator: The instantiated gem5 Simulator.
+            restored (Optional[dict]): The metadata of the warm-up checkpoint
+                the simulation was restored from. The CPUs are switched
+                right away.
+        """
+        self._simulator = simulator
+        if restored is not None:
+            self._switch(insts=restored["insts"])
+            return
+        first = self.switch_after_insts or self.max_insts
+        if first:
+            simulator.schedule_max_insts(first)
+
+    def _handle(self, event: str, actions: list[str]):
+        """Exit event generator running ``actions`` whenever ``event`` fires.
+
+        Yields:
+            bool: True to stop the simulation, False to continue.
+        """
+        import m5
+
+        stop = "stop" in actions
+        while True:
+            if event == self.switch_on:
+                self._switch()
+            for action in actions:
+                if action == "reset_stats":
+                    m5.stats.reset()
+                elif action == "dump_stats":
+                    m5.stats.dump()
+            if stop:
+                self.stopped_by = event
+            yield stop
+
+    def _on_max_insts(self):
+        """Exit event generator for ExitEvent.MAX_INSTS when switching CPUs.
+
+        The first stop is the switch point. Later ones end the simulation
+        once the instruction budget is used up, and are ignored otherwise,
+        e.g. when the CPUs were already switched at an exit event.
+
+        Yields:
+            bool: True to stop the simulation, False to continue.
+        """
+        while True:
+            if not self.switched:
+                self._switch()
+                yield False
+            elif (
+                self.max_insts is not None
+                and self._switched_at + self._leading_insts() >= self.max_insts
+            ):
+                yield True
+            else:
+                yield False
+
+    def _switch(self, insts: Optional[int] = None) -> None:
+        """Switch to the detailed CPU, once, and schedule the remaining budget.
+
+        Args:
+            insts (Optional[int]): Instructions the leading core committed
+                before the switch, if it cannot be read from the cores.
+        """
+        if self.switched:
+            return
+        if insts is None:
+            insts = self._leading_insts()
+            if self.checkpoint is not None:
+                save_checkpoint(
+                    self._simulator,
+                    self.checkpoint,
+                    self._simulator.get_current_tick(),
+                    insts,
+                )
+        self._switched_at = insts
+        self.board.get_processor().switch()
+        self.switched = True
+        if self.max_insts is not None:
+            self._simulator.schedule_max_insts(
+                max(self.max_insts - self._switched_at, 1)
+            )
+
+    def _leading_insts(self) -> int:
+        """Return the instructions committed by the leading current core."""
+        return max(
+            (
+                core.get_simobject().totalInsts()
+                for core in self.board.get_processor().get_cores()
+            ),
+            default=0,
+        )
+
+
+def check_exit_handlers(handlers: GemaExitHandlers) -> list[dict]:
+    """Check the actions of every configured exit event.
+
+    Args:
+        handlers (GemaExitHandlers): The handlers to check.
+
+    Returns:
+        list[dict]: One ``{"field", "message"}`` entry per problem found.
+    """
+    problems = []
+    for f in fields(handlers):
+        actions = getattr(handlers, f.name)
+        if actions is None:
+            continue
+        field = f"exit_handlers.{f.name}"
+        if not isinstance(actions, list) or not all(
+            isinstance(action, str) for action in actions
+        ):
+            problems.append(
+                {"field": field, "message": "Actions must be a list of strings."}
+            )
+            continue
+        for action in actions:
+            if action not in EXIT_ACTIONS:
+                known = ", ".join(EXIT_ACTIONS)
+                problems.append(
+                    {
+                        "field": field,
+                        "message": f"Unknown action '{action}'. Known: {known}.",
+                    }
+                )
+        # Once the workload has exited there is nothing left to simulate
+        if f.name == "m5_exit" and "stop" not in actions:
+            problems.append(
+                {"field": field, "message": "m5_exit actions must include stop."}
+            )
+    return problems
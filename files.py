@@ -0,0 +1,275 @@
+# ----------------------------------------------------------------------------
+# File: <files>.py
+#
+# Description:
+# <Serves the output files of gem5 simulations by byte range>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional, Union
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import base64
+import mmap
+import os
+from datetime import datetime
+from pathlib import Path
+
+from gem5.utils.gema.archive import (
+    ARCHIVE_SUFFIX,
+    ArchivedFile,
+    open_archived,
+    read_archive_index,
+)
+
+# URL prefix of the HTTP download of output files, followed by
+# <sim_id>/<path within the output directory>
+DOWNLOAD_PREFIX = "/files/"
+
+ENCODINGS = ("text", "base64")
+
+
+class GemaOutputFiles:
+    """Gives access to the files in the output directories of simulations.
+
+    Files are read in chunks, through a memory map of the requested range
+    only, so even traces of several gigabytes are never loaded as a whole.
+    Clients page through a file over RPC with ``read``, or download any
+    byte range of it over plain HTTP from the RPC port, where the file is
+    sent with ``sendfile`` (see ``rpc.RequestHandler``).
+
+    Files compacted by the archiver are served under their original path,
+    decompressing only the blocks that hold the requested range.
+
+    Paths are always relative to the output directory of the simulation
+    and may not leave it, including through symbolic links.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+    """
+
+    # Most bytes returned by one read
+    MAX_CHUNK = 4 * 1024 * 1024
+
+    def __init__(self, root: Gema) -> None:
+        self.root = root
+
+    def resolve(self, sim_id: int, path: str) -> Union[Path, ArchivedFile]:
+        """Return a file in a simulation's output.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+            path (str): The path of the file relative to the output directory.
+
+        Returns:
+            Union[Path, ArchivedFile]: The absolute path of the file, or the
+                compacted file if the archiver compressed it.
+
+        Raises:
+            ValueError: If the simulation does not exist, or the path is
+                outside the output directory or not a regular file.
+        """
+        directory = self._directory(sim_id)
+        target = (directory / path).resolve()
+        try:
+            target.relative_to(directory)
+        except ValueError:
+            raise ValueError(
+                f"'{path}' is outside the output of simulation {sim_id}."
+            )
+        if target.is_file():
+            return target
+        archived = open_archived(
+            directory, target.relative_to(directory).as_posix()
+        )
+        if archived is None:
+            raise ValueError(
+                f"Simulation {sim_id} has no output file '{path}'."
+            )
+        return archived
+
+    def list_files(self, sim_id: int) -> list[dict]:
+        """List the files in the output directory of a simulation.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+
+        Returns:
+            list[dict]: The ``path`` relative to the output directory, the
+                       ``size`` in bytes and the ``modified`` time of every
+                       file, with the ``url`` to download it from and
+                       whether it is ``archived``. Compacted files are listed
+                       under their original path and size.
+
+        Raises:
+            ValueError: If the simulation does not exist.
+        """
+        directory = self._directory(sim_id)
+        archived = read_archive_index(directory)
+        files = []
+        for parent, dirs, names in os.walk(directory):
+            dirs.sort()
+            for name in sorted(names):
+                path = Path(parent) / name
+                try:
+                    stat = path.stat()
+                    # Links leading out of the directory cannot be read either
+                    path.resolve().relative_to(directory)
+                except (OSError, ValueError):
+                    continue
+                relative = path.relative_to(directory).as_posix()
+                size, mtime = stat.st_size, stat.st_mtime
+                original = relative[: -len(ARCHIVE_SUFFIX)]
+                entry = None
+                if relative.endswith(ARCHIVE_SUFFIX):
+                    entry = archived.get(original)
+                if entry is not None:
+                    relative, size, mtime = original, entry["size"], entry["mtime"]
+                files.append(
+                    {
+                        "path": relative,
+                        "size": size,
+                        "modified": datetime.fromtimestamp(mtime).strftime(
+                            "%Y-%m-%d %H:%M:%S"
+                        ),
+                        "url": f"{DOWNLOAD_PREFIX}{sim_id}/{relative}",
+                        "archived": entry is not None,
+                    }
+                )
+        return files
+
+    def read(
+        self,
+        sim_id: int,
+        path: str,
+        offset: int = 0,
+        length: int = 65536,
+        encoding: str = "text",
+    ) -> dict:
+        """Read a byte range of an output file.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+            path (str): The path of the file relative to the output directory.
+            offset (int): Position to read from. Negative values count from
+                the end of the file.
+            length (int): Most bytes to return, capped at MAX_CHUNK.
+            encoding (str): "text" to decode the data as UTF-8, replacing
+                invalid bytes, or "base64" for binary files.
+
+        Returns:
+            dict: The ``data`` read with its ``offset``, the ``next_offset``
+                 to continue from, the current ``size`` of the file and
+                 whether the end of the file was reached.
+
+        Raises:
+            ValueError: If the file cannot be served, or the offset or
+                encoding is invalid.
+        """
+        if encoding not in ENCODINGS:
+            raise ValueError(
+                f"Unknown encoding '{encoding}'. Known: {', '.join(ENCODINGS)}."
+            )
+        target = self.resolve(sim_id, path)
+        length = max(0, min(length, self.MAX_CHUNK))
+
+        if isinstance(target, ArchivedFile):
+            size = target.size
+            offset = _check_offset(offset, size, path)
+            data = target.read(offset, length)
+        else:
+            with open(target, "rb") as f:
+                size = os.fstat(f.fileno()).st_size
+                offset = _check_offset(offset, size, path)
+                data = _read_range(f, offset, min(length, size - offset))
+
+        if encoding == "base64":
+            data = base64.b64encode(data).decode("ascii")
+        else:
+            data = data.decode(errors="replace")
+        next_offset = offset + min(length, size - offset)
+        return {
+            "sim_id": sim_id,
+            "path": path,
+            "offset": offset,
+            "next_offset": next_offset,
+            "size": size,
+            "eof": next_offset >= size,
+            "encoding": encoding,
+            "data": data,
+        }
+
+    def _directory(self, sim_id: int) -> Path:
+        sim = self.root.manager.get_sim(sim_id)
+        if sim is None:
+            raise ValueError(f"Simulation {sim_id} does not exist.")
+        return Path(sim.path).resolve()
+
+
+def parse_range(header: Optional[str], size: int) -> Optional[tuple[int, int]]:
+    """Parse an HTTP Range header into the byte range it selects.
+
+    Only single ranges are supported; anything else selects the whole file,
+    which RFC 9110 allows a server to do.
+
+    Args:
+        header (Optional[str]): The value of the Range header.
+        size (int): The size of the file.
+
+    Returns:
+        Optional[tuple[int, int]]: The first and last byte, inclusive.
+            ``(0, size - 1)`` for the whole file, or None if the range cannot
+            be satisfied.
+    """
+    whole = (0, size - 1)
+    if not header or not header.startswith("bytes=") or "," in header:
+        return whole
+    first, sep, last = header[len("bytes=") :].strip().partition("-")
+    # Either bound may be missing, but not both, and neither may be malformed
+    if not sep or not (first + last).isdigit():
+        return whole
+    if not first:
+        # A suffix range, the last bytes of the file
+        start, end = max(size - int(last), 0), size - 1
+    else:
+        start = int(first)
+        end = min(int(last), size - 1) if last else size - 1
+    if start >= size or start > end:
+        return None
+    return start, end
+
+
+def _check_offset(offset: int, size: int, path: str) -> int:
+    """Resolve a negative offset from the end of a file and bound it."""
+    if offset < 0:
+        offset = max(size + offset, 0)
+    if offset > size:
+        raise ValueError(
+            f"Offset {offset} is beyond the end of '{path}' ({size} bytes)."
+        )
+    return offset
+
+
+def _read_range(f, offset: int, length: int) -> bytes:
+    """Read a byte range of a file through a memory map of that range."""
+    if length <= 0:
+        return b""
+    # Maps must start at a multiple of the allocation granularity
+    start = offset - offset % mmap.ALLOCATIONGRANULARITY
+    with mmap.mmap(
+        f.fileno(),
+        offset - start + length,
+        access=mmap.ACCESS_READ,
+        offset=start,
+    ) as m:
+        return m[offset - start :]
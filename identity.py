@@ -0,0 +1,183 @@
+# ----------------------------------------------------------------------------
+# File: <identity>.py
+#
+# Description:
+# <Content hashing of configurations and gem5 build identification>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import functools
+import hashlib
+import json
+import sys
+from dataclasses import asdict
+from pathlib import Path
+from typing import Optional
+
+from gem5.utils.gema.rpc_data import GemaConfiguration
+
+# Fields whose values gem5 treats case-insensitively
+_CASE_INSENSITIVE = {("processor", "isa"), ("processor", "cpu")}
+# Fields the fast-forward phase of a switchable processor depends on
+_WARMUP_FIELDS = {
+    "board": ("type", "clk"),
+    "processor": ("type", "isa", "ncores", "switch_after_insts", "switch_on"),
+    "memory": ("type", "size"),
+}
+
+
+def gem5_build_identity() -> str:
+    """Return a short identifier of the gem5 build serving this process.
+
+    The identifier combines the gem5 version and compile date with the path,
+    size and modification time of the gem5 executable, so it changes whenever
+    gem5 is rebuilt. Only the cheap ``stat`` of the executable is repeated on
+    each call; the rest is cached per executable state.
+
+    Returns:
+        str: A 16 character hexadecimal build identifier.
+    """
+    executable = Path(sys.executable or sys.argv[0])
+    try:
+        stat = executable.stat()
+        stamp = f"{stat.st_size}:{stat.st_mtime_ns}"
+    except OSError:
+        stamp = "unknown"
+    return _build_identity(str(executable), stamp)
+
+
+@functools.lru_cache(maxsize=4)
+def _build_identity(executable: str, stamp: str) -> str:
+    version = compile_date = "unknown"
+    try:
+        from _m5 import core
+
+        version = core.gem5Version
+        compile_date = core.compileDate
+    except (ImportError, AttributeError):
+        pass
+
+    identity = f"{version}|{compile_date}|{executable}|{stamp}"
+    return hashlib.sha256(identity.encode()).hexdigest()[:16]
+
+
+def config_content_hash(
+    config: GemaConfiguration,
+    build_id: Optional[str] = None,
+    resource_digest: Optional[str] = None,
+) -> Optional[str]:
+    """Compute a canonical content hash of a configuration.
+
+    Two configurations that describe the same simulation hash identically,
+    regardless of their ``config_id``. The hash also covers the resource
+    and the gem5 build, so results are never shared across builds. A
+    resource without a version changes with every upstream release, so it
+    is identified by the digest of the copy that is simulated instead.
+
+    Args:
+        config (GemaConfiguration): The configuration to hash.
+        build_id (Optional[str]): The gem5 build identity. Defaults to the
+                                build serving this process.
+        resource_digest (Optional[str]): The SHA-256 digest of the resource,
+                                       see ``GemaResourceCache.digest``.
+
+    Returns:
+        Optional[str]: The hexadecimal SHA-256 digest of the canonical
+                      configuration, or None if its resource has no version
+                      and no digest is given.
+    """
+    resource = _resource_identity(config, resource_digest)
+    if resource is None:
+        return None
+    data = asdict(config)
+    del data["config_id"]
+    for component, attr in _CASE_INSENSITIVE:
+        value = data[component].get(attr)
+        if isinstance(value, str):
+            data[component][attr] = value.lower()
+    data["resource"], data["resource_version"] = resource
+
+    payload = {
+        "config": _canonical(data),
+        "build": build_id or gem5_build_identity(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def warmup_content_hash(
+    config: GemaConfiguration,
+    build_id: Optional[str] = None,
+    resource_digest: Optional[str] = None,
+) -> Optional[str]:
+    """Compute a hash of the parts of a configuration its warm-up depends on.
+
+    Configurations with switchable processors fast-forward on the atomic CPU
+    until they switch. That phase does not depend on the detailed CPU or the
+    cache hierarchy, since gem5 writes dirty cache lines back to memory before
+    it takes a checkpoint, so configurations differing only in those share
+    the same warm-up.
+
+    Args:
+        config (GemaConfiguration): The configuration to hash.
+        build_id (Optional[str]): The gem5 build identity. Defaults to the
+                                build serving this process.
+        resource_digest (Optional[str]): The SHA-256 digest of the resource,
+                                       see ``config_content_hash``.
+
+    Returns:
+        Optional[str]: The hexadecimal SHA-256 digest of the warm-up fields,
+                      or None if the resource has no version and no digest
+                      is given.
+    """
+    resource = _resource_identity(config, resource_digest)
+    if resource is None:
+        return None
+    data = asdict(config)
+    warmup = {
+        component: {attr: data[component][attr] for attr in attrs}
+        for component, attrs in _WARMUP_FIELDS.items()
+    }
+    isa = warmup["processor"]["isa"]
+    if isinstance(isa, str):
+        warmup["processor"]["isa"] = isa.lower()
+    warmup["resource"] = resource
+
+    payload = {
+        "warmup": _canonical(warmup),
+        "build": build_id or gem5_build_identity(),
+    }
+    encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(encoded.encode()).hexdigest()
+
+
+def _resource_identity(
+    config: GemaConfiguration, digest: Optional[str]
+) -> Optional[list]:
+    """Return what identifies the resource of a configuration in its hashes.
+
+    A fixed version never changes, so it identifies the resource by itself.
+    Without a version, only the digest of the resolved copy does.
+    """
+    if config.resource is None or config.resource_version is not None:
+        return [config.resource, config.resource_version]
+    if digest is None:
+        return None
+    return [config.resource, f"sha256:{digest}"]
+
+
+def _canonical(value):
+    """Normalize values that compare equal but serialize differently (3 vs 3.0)."""
+    if isinstance(value, dict):
+        return {key: _canonical(item) for key, item in value.items()}
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
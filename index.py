@@ -0,0 +1,288 @@
+# ----------------------------------------------------------------------------
+# File: <index>.py
+#
+# Description:
+# <Indexed in-memory store for gEMA configurations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import (
+    Any,
+    Callable,
+    Iterable,
+    Iterator,
+    Optional,
+)
+
+from gem5.utils.gema.rpc_data import GemaConfiguration
+
+
+class GemaConfigIndex:
+    """An insertion-ordered store of configurations keyed by ``config_id``.
+
+    Lookup, insertion and deletion are O(1). A set of commonly filtered fields
+    is additionally indexed so that filtered queries only touch the matching
+    configurations instead of scanning the whole store.
+
+    Indexed fields are addressed with dotted names (``"board.type"``,
+    ``"processor.cpu"``, ...). String values are matched case-insensitively.
+
+    Configurations restored from the state store are only loaded from it
+    when they are first read, and the secondary indexes are only built for
+    them on the first filtered query, see ``restore``.
+
+    Note:
+        Configurations are mutable dataclasses. Whenever one of the indexed
+        fields of a stored configuration changes, ``reindex`` must be called
+        so the secondary indexes stay consistent.
+    """
+
+    INDEXED_FIELDS = (
+        "board.type",
+        "processor.isa",
+        "processor.cpu",
+        "memory.type",
+        "cache.type",
+    )
+
+    def __init__(self) -> None:
+        # None for restored configurations that have not been loaded yet
+        self._configs: dict[int, Optional[GemaConfiguration]] = {}
+        # Insertion sequence number per config, used to order filter results
+        self._seq: dict[int, int] = {}
+        self._next_seq = 0
+        self._last_id = 0
+        # Values each config is currently indexed under, per field
+        self._keys: dict[int, dict[str, Any]] = {}
+        # field -> value -> {config_id: None}
+        self._indexes: dict[str, dict[Any, dict[int, None]]] = {
+            name: {} for name in self.INDEXED_FIELDS
+        }
+        # Load restored configurations by ID, and their indexed values
+        self._load: Optional[Callable[[list[int]], dict]] = None
+        self._load_index: Optional[Callable[[], Iterable[tuple]]] = None
+
+    def __len__(self) -> int:
+        return len(self._configs)
+
+    def __iter__(self) -> Iterator[GemaConfiguration]:
+        return iter(self._resolve(list(self._configs)))
+
+    def __contains__(self, config_id: int) -> bool:
+        return config_id in self._configs
+
+    @property
+    def last_id(self) -> int:
+        """The highest config ID ever stored, or 0 if none has been stored."""
+        return self._last_id
+
+    def get(self, config_id: int) -> Optional[GemaConfiguration]:
+        """Return the configuration with the given ID, or None."""
+        config = self._configs.get(config_id)
+        if config is None and config_id in self._configs:
+            configs = self._resolve([config_id])
+            config = configs[0] if configs else None
+        return config
+
+    def add(self, config: GemaConfiguration) -> bool:
+        """Insert a configuration.
+
+        Args:
+            config (GemaConfiguration): The configuration to store.
+
+        Returns:
+            bool: True if the configuration was stored, False if a configuration
+                 with the same ID already exists.
+        """
+        if config.config_id in self._configs:
+            return False
+
+        self._configs[config.config_id] = config
+        self._seq[config.config_id] = self._next_seq
+        self._next_seq += 1
+        self._last_id = max(self._last_id, config.config_id)
+        self._index(config)
+        return True
+
+    def restore(
+        self,
+        config_ids: list[int],
+        load: Callable[[list[int]], dict[int, GemaConfiguration]],
+        load_index: Callable[[], Iterable[tuple]],
+    ) -> None:
+        """Insert stored configurations without loading them.
+
+        Args:
+            config_ids (list[int]): The IDs of the stored configurations, in
+                                  insertion order.
+            load (Callable): Returns the stored configurations with the given
+                            IDs, by ID.
+            load_index (Callable): Returns one ``(config_id, *values)`` row
+                                  per stored configuration, with the values of
+                                  its INDEXED_FIELDS.
+        """
+        for config_id in config_ids:
+            if config_id in self._configs:
+                continue
+            self._configs[config_id] = None
+            self._seq[config_id] = self._next_seq
+            self._next_seq += 1
+        self._last_id = max([self._last_id, *config_ids])
+        self._load = load
+        self._load_index = load_index
+
+    def remove(self, config_id: int) -> Optional[GemaConfiguration]:
+        """Remove a configuration.
+
+        Args:
+            config_id (int): The ID of the configuration to remove.
+
+        Returns:
+            Optional[GemaConfiguration]: The removed configuration, or None if
+                                       no configuration had the given ID.
+        """
+        config = self.get(config_id)
+        if config is None:
+            return None
+
+        del self._configs[config_id]
+        self._unindex(config_id)
+        del self._seq[config_id]
+        return config
+
+    def reindex(self, config: GemaConfiguration) -> None:
+        """Refresh the secondary indexes of a stored configuration.
+
+        Args:
+            config (GemaConfiguration): A configuration already in the store
+                                      whose fields have been modified.
+        """
+        if config.config_id not in self._configs:
+            return
+
+        self._unindex(config.config_id)
+        self._index(config)
+
+    def filter(self, criteria: dict[str, Any]) -> list[GemaConfiguration]:
+        """Return the configurations matching all given field values.
+
+        Args:
+            criteria (dict): Mapping of indexed field names to required values,
+                e.g. ``{"board.type": "SimpleBoard", "processor.cpu": "timing"}``.
+
+        Returns:
+            list[GemaConfiguration]: Matching configurations in insertion order.
+
+        Raises:
+            ValueError: If a criterion refers to a field that is not indexed.
+        """
+        unknown = [name for name in criteria if name not in self._indexes]
+        if unknown:
+            raise ValueError(
+                f"Cannot filter on {', '.join(unknown)}. "
+                f"Indexed fields are: {', '.join(self.INDEXED_FIELDS)}"
+            )
+        if not criteria:
+            return list(self)
+        self._index_restored()
+
+        buckets = sorted(
+            (
+                self._indexes[name].get(self._normalize(value), {})
+                for name, value in criteria.items()
+            ),
+            key=len,
+        )
+        # Start from the smallest bucket and intersect with the others
+        matches = [
+            config_id
+            for config_id in buckets[0]
+            if all(config_id in bucket for bucket in buckets[1:])
+        ]
+        matches.sort(key=self._seq.__getitem__)
+        return self._resolve(matches)
+
+    def _resolve(self, config_ids: list[int]) -> list[GemaConfiguration]:
+        """Return configurations by ID, loading the restored ones not loaded yet."""
+        missing = [
+            config_id
+            for config_id in config_ids
+            if self._configs.get(config_id, False) is None
+        ]
+        if missing:
+            loaded = self._load(missing)
+            for config_id in missing:
+                if config_id in loaded:
+                    self._configs[config_id] = loaded[config_id]
+                else:
+                    # Gone from the store, so it cannot be served either
+                    self._drop(config_id)
+        return [
+            self._configs[config_id]
+            for config_id in config_ids
+            if self._configs.get(config_id) is not None
+        ]
+
+    def _drop(self, config_id: int) -> None:
+        del self._configs[config_id]
+        del self._seq[config_id]
+        self._unindex(config_id)
+
+    def _index_restored(self) -> None:
+        """Index the restored configurations, on the first filtered query.
+
+        Configurations added or reindexed since they were restored are
+        already indexed and are skipped.
+        """
+        if self._load_index is None:
+            return
+        load_index, self._load_index = self._load_index, None
+        normalize = self._normalize
+        indexes = [self._indexes[name] for name in self.INDEXED_FIELDS]
+        for config_id, *values in load_index():
+            if config_id not in self._configs or config_id in self._keys:
+                continue
+            values = [normalize(value) for value in values]
+            for index, value in zip(indexes, values):
+                index.setdefault(value, {})[config_id] = None
+            self._keys[config_id] = dict(zip(self.INDEXED_FIELDS, values))
+
+    def _index(self, config: GemaConfiguration) -> None:
+        keys = {
+            name: self._normalize(self._field_value(config, name))
+            for name in self.INDEXED_FIELDS
+        }
+        for name, value in keys.items():
+            self._indexes[name].setdefault(value, {})[config.config_id] = None
+        self._keys[config.config_id] = keys
+
+    def _unindex(self, config_id: int) -> None:
+        for name, value in self._keys.pop(config_id, {}).items():
+            bucket = self._indexes[name].get(value)
+            if bucket is None:
+                continue
+            bucket.pop(config_id, None)
+            if not bucket:
+                del self._indexes[name][value]
+
+    @classmethod
+    def indexed_values(cls, config: GemaConfiguration) -> tuple:
+        """Return the raw values of the INDEXED_FIELDS of a configuration."""
+        return tuple(cls._field_value(config, name) for name in cls.INDEXED_FIELDS)
+
+    @staticmethod
+    def _field_value(config: GemaConfiguration, name: str) -> Any:
+        component, attr = name.split(".")
+        return getattr(getattr(config, component, None), attr, None)
+
+    @staticmethod
+    def _normalize(value: Any) -> Any:
+        return value.lower() if isinstance(value, str) else value
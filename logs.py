@@ -0,0 +1,339 @@
+# ----------------------------------------------------------------------------
+# File: <logs>.py
+#
+# Description:
+# <Captures the output of gem5 simulations into per-simulation logs>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import os
+import selectors
+import sys
+import threading
+from collections import OrderedDict
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+from pathlib import Path
+
+from gem5.utils.gema.rpc_data import GemaSimulation, SimStatus
+
+# The log of a simulation, in its output directory. Rotated files are named
+# LOG_FILE.<offset>, after the position of their first byte in the log.
+LOG_FILE = "gema.log"
+
+
+def redirect_output(log: Connection) -> None:
+    """Send the stdout and stderr of this process into a simulation log.
+
+    Runs in the gem5 child. The file descriptors themselves are replaced, so
+    the output of gem5's C++ code is captured as well as Python's.
+
+    Args:
+        log (Connection): The write end handed out by GemaLogCollector.open.
+    """
+    sys.stdout.flush()
+    sys.stderr.flush()
+    os.dup2(log.fileno(), 1)
+    os.dup2(log.fileno(), 2)
+    log.close()
+    # stdout is block buffered once it is no longer a terminal
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
+
+class _SimLog:
+    """The log of one simulation as it is being captured."""
+
+    def __init__(self, directory: Path, tail_bytes: int) -> None:
+        self.directory = directory
+        self.segments = _segments(directory)
+        # Position in the log of the first byte of the current file
+        self.start = _current_start(self.segments)
+        self.size = _file_size(directory / LOG_FILE)
+        self.file = None
+        self.tail = bytearray()
+        self.tail_bytes = tail_bytes
+        self.closed = False
+
+    @property
+    def end(self) -> int:
+        return self.start + self.size
+
+    @property
+    def tail_start(self) -> int:
+        return self.end - len(self.tail)
+
+
+class GemaLogCollector:
+    """Collects the output of gem5 children into per-simulation log files.
+
+    Every child gets the write end of its own pipe, which it installs as its
+    stdout and stderr (see ``redirect_output``). A single thread reads all
+    pipes and appends the output to LOG_FILE in the simulation's output
+    directory. Once the file exceeds ``max_bytes`` it is rotated, and only
+    the newest BACKUPS rotated files are kept.
+
+    The last TAIL_BYTES of every log are also kept in memory, so clients
+    following a log are served without touching the disk. Positions in a
+    log are byte offsets from its very first byte and stay valid across
+    rotations. The tails of the most recent MAX_TAILS simulations are kept.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+        max_bytes (int): Size at which a log file is rotated.
+    """
+
+    TAIL_BYTES = 64 * 1024
+    BACKUPS = 3
+    MAX_TAILS = 1000
+    # Most bytes returned by one read
+    MAX_READ = 1024 * 1024
+
+    def __init__(self, root: Gema, max_bytes: int = 10 * 1024 * 1024) -> None:
+        self.root = root
+        self.max_bytes = max_bytes
+        self._lock = threading.Lock()
+        # sim_id -> log, oldest simulation first
+        self._logs: OrderedDict[int, _SimLog] = OrderedDict()
+        # Read ends waiting to be registered with the selector
+        self._pending: list[tuple[int, Connection]] = []
+        self._selector = selectors.DefaultSelector()
+        self._wake_r, self._wake_w = Pipe(duplex=False)
+        self._selector.register(self._wake_r, selectors.EVENT_READ)
+        self._thread = threading.Thread(
+            target=self._collect_loop, name="gema-logs", daemon=True
+        )
+        self._thread.start()
+
+    def open(self, sim: GemaSimulation) -> Connection:
+        """Start capturing the log of a simulation about to be started.
+
+        Args:
+            sim (GemaSimulation): The simulation.
+
+        Returns:
+            Connection: The write end to pass to the child. The caller must
+                       close its copy once the child has started.
+        """
+        read, write = Pipe(duplex=False)
+        self.attach(sim, read)
+        return write
+
+    def attach(self, sim: GemaSimulation, read: Connection) -> None:
+        """Start capturing the log of a simulation from an existing pipe.
+
+        Used for children that were started before their simulation was
+        known, see ``pool.GemaWorkerPool``. Output already in the pipe becomes
+        the start of the log.
+
+        Args:
+            sim (GemaSimulation): The simulation.
+            read (Connection): The read end of the child's output pipe. The
+                collector closes it once the child has exited.
+        """
+        log = _SimLog(Path(sim.path), self.TAIL_BYTES)
+        with self._lock:
+            self._logs[sim.sim_id] = log
+            self._logs.move_to_end(sim.sim_id)
+            self._pending.append((sim.sim_id, read))
+            self._drop_old_tails()
+        self._wake_w.send_bytes(b"\0")
+
+    def read(
+        self,
+        sim_id: int,
+        offset: Optional[int] = None,
+        max_bytes: int = TAIL_BYTES,
+    ) -> Optional[dict]:
+        """Read part of the log of a simulation.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+            offset (Optional[int]): Position to read from. Defaults to the
+                last ``max_bytes`` of the log.
+            max_bytes (int): Most bytes to return, capped at MAX_READ.
+
+        Returns:
+            Optional[dict]: The returned ``data`` with its ``offset``, the
+                ``next_offset`` to continue from, the current ``size`` of the
+                log and whether it is ``complete``, or None if the simulation
+                does not exist. If the requested position was rotated away,
+                ``offset`` is the oldest position still available.
+        """
+        sim = self.root.manager.get_sim(sim_id)
+        if sim is None:
+            return None
+        max_bytes = max(0, min(max_bytes, self.MAX_READ))
+
+        with self._lock:
+            log = self._logs.get(sim_id)
+            if log is not None:
+                end, complete = log.end, log.closed
+                if offset is None:
+                    offset = max(end - max_bytes, 0)
+                offset = min(offset, end)
+                if log.tail_start <= offset:
+                    begin = offset - log.tail_start
+                    data = bytes(log.tail[begin : begin + max_bytes])
+                    return self._response(sim_id, offset, data, end, complete)
+
+        directory = Path(sim.path)
+        segments = _segments(directory)
+        current = _current_start(segments)
+        segments.append((current, directory / LOG_FILE))
+        end = current + _file_size(directory / LOG_FILE)
+        if log is None:
+            complete = sim.status in SimStatus.DONE
+        if offset is None:
+            offset = max(end - max_bytes, 0)
+        offset = min(max(offset, segments[0][0]), end)
+
+        data = bytearray()
+        for index, (start, path) in enumerate(segments):
+            stop = segments[index + 1][0] if index + 1 < len(segments) else end
+            if offset >= stop or len(data) >= max_bytes:
+                continue
+            position = max(offset + len(data), start)
+            try:
+                with open(path, "rb") as f:
+                    f.seek(position - start)
+                    data += f.read(min(max_bytes - len(data), stop - position))
+            except OSError:
+                pass
+        return self._response(sim_id, offset, bytes(data), end, complete)
+
+    @staticmethod
+    def _response(sim_id, offset, data, end, complete) -> dict:
+        next_offset = offset + len(data)
+        return {
+            "sim_id": sim_id,
+            "offset": offset,
+            "next_offset": next_offset,
+            "size": end,
+            "complete": complete and next_offset >= end,
+            "data": data.decode(errors="replace"),
+        }
+
+    def _collect_loop(self) -> None:
+        """Copy child output into the logs. Runs forever on the log thread."""
+        while True:
+            for key, _ in self._selector.select():
+                if key.fileobj is self._wake_r:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                    self._register_pending()
+                    continue
+                sim_id = key.data
+                try:
+                    data = os.read(key.fileobj.fileno(), 65536)
+                except OSError:
+                    data = b""
+                if data:
+                    self._append(sim_id, data)
+                else:
+                    self._selector.unregister(key.fileobj)
+                    key.fileobj.close()
+                    self._close(sim_id)
+
+    def _register_pending(self) -> None:
+        with self._lock:
+            pending, self._pending = self._pending, []
+        for sim_id, read in pending:
+            self._selector.register(read, selectors.EVENT_READ, sim_id)
+
+    def _append(self, sim_id: int, data: bytes) -> None:
+        """Write child output to the log file and its in-memory tail."""
+        with self._lock:
+            log = self._logs.get(sim_id)
+            if log is None:
+                return
+            try:
+                if log.file is None:
+                    log.directory.mkdir(parents=True, exist_ok=True)
+                    log.file = open(log.directory / LOG_FILE, "ab")
+                log.file.write(data)
+                log.file.flush()
+            except OSError as e:
+                print(f"Could not write the log of simulation {sim_id}: {e}")
+            log.size += len(data)
+            log.tail += data
+            del log.tail[: max(len(log.tail) - log.tail_bytes, 0)]
+            if log.size >= self.max_bytes:
+                self._rotate(log)
+
+    def _rotate(self, log: _SimLog) -> None:
+        """Move the current log file aside and start a new one."""
+        if log.file is not None:
+            log.file.close()
+            log.file = None
+        rotated = log.directory / f"{LOG_FILE}.{log.start}"
+        try:
+            os.replace(log.directory / LOG_FILE, rotated)
+        except OSError:
+            return
+        log.segments.append((log.start, rotated))
+        log.start, log.size = log.end, 0
+        while len(log.segments) > self.BACKUPS:
+            _, oldest = log.segments.pop(0)
+            try:
+                os.remove(oldest)
+            except OSError:
+                pass
+
+    def _close(self, sim_id: int) -> None:
+        with self._lock:
+            log = self._logs.get(sim_id)
+            if log is None:
+                return
+            if log.file is not None:
+                log.file.close()
+                log.file = None
+            log.closed = True
+
+    def _drop_old_tails(self) -> None:
+        """Forget the oldest tails of exited simulations beyond MAX_TAILS."""
+        excess = len(self._logs) - self.MAX_TAILS
+        for sim_id in list(self._logs):
+            if excess <= 0:
+                break
+            if self._logs[sim_id].closed:
+                del self._logs[sim_id]
+                excess -= 1
+
+
+def _segments(directory: Path) -> list[tuple[int, Path]]:
+    """Return the rotated log files of a directory by starting position."""
+    segments = []
+    for path in directory.glob(f"{LOG_FILE}.*"):
+        suffix = path.name[len(LOG_FILE) + 1 :]
+        if suffix.isdigit():
+            segments.append((int(suffix), path))
+    return sorted(segments)
+
+
+def _current_start(segments: list[tuple[int, Path]]) -> int:
+    """Return the position of the first byte of the current log file."""
+    if not segments:
+        return 0
+    start, path = segments[-1]
+    return start + _file_size(path)
+
+
+def _file_size(path: Path) -> int:
+    try:
+        return os.path.getsize(path)
+    except OSError:
+        return 0
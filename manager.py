@@ -21,27 +21,193 @@ if TYPE_CHECKING:
 
 import os
 import signal
+import threading
+import time
+from collections import deque
 from datetime import datetime
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection, wait
 from pathlib import Path
 
 import psutil
 
+from gem5.simulate.exit_event import ExitEvent
 from gem5.simulate.simulator import Simulator
-from gem5.utils.gema.rpc_data import GemaSimulation
+from gem5.utils.gema.checkpoints import read_checkpoint_meta
+from gem5.utils.gema.exits import GemaExitEventDispatcher
+from gem5.utils.gema.identity import config_content_hash
+from gem5.utils.gema.logs import redirect_output
+from gem5.utils.gema.placement import GemaCorePlacement, apply_placement
+from gem5.utils.gema.pool import GemaWorkerPool
+from gem5.utils.gema.progress import (
+    PROGRESS_FILE,
+    GemaProgressReporter,
+    estimate_remaining,
+    read_json,
+    write_json_atomic,
+)
+from gem5.utils.gema.rpc_data import (
+    GemaCachedResult,
+    GemaConfiguration,
+    GemaSimulation,
+    SimStatus,
+)
 from gem5.utils.multiprocessing import Process
 
 
+def default_sim_limit() -> int:
+    """
+    Return the default number of simulations allowed to run at once.
+
+    gem5 is single-threaded per simulation, so one simulation per physical
+    core avoids oversubscribing SMT siblings. Falls back to the logical core
+    count when the physical count cannot be determined.
+
+    Returns:
+        int: The number of physical cores on the host, at least 1
+    """
+    return psutil.cpu_count(logical=False) or os.cpu_count() or 1
+
+
 class GemaSimulationManager:
     """
     A class responsible for managing gem5 simulation processes and their lifecycle.
 
     This manager handles simulation creation, process management, logging, and
     provides functionality to control running simulations (pause, resume, kill).
+
+    Simulations are indexed both by sim_id and by process ID so that lookups
+    from ``manage_sim`` are constant-time. Access to the indexes and
+    simulation ID allocation is serialized through an internal re-entrant
+    lock so the manager can be shared by concurrent RPC handlers. Disk I/O
+    and process spawning, such as linking cached results and starting gem5
+    children, happen outside of it.
+
+    Simulations restored from the state store are only loaded from it when
+    they are first looked up, except for those still queued or running.
+
+    Simulations are not started directly. They are queued and launched by a
+    scheduler thread that keeps at most ``sim_limit`` gem5 processes running
+    at once, starting the next queued simulation whenever a running one exits.
+
+    The scheduler thread is also the only place children are reaped. When a
+    child exits, its exit code, end time, and the final tick and exit cause it
+    reported in RESULT_FILE are stored on its GemaSimulation record.
+
+    With ``warm_workers`` set, simulations are started on gem5 children that
+    were spawned ahead of time, see ``pool.GemaWorkerPool``. With
+    ``pin_cores`` set, every simulation is pinned to cores of its own and to
+    their NUMA node, see ``placement.GemaCorePlacement``.
+
+    Tick and instruction budgets are enforced by gem5 inside the child. The
+    wall-clock budget is enforced by the scheduler, which terminates a
+    simulation once its timeout has elapsed, whether it is paused or not.
     """
 
-    def __init__(self, root: Gema, m5_dir_override: Optional[Path]=None) -> None:
+    ID_KINDS = ("auto", "sim_id", "pid")
+    # Written by the gem5 child into its output directory when it completes
+    RESULT_FILE = "gema_result.json"
+
+    # Parent-only attributes that must not be pickled into gem5 children
+    _TRANSIENT = (
+        "_lock",
+        "_sims_by_id",
+        "_sims_by_pid",
+        "_queue",
+        "_starting",
+        "_running",
+        "_scheduler",
+        "_wake_r",
+        "_wake_w",
+        "_exited",
+        "_deadlines",
+        "_pool",
+        "_fetch_waits",
+        "_placement",
+    )
+
+    def __init__(
+        self,
+        root: Gema,
+        m5_dir_override: Optional[Path]=None,
+        sim_limit: Optional[int] = None,
+        progress_interval: float = 5.0,
+        warm_workers: int = 0,
+        pin_cores: int = 0,
+    ) -> None:
         self.root = root
         self.m5_dir = m5_dir_override
+        self.sim_limit = sim_limit or default_sim_limit()
+        self.progress_interval = progress_interval
+        self._last_sim_id = 0
+        self._sims_by_id: dict[int, GemaSimulation] = {}
+        self._sims_by_pid: dict[int, GemaSimulation] = {}
+        self._lock = threading.RLock()
+
+        self._queue: deque[GemaSimulation] = deque()
+        # Taken off the queue, with their child being started
+        self._starting: dict[int, GemaSimulation] = {}
+        self._running: dict[int, Process] = {}
+        # Notified by the scheduler whenever it has reaped a simulation
+        self._exited = threading.Condition(self._lock)
+        # sim_id -> time.monotonic() at which its wall-clock budget runs out
+        self._deadlines: dict[int, float] = {}
+        self._wake_r, self._wake_w = Pipe(duplex=False)
+        self._pool = GemaWorkerPool(self, warm_workers)
+        # Resource fetches the scheduler has asked to be woken up after
+        self._fetch_waits: set = set()
+        self._placement = GemaCorePlacement(pin_cores)
+        self._scheduler = threading.Thread(
+            target=self._schedule_loop, name="gema-scheduler", daemon=True
+        )
+        self._scheduler.start()
+
+    def __getstate__(self) -> dict:
+        """
+        Return the picklable state of the manager.
+
+        The manager is pickled into every spawned gem5 child as the owner of
+        ``run_gem5_simulator``. Locks, the scheduler thread and the running
+        process handles cannot cross the process boundary, and the simulation
+        indexes are not needed there, so they are dropped here. Only the lock
+        is recreated in ``__setstate__``; children never schedule simulations
+        themselves.
+        """
+        state = self.__dict__.copy()
+        for attr in self._TRANSIENT:
+            state.pop(attr, None)
+        return state
+
+    def __setstate__(self, state: dict) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.RLock()
+
+    def get_sims(self) -> list[dict]:
+        """
+        Return a serializable snapshot of all stored simulations.
+
+        Returns:
+            list[dict]: One dictionary per simulation, in creation order
+        """
+        sims = self.all_sims()
+        with self._lock:
+            return [sim.to_dict() for sim in sims]
+
+    def all_sims(self) -> list[GemaSimulation]:
+        """
+        Return all simulations, loading those restored but not loaded yet.
+
+        Returns:
+            list[GemaSimulation]: The simulations, in creation order
+        """
+        with self._lock:
+            pending = [i for i, sim in self._sims_by_id.items() if sim is None]
+        # Loaded without the lock, so a large store does not stall the RPCs
+        loaded = self.root.state.load_sims(pending) if pending else []
+        with self._lock:
+            for sim in loaded:
+                self._install(sim)
+            return [sim for sim in self._sims_by_id.values() if sim is not None]
 
     def _generate_log_path(self, sim_id: int, config_id: int) -> Path:
         """
@@ -75,23 +241,176 @@ class GemaSimulationManager:
         Returns:
             int: The newly generated simulation ID
         """
-        current_sim_id = len(self.root.sims) + 1
-        config = self.root.configurator._get_config_by_id(config_id)
+        config = self.root.configurator.snapshot_config(config_id)
+        config_hash = self._content_hash(config)
 
-        m5_path = self.m5_dir
-        if m5_path == None:
-            m5_path = self._generate_log_path(current_sim_id, config_id)
+        with self._lock:
+            self._last_sim_id += 1
+            current_sim_id = self._last_sim_id
 
-        new_sim = GemaSimulation(
-            sim_id=current_sim_id,
-            config=config,
-            generated_on=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
-            path=m5_path.joinpath(Path(f"m5out/sim_{current_sim_id}_config_{config_id}")),
-            pid=os.getpid(),
-        )
+            m5_path = self.m5_dir
+            if m5_path == None:
+                m5_path = self._generate_log_path(current_sim_id, config_id)
+
+            new_sim = GemaSimulation(
+                sim_id=current_sim_id,
+                config=config,
+                generated_on=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                path=m5_path.joinpath(Path(f"m5out/sim_{current_sim_id}_config_{config_id}")),
+                config_hash=config_hash,
+            )
 
-        self.root.sims.append(new_sim)
-        return current_sim_id
+            self._sims_by_id[current_sim_id] = new_sim
+            return current_sim_id
+
+    def _content_hash(self, config: GemaConfiguration) -> Optional[str]:
+        """
+        Hash a configuration with the resource copy this run resolved.
+
+        Args:
+            config: The configuration to hash
+
+        Returns:
+            str|None: See ``identity.config_content_hash``. None while an
+                      unversioned resource is unresolved, in which case
+                      the hash is taken once it is, see _next_launchable
+        """
+        digest = None
+        if config.resource is not None:
+            digest = self.root.resources.digest(
+                config.resource, config.resource_version
+            )
+        return config_content_hash(config, resource_digest=digest)
+
+    def _persist(self, *sims: GemaSimulation) -> None:
+        """Write simulation records through to the state store."""
+        self.root.state.save_sims(list(sims))
+
+    def restore(
+        self, sim_ids: list[int], active_sims: list[GemaSimulation]
+    ) -> None:
+        """
+        Register the simulation records of the state store at startup.
+
+        Simulations that were still queued are queued again. Simulations that
+        were running belonged to the previous server process, which can no
+        longer track them, so they are marked as interrupted. All others are
+        loaded from the store when they are first looked up.
+
+        Args:
+            sim_ids: The IDs of all stored simulations, in sim_id order
+            active_sims: The stored simulations that were queued or running
+        """
+        with self._lock:
+            self._sims_by_id.update(dict.fromkeys(sim_ids))
+            self._last_sim_id = max([self._last_sim_id, *sim_ids])
+            interrupted = []
+            for sim in active_sims:
+                self._install(sim)
+                if sim.status == SimStatus.QUEUED:
+                    self._queue.append(sim)
+                elif sim.status == SimStatus.RUNNING:
+                    sim.status = SimStatus.INTERRUPTED
+                    interrupted.append(sim)
+
+            self._persist(*interrupted)
+            self._wake_scheduler()
+
+    def _install(self, sim: GemaSimulation) -> GemaSimulation:
+        """
+        Index a simulation loaded from the state store.
+
+        A simulation loaded meanwhile is kept, since it may have changed
+        since it was loaded. Process IDs of older simulations never replace
+        newer ones in the pid index.
+
+        Args:
+            sim: The loaded simulation
+
+        Returns:
+            GemaSimulation: The indexed record of the simulation
+        """
+        with self._lock:
+            current = self._sims_by_id.get(sim.sim_id)
+            if current is not None:
+                return current
+            self._sims_by_id[sim.sim_id] = sim
+            if sim.pid is not None:
+                other = self._sims_by_pid.get(sim.pid)
+                if other is None or other.sim_id < sim.sim_id:
+                    self._sims_by_pid[sim.pid] = sim
+            return sim
+
+    def _lookup(self, sim_id: int) -> Optional[GemaSimulation]:
+        """
+        Return the record of a simulation, loading it from the store if needed.
+
+        Args:
+            sim_id: The ID of the simulation
+
+        Returns:
+            GemaSimulation|None: The simulation, or None if the ID is unknown
+        """
+        with self._lock:
+            sim = self._sims_by_id.get(sim_id)
+            if sim is not None or sim_id not in self._sims_by_id:
+                return sim
+            loaded = self.root.state.load_sims([sim_id])
+            return self._install(loaded[0]) if loaded else None
+
+    def _lookup_pid(self, pid: int) -> Optional[GemaSimulation]:
+        """
+        Return the newest simulation with a process ID, loading it if needed.
+
+        Args:
+            pid: The process ID
+
+        Returns:
+            GemaSimulation|None: The simulation, or None if no simulation had it
+        """
+        with self._lock:
+            sim = self._sims_by_pid.get(pid)
+            if sim is not None:
+                return sim
+            sim_ids = self.root.state.find_sim_ids("pid = ?", (pid,))
+            return self._lookup(sim_ids[-1]) if sim_ids else None
+
+    def set_archived(
+        self, sim: GemaSimulation, archived: str, output_size: int
+    ) -> None:
+        """
+        Record that the outputs of an exited simulation were archived.
+
+        Called by the archiver from its worker threads, so the record is
+        updated and written through under the manager lock like every other
+        change to it.
+
+        Args:
+            sim: The exited simulation
+            archived: "compacted" or "pruned"
+            output_size: The size in bytes of its outputs afterwards
+        """
+        with self._lock:
+            sim.archived = archived
+            sim.output_size = output_size
+            self._persist(sim)
+
+    def _assign_pid(self, sim: GemaSimulation, pid: int) -> None:
+        """
+        Record the process ID of a started simulation and index it.
+
+        Process IDs can be recycled by the operating system, so a newer
+        simulation always replaces an older one in the pid index.
+
+        Args:
+            sim: The simulation whose process has been started
+            pid: The process ID of the gem5 child running the simulation
+        """
+        with self._lock:
+            if sim.pid is not None and self._sims_by_pid.get(sim.pid) is sim:
+                del self._sims_by_pid[sim.pid]
+            sim.pid = pid
+            self._sims_by_pid[pid] = sim
 
     def _get_simulation_by_id(
         self, sim_id: int, config_id: int
@@ -106,97 +425,684 @@ class GemaSimulationManager:
         Returns:
             GemaSimulation|None: The matching simulation object if found, None otherwise
         """
-        for sim in self.root.sims:
-            if sim.sim_id == sim_id and sim.config.config_id == config_id:
+        with self._lock:
+            sim = self._lookup(sim_id)
+            if sim is not None and sim.config.config_id == config_id:
                 return sim
-        return None
+            return None
 
-    def start_subprocess(self, config_id: int) -> None:
+    def start_subprocess(self, config_id: int, use_cache: bool = True) -> int:
         """
-        Launch a new gem5 simulation as a subprocess.
+        Queue a new gem5 simulation to run as a subprocess.
 
-        Creates a new simulation record and starts it as a separate process using
-        gem5's multiprocessing utilities. Updates the simulation record with the
-        new process ID once started.
+        Creates a new simulation record in the "queued" state and hands it to
+        the scheduler, which launches it with gem5's multiprocessing utilities
+        as soon as fewer than ``sim_limit`` simulations are running.
+
+        If an identical configuration has already finished and ``use_cache``
+        is set, the earlier outputs are linked into the new simulation's
+        directory and the simulation is marked finished without running gem5.
 
         Args:
             config_id: The identifier of the configuration to simulate
+            use_cache: Whether a cached result may be reused
+
+        Returns:
+            int: The ID of the queued simulation
+        """
+        return self.start_subprocesses([config_id], use_cache)[0]
+
+    def start_subprocesses(
+        self, config_ids: list[int], use_cache: bool = True
+    ) -> list[int]:
+        """
+        Queue a batch of gem5 simulations in one step.
+
+        All simulation records are created while holding the lock once, and
+        the ones that need to run are queued contiguously in a second step,
+        so the scheduler is only woken up a single time. Cached results are
+        linked in between, without holding the lock. Simulations with a
+        cached result are completed immediately instead of being queued (see
+        ``start_subprocess``).
+
+        Args:
+            config_ids: The identifiers of the configurations to simulate
+            use_cache: Whether cached results may be reused
+
+        Returns:
+            list[int]: The IDs of the queued simulations, in the order given
+        """
+        with self._lock:
+            sims = [
+                self._sims_by_id[self._generate_sim_save(config_id)]
+                for config_id in config_ids
+            ]
+
+        cached = {}
+        for sim in sims:
+            entry = self._reuse_cached_result(sim) if use_cache else None
+            if entry is not None:
+                cached[sim.sim_id] = entry
+            elif sim.config.resource is not None:
+                self.root.resources.prefetch(
+                    sim.config.resource, sim.config.resource_version
+                )
+
+        with self._lock:
+            for sim in sims:
+                # A simulation may have been cancelled meanwhile
+                if sim.status != SimStatus.QUEUED:
+                    continue
+                if sim.sim_id in cached:
+                    self._complete_from_cache(sim, cached[sim.sim_id])
+                else:
+                    self._queue.append(sim)
+            self._persist(*sims)
+            self._wake_scheduler()
+        return [sim.sim_id for sim in sims]
+
+    def _reuse_cached_result(
+        self, sim: GemaSimulation
+    ) -> Optional[GemaCachedResult]:
+        """
+        Link the cached result of a simulation into its output directory.
+
+        Called without holding the lock, since linking a result touches
+        every one of its files.
+
+        Args:
+            sim: The newly created simulation record
+
+        Returns:
+            GemaCachedResult|None: The cached result that was linked into the
+                                   simulation's output directory, or None if
+                                   there is none or linking it failed
+        """
+        cached = self.root.results.lookup(sim.config_hash)
+        if cached is None:
+            return None
+
+        try:
+            self.root.results.materialize(cached, Path(sim.path))
+        except OSError as e:
+            print(f"Could not reuse cached result for sim_id {sim.sim_id}: {e}")
+            return None
+        return cached
+
+    def _complete_from_cache(
+        self, sim: GemaSimulation, cached: GemaCachedResult
+    ) -> None:
+        """
+        Mark a simulation finished with the outcome of the cached result.
+
+        Args:
+            sim: The simulation whose outputs were linked from the cache
+            cached: The cached result
+        """
+        with self._lock:
+            sim.cached_from = cached.sim_id
+            sim.status = SimStatus.FINISHED
+            sim.exit_code = 0
+            sim.ended_on = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            source = self._lookup(cached.sim_id)
+            if source is not None:
+                sim.final_tick = source.final_tick
+                sim.exit_cause = source.exit_cause
+                sim.ended_by = source.ended_by
+
+    def set_sim_limit(self, limit: int) -> bool:
+        """
+        Change the maximum number of simulations that may run at once.
+
+        Raising the limit starts queued simulations immediately. Lowering it
+        never stops running simulations; new ones are held back until enough
+        of them have exited.
+
+        Args:
+            limit: The new maximum number of concurrently running simulations
+
+        Returns:
+            bool: True if the limit was updated, False if it is invalid (<= 0)
+        """
+        if limit <= 0:
+            return False
+
+        with self._lock:
+            self.sim_limit = limit
+            self._wake_scheduler()
+        return True
+
+    def set_warm_workers(self, count: int) -> bool:
         """
-        c_sim_id = self._generate_sim_save(config_id)
+        Change the number of idle warm workers kept for new simulations.
+
+        Args:
+            count: The new number of warm workers; 0 disables the pool
+
+        Returns:
+            bool: True if the number was updated, False if it is negative
+        """
+        if count < 0:
+            return False
+
+        self._pool.set_size(count)
+        return True
+
+    def get_sim(self, sim_id: int) -> Optional[GemaSimulation]:
+        """
+        Return the record of a simulation.
+
+        Args:
+            sim_id: The ID of the simulation
+
+        Returns:
+            GemaSimulation|None: The simulation, or None if the ID is unknown
+        """
+        with self._lock:
+            return self._lookup(sim_id)
+
+    def get_queue_status(self) -> dict:
+        """
+        Summarize the state of the simulation scheduler.
+
+        Returns:
+            dict: The concurrency limit, the IDs of the running and queued
+                  simulations, in launch order, the number of warm workers
+                  kept and currently idle, and the host cores simulations
+                  are pinned to, if any
+        """
+        with self._lock:
+            return {
+                "sim_limit": self.sim_limit,
+                "running": list(self._running),
+                "queued": [sim.sim_id for sim in self._queue],
+                "warm_workers": self._pool.size,
+                "idle_workers": len(self._pool),
+                "placement": self._placement.get_status(),
+            }
+
+    def get_progress(
+        self,
+        sim_id: int,
+        max_ticks: Optional[int] = None,
+        max_insts: Optional[int] = None,
+    ) -> Optional[dict]:
+        """
+        Report how far a simulation has progressed.
+
+        Running simulations report the latest record their gem5 child wrote
+        to PROGRESS_FILE: the current tick, the committed instructions and the
+        simulation speed. If a tick or instruction budget is given, the record
+        also includes the estimated host seconds until it is reached.
+
+        Args:
+            sim_id: The ID of the simulation
+            max_ticks: Tick budget to estimate the remaining time against
+            max_insts: Committed instruction budget to estimate against
+
+        Returns:
+            dict|None: The progress of the simulation, or None if it does not exist
+        """
+        with self._lock:
+            sim = self._lookup(sim_id)
+            if sim is None:
+                return None
+            status, path = sim.status, Path(sim.path)
+            final_tick, budget = sim.final_tick, sim.config.budget
+            deadline = self._deadlines.get(sim_id)
+
+        progress = {"sim_id": sim_id, "status": status}
+        if status == SimStatus.QUEUED:
+            return progress
+
+        progress.update(read_json(path / PROGRESS_FILE) or {})
+        if status == SimStatus.RUNNING:
+            eta = estimate_remaining(
+                progress,
+                max_ticks if max_ticks is not None else budget.max_ticks,
+                max_insts if max_insts is not None else budget.max_insts,
+            )
+            if deadline is not None:
+                timeout_in = max(deadline - time.monotonic(), 0.0)
+                progress["timeout_in_seconds"] = timeout_in
+                eta = timeout_in if eta is None else min(eta, timeout_in)
+            progress["eta_seconds"] = eta
+        elif final_tick is not None:
+            progress["tick"] = final_tick
+        return progress
+
+    def get_running_pids(self) -> dict[int, int]:
+        """
+        Return the process IDs of the running simulations.
+
+        Returns:
+            dict[int, int]: The pid of each running simulation, by sim_id
+        """
+        with self._lock:
+            return {
+                sim_id: process.pid
+                for sim_id, process in self._running.items()
+            }
+
+    def _wake_scheduler(self) -> None:
+        """Interrupt the scheduler's wait so it re-evaluates the queue."""
+        with self._lock:
+            self._wake_w.send_bytes(b"")
+
+    def _schedule_loop(self) -> None:
+        """
+        Launch queued simulations and reap finished ones.
+
+        Runs forever on the scheduler thread. The thread blocks until either a
+        running child exits (its process sentinel becomes ready), the queue
+        or limit changes (a byte is written to the wake-up pipe), or the
+        earliest wall-clock deadline of a running simulation passes.
+        """
+        while True:
+            self._launch_queued()
+
+            with self._lock:
+                sentinels = {
+                    process.sentinel: sim_id
+                    for sim_id, process in self._running.items()
+                }
+                deadline = min(self._deadlines.values(), default=None)
+
+            timeout = None
+            if deadline is not None:
+                timeout = max(deadline - time.monotonic(), 0.0)
+            for ready in wait([self._wake_r, *sentinels], timeout):
+                if ready is self._wake_r:
+                    while self._wake_r.poll():
+                        self._wake_r.recv_bytes()
+                else:
+                    self._reap(sentinels[ready])
+            self._enforce_deadlines()
+
+    def _launch_queued(self) -> None:
+        """
+        Start queued simulations until the concurrency limit is reached.
+
+        Only taking a simulation off the queue and reserving its slot and
+        cores happen under the lock. Preparing its checkpoint and spawning
+        its child do not, so RPCs are never held up by them. A simulation
+        that is cancelled while it starts is terminated once its child is
+        up, and reaped like any other.
+        """
+        while True:
+            with self._lock:
+                if not (
+                    self._queue
+                    and len(self._running) + len(self._starting) < self.sim_limit
+                    and self._placement.can_place()
+                ):
+                    return
+                sim = self._next_launchable()
+                if sim is None:
+                    return
+                self._placement.assign(sim)
+                self._starting[sim.sim_id] = sim
+
+            try:
+                self.root.checkpoints.prepare(sim)
+                process = self._start_process(sim)
+            except Exception as e:
+                print(f"Failed to start simulation {sim.sim_id}: {e}")
+                with self._lock:
+                    del self._starting[sim.sim_id]
+                    self._placement.release(sim)
+                    self.root.checkpoints.release(sim)
+                    if sim.status == SimStatus.QUEUED:
+                        sim.status = SimStatus.FAILED
+                    self._persist(sim)
+                continue
+
+            with self._lock:
+                del self._starting[sim.sim_id]
+                self._running[sim.sim_id] = process
+                self._assign_pid(sim, process.pid)
+                if sim.status == SimStatus.QUEUED:
+                    sim.status = SimStatus.RUNNING
+                    if sim.config.budget.timeout:
+                        self._deadlines[sim.sim_id] = (
+                            time.monotonic() + sim.config.budget.timeout
+                        )
+                else:
+                    process.terminate()
+                self._persist(sim)
+
+    def _next_launchable(self) -> Optional[GemaSimulation]:
+        """
+        Take the first queued simulation whose resource has been resolved.
+
+        Simulations whose resource is still being fetched stay queued, and
+        the scheduler is woken up once the fetch is over. If the fetch failed,
+        the simulation is launched anyway and its child obtains the resource
+        itself, which reports the error in the simulation's log.
+
+        Returns:
+            GemaSimulation|None: The simulation, with ``resource_path`` set,
+                                 or None if every queued simulation is waiting
+        """
+        fetches = {}
+        for sim in self._queue:
+            config = sim.config
+            if config.resource is None:
+                fetch = None
+            else:
+                key = (config.resource, config.resource_version)
+                if key not in fetches:
+                    fetches[key] = self.root.resources.resolve(*key)
+                fetch = fetches[key]
+
+            if fetch is not None and not fetch.done():
+                if fetch not in self._fetch_waits:
+                    self._fetch_waits.add(fetch)
+                    fetch.add_done_callback(self._on_fetch_done)
+                continue
+            self._queue.remove(sim)
+            if fetch is not None and fetch.exception() is None:
+                sim.resource_path = fetch.result()
+                if sim.config_hash is None:
+                    sim.config_hash = self._content_hash(config)
+            return sim
+        return None
+
+    def _on_fetch_done(self, fetch) -> None:
+        """Wake the scheduler once a resource a queued simulation needs is in."""
+        with self._lock:
+            self._fetch_waits.discard(fetch)
+            self._wake_scheduler()
+
+    def _start_process(self, sim: GemaSimulation) -> Process:
+        """Start the gem5 child of a simulation, on a warm worker if one is idle."""
+        name = f"config_{sim.config.config_id}_sim_{sim.sim_id}"
+        worker = self._pool.take()
+        if worker is not None:
+            try:
+                worker.jobs.send(sim)
+            except OSError:
+                # The worker died since it was taken; start a fresh child
+                worker.close()
+                worker.process.join()
+            else:
+                worker.jobs.close()
+                self.root.logs.attach(sim, worker.log)
+                worker.process.name = name
+                return worker.process
+
+        log = self.root.logs.open(sim)
         process = Process(
-            target=self.run_gem5_simulator,
-            args=[c_sim_id, config_id],
-            name=(f"config_{config_id}_sim_{os.getpid()}"),
+            target=self.run_gem5_simulator, args=[sim, log], name=name
         )
+        try:
+            process.start()
+        finally:
+            # Only the child keeps the write end, so the log ends with it
+            log.close()
+        return process
 
-        current_sim = self._get_simulation_by_id(c_sim_id, config_id)
-        process.start()
-
-        if current_sim:
-            current_sim.pid = process.pid
+    def _enforce_deadlines(self) -> None:
+        """Terminate running simulations whose wall-clock budget has run out."""
+        now = time.monotonic()
+        with self._lock:
+            for sim_id, deadline in list(self._deadlines.items()):
+                if deadline > now:
+                    continue
+                del self._deadlines[sim_id]
+                process = self._running.get(sim_id)
+                sim = self._sims_by_id.get(sim_id)
+                if process is None or sim is None:
+                    continue
+                if sim.status == SimStatus.RUNNING:
+                    sim.status = SimStatus.TIMED_OUT
+                    sim.ended_by = "timeout"
+                    self._persist(sim)
+                process.terminate()
+                # A paused process only acts on the signal once resumed
+                try:
+                    os.kill(process.pid, signal.SIGCONT)
+                except OSError:
+                    pass
 
-    def run_gem5_simulator(self, sim_id: int, config_id: int) -> None:
+    def _reap(self, sim_id: int) -> None:
         """
-        Execute a gem5 simulation with the specified configuration.
+        Collect an exited simulation process and record its final state.
 
-        Retrieves the simulation configuration, converts it to a gem5-compatible format,
-        and runs the simulation. Outputs completion status and statistics when done.
+        Stores the exit code and end time, along with the final tick, exit
+        cause and what stopped the run, as the child wrote them to
+        RESULT_FILE, and wakes up any thread waiting for the simulation to exit.
+        Only the in-memory records are updated under the lock. Reading the
+        result file and writing the store, checkpoint and result caches do
+        not hold it, so RPCs are never held up by them.
 
         Args:
-            sim_id: The unique identifier of the simulation to run
-            config_id: The identifier of the configuration to use
+            sim_id: The ID of the simulation whose process has exited
+        """
+        with self._lock:
+            process = self._running.pop(sim_id, None)
+            self._deadlines.pop(sim_id, None)
+            sim = self._sims_by_id.get(sim_id)
+            if process is None or sim is None:
+                return
+
+        process.join()
+        result = read_json(Path(sim.path) / self.RESULT_FILE) or {}
+
+        with self._lock:
+            sim.exit_code = process.exitcode
+            sim.ended_on = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+            sim.final_tick = result.get("final_tick")
+            sim.exit_cause = result.get("exit_cause")
+            sim.ended_by = result.get("limit") or sim.ended_by
+            if sim.status == SimStatus.RUNNING:
+                sim.status = (
+                    SimStatus.FINISHED
+                    if process.exitcode == 0
+                    else SimStatus.FAILED
+                )
+            self._placement.release(sim)
+            self._exited.notify_all()
+
+        self._persist(sim)
+        self.root.checkpoints.release(sim)
+        if sim.status == SimStatus.FINISHED:
+            self.root.results.record(sim)
+        self.root.archive.submit(sim)
+
+    def run_warm_worker(self, jobs: Connection, log: Connection) -> None:
         """
-        current_sim = self._get_simulation_by_id(sim_id, config_id)
+        Wait for a simulation and run it, in a child started ahead of time.
+
+        Runs in a gem5 child started by GemaWorkerPool. Unpickling the manager
+        has already imported the gem5 standard library and all component
+        modules, so only the simulation itself is left to set up once it
+        arrives. Exits without running anything if the pool closes the pipe.
 
-        if not current_sim:
+        Args:
+            jobs: The end the simulation is sent through
+            log: The write end of the child's output pipe
+        """
+        redirect_output(log)
+        try:
+            jobs.send_bytes(b"ready")
+            sim = jobs.recv()
+        except (EOFError, OSError):
             return
+        jobs.close()
+        self.run_gem5_simulator(sim)
+
+    def run_gem5_simulator(
+        self, sim: GemaSimulation, log: Optional[Connection] = None
+    ) -> None:
+        """
+        Execute a gem5 simulation with the specified configuration.
 
-        gema_config = current_sim.config
-        gem5_config = self.root.configurator.generate_gem5_config(gema_config)
+        Runs in the spawned gem5 child. Converts the simulation's configuration
+        snapshot to a gem5-compatible format and runs the simulation, with the
+        exit handlers, CPU switches and instruction budget of the configuration
+        installed. Switchable processors restore their warm-up from, or save it
+        to, the checkpoint cache entry chosen when the simulation was started.
+        All output goes to the simulation's log. Outputs completion status and
+        statistics when done.
+
+        Args:
+            sim: The record of the simulation to run
+            log: The write end of the simulation's log, see GemaLogCollector
+        """
+        if log is not None:
+            redirect_output(log)
+        apply_placement(sim)
+        gema_config = sim.config
+        gem5_config = self.root.configurator.generate_gem5_config(
+            gema_config, sim.resource_path
+        )
+        if gem5_config is None:
+            raise RuntimeError(
+                f"Could not build the gem5 configuration for sim_id {sim.sim_id}."
+            )
+
+        outdir = Path(sim.path)
+        reporter = GemaProgressReporter(
+            gem5_config, outdir, self.progress_interval
+        )
+        checkpoint = Path(sim.checkpoint) if sim.checkpoint else None
+        restored = None
+        if checkpoint is not None and sim.checkpoint_restored:
+            restored = read_checkpoint_meta(checkpoint)
+        dispatcher = GemaExitEventDispatcher(
+            gema_config,
+            gem5_config,
+            None if sim.checkpoint_restored else checkpoint,
+        )
+        simulator = Simulator(
+            board=gem5_config,
+            on_exit_event={
+                **dispatcher.on_exit_event(),
+                ExitEvent.SCHEDULED_TICK: reporter.on_scheduled_tick(),
+            },
+            checkpoint_path=checkpoint if restored is not None else None,
+        )
+        simulator.override_outdir(outdir)
 
-        simulator = Simulator(board=gem5_config)
-        simulator.override_outdir(Path(current_sim.path))
+        def on_instantiated() -> None:
+            reporter.start()
+            dispatcher.schedule(simulator, restored)
 
+        self._after_instantiate(simulator, gem5_config, on_instantiated)
+        if gema_config.budget.max_ticks:
+            # Absolute, unlike run(max_ticks), which restarts counting after
+            # every exit event and on restored checkpoints
+            simulator.set_max_ticks(gema_config.budget.max_ticks)
         simulator.run()
+        final_tick = simulator.get_current_tick()
+        exit_cause = simulator.get_last_exit_event_cause()
+
+        # Report the outcome to the parent, which reads it when reaping
+        write_json_atomic(
+            outdir / self.RESULT_FILE,
+            {
+                "final_tick": final_tick,
+                "exit_cause": exit_cause,
+                "limit": dispatcher.stopped_by
+                or self._budget_limit(exit_cause),
+            },
+        )
         print(
-            f"Simulation for sim_id {sim_id} completed at tick {simulator.get_current_tick()} with exit cause: {simulator.get_last_exit_event_cause()}"
+            f"Simulation for sim_id {sim.sim_id} completed at tick {final_tick} with exit cause: {exit_cause}"
         )
 
-    def _valid_id_or_pid(self, identifier: int) -> int | bool:
+    @staticmethod
+    def _after_instantiate(simulator, board, callback) -> None:
+        """
+        Run a callback once gem5 has instantiated the board, before it runs.
+
+        Progress exits and CPU switches can only be scheduled on an
+        instantiated board. The Simulator instantiates it inside ``run()``
+        and then calls the board's ``_post_instantiate`` hook, which is
+        extended with the callback. Boards without the hook are instantiated
+        ahead of ``run()`` instead, if the Simulator allows it.
+
+        Args:
+            simulator: The gem5 Simulator about to run
+            board: The board it runs
+            callback: Called without arguments once the board is instantiated
         """
-        Validate and resolve a simulation identifier or process ID.
+        post_instantiate = getattr(board, "_post_instantiate", None)
+        if callable(post_instantiate):
+
+            def hook() -> None:
+                post_instantiate()
+                callback()
+
+            board._post_instantiate = hook
+        elif hasattr(simulator, "_instantiate"):
+            simulator._instantiate()
+            callback()
+        else:
+            print(
+                "This gem5 version cannot run code before a simulation starts; "
+                "progress reports and instruction stops are disabled."
+            )
 
-        Checks if the given identifier corresponds to either a valid simulation ID
-        with an associated process ID, or directly to a valid process ID of a running
-        simulation.
+    @staticmethod
+    def _budget_limit(exit_cause: str) -> Optional[str]:
+        """
+        Return the budget limit behind a gem5 exit cause, if any.
 
         Args:
-            identifier: Either a simulation ID or a process ID to validate
+            exit_cause: The cause of the last exit event of the simulation
 
         Returns:
-            int|bool: The associated process ID if valid, False otherwise
+            str|None: "max_ticks" or "max_insts", or None if the simulation
+                      did not end because of a budget
         """
-        # Check if the identifier matches a pid in any simulation
-        saved_sim = next(
-            (sim for sim in self.root.sims if sim.pid == identifier), None
-        )
-        if saved_sim:
-            return identifier  # If it's a valid pid, return it
+        try:
+            event = ExitEvent.translate_exit_status(exit_cause)
+        except Exception:
+            return None
+        return {
+            ExitEvent.MAX_TICK: "max_ticks",
+            ExitEvent.MAX_INSTS: "max_insts",
+        }.get(event)
 
-        # If not a pid, check if it's a valid sim_id with an associated pid
-        saved_sim = next(
-            (sim for sim in self.root.sims if sim.sim_id == identifier), None
-        )
-        if saved_sim and saved_sim.pid is not None:
-            return (
-                saved_sim.pid
-            )  # If it's a valid sim_id with a pid, return the pid
+    def _resolve_simulation(
+        self, identifier: int, kind: str = "auto"
+    ) -> GemaSimulation | None:
+        """
+        Look up a simulation by simulation ID or process ID.
 
-        return (
-            False  # Return False if neither a valid pid nor a sim_id with pid
-        )
+        Simulation IDs and process IDs share the same integer space, so an
+        identifier may match one simulation by sim_id and another by pid. The
+        ``kind`` argument settles this explicitly: with "auto", a matching
+        sim_id always wins over a matching pid, since sim IDs are the handles
+        gEMA hands out to clients.
+
+        Args:
+            identifier: Either a simulation ID or a process ID
+            kind: How to interpret the identifier: "sim_id", "pid" or "auto"
+
+        Returns:
+            GemaSimulation|None: The matching simulation, or None if not found
+
+        Raises:
+            ValueError: If kind is not one of ID_KINDS
+        """
+        if kind not in self.ID_KINDS:
+            raise ValueError(
+                f"Invalid identifier kind '{kind}'. Use one of: {', '.join(self.ID_KINDS)}."
+            )
+
+        with self._lock:
+            if kind in ("auto", "sim_id"):
+                sim = self._lookup(identifier)
+                if sim is not None or kind == "sim_id":
+                    return sim
+            return self._lookup_pid(identifier)
 
-    def manage_simulation(self, identifier: int, command: str) -> str:
+    def manage_simulation(
+        self, identifier: int, command: str, kind: str = "auto"
+    ) -> str:
         """
         Control and monitor a running simulation process.
 
@@ -210,6 +1116,8 @@ class GemaSimulationManager:
                     'pause': Temporarily suspend the simulation
                     'resume': Continue a paused simulation
                     'kill': Terminate the simulation
+            kind: How to interpret the identifier: "sim_id", "pid" or "auto"
+                  (default). With "auto", a matching sim_id takes precedence.
 
         Returns:
             str: A message describing the result of the management command
@@ -218,6 +1126,10 @@ class GemaSimulationManager:
             - Current state (running/paused/terminated)
             - Runtime duration
 
+        Simulations that are still queued report their queue position for
+        'status', and 'kill' removes them from the queue. Simulations that have
+        already exited report their final state.
+
         Error conditions:
             - Invalid identifier: Returns "Invalid sim_id or pid"
             - Process not found: Returns "No such process; it may have already terminated"
@@ -225,9 +1137,20 @@ class GemaSimulationManager:
             - Invalid command: Returns list of valid commands
             - Other errors: Returns error description
         """
-        valid_pid = self._valid_id_or_pid(identifier)
-        if not valid_pid:
+        try:
+            saved_sim = self._resolve_simulation(identifier, kind)
+        except ValueError as e:
+            return str(e)
+
+        if saved_sim is not None and saved_sim.status == SimStatus.QUEUED:
+            return self._manage_queued_simulation(saved_sim, command)
+
+        if saved_sim is not None and saved_sim.status in SimStatus.DONE:
+            return self._describe_exit(saved_sim)
+
+        if saved_sim is None or saved_sim.pid is None:
             return "Invalid sim_id or pid"
+        valid_pid = saved_sim.pid
 
         try:
             process = psutil.Process(valid_pid)
@@ -242,7 +1165,11 @@ class GemaSimulationManager:
                 )
                 if status == psutil.STATUS_ZOMBIE:
                     state = "terminated (zombie state)"
-                return f"Simulation with PID {valid_pid} is {state}. Runtime: {runtime}."
+                response = f"Simulation with PID {valid_pid} is {state}. Runtime: {runtime}."
+                sample = self.root.metrics.get_latest(saved_sim.sim_id)
+                if sample is not None:
+                    response += f" CPU: {sample['cpu_percent']:.1f}%, RSS: {sample['rss'] / 2**20:.1f} MiB."
+                return response
 
             # Pause Command
             elif command == "pause":
@@ -261,8 +1188,19 @@ class GemaSimulationManager:
             # Kill Command
             elif command == "kill":
                 if process.is_running():
-                    process.terminate()
-                    process.wait(timeout=5)
+                    with self._lock:
+                        saved_sim.status = SimStatus.KILLED
+                        self._persist(saved_sim)
+                        process.terminate()
+                        # A paused process only acts on the signal once resumed
+                        if process.status() == psutil.STATUS_STOPPED:
+                            process.send_signal(signal.SIGCONT)
+                        # The scheduler reaps the child; wait until it has
+                        if not self._exited.wait_for(
+                            lambda: saved_sim.exit_code is not None,
+                            timeout=5,
+                        ):
+                            raise psutil.TimeoutExpired(5, valid_pid)
                     return f"Simulation with PID {valid_pid} terminated."
                 return f"Simulation with PID {valid_pid} is not running."
 
@@ -275,3 +1213,65 @@ class GemaSimulationManager:
             return f"Operation on simulation with PID {valid_pid} timed out."
         except Exception as e:
             return f"An error occurred: {e}"
+
+    def _describe_exit(self, sim: GemaSimulation) -> str:
+        """
+        Describe the final state of a simulation that is no longer running.
+
+        Args:
+            sim: The simulation to describe
+
+        Returns:
+            str: The final status, with the exit code, end time, final tick and
+                 exit cause where they are known
+        """
+        details = [
+            f"{name} {value}"
+            for name, value in (
+                ("exit code", sim.exit_code),
+                ("ended on", sim.ended_on),
+                ("final tick", sim.final_tick),
+                ("exit cause", sim.exit_cause),
+                ("ended by", sim.ended_by),
+            )
+            if value is not None
+        ]
+        if not details:
+            return f"Simulation {sim.sim_id} is {sim.status}."
+        return f"Simulation {sim.sim_id} is {sim.status}: {', '.join(details)}."
+
+    def _manage_queued_simulation(
+        self, sim: GemaSimulation, command: str
+    ) -> str:
+        """
+        Handle a management command for a simulation that has not started yet.
+
+        Args:
+            sim: The queued simulation
+            command: The management command to execute
+
+        Returns:
+            str: A message describing the result of the management command
+        """
+        with self._lock:
+            if sim.status != SimStatus.QUEUED:
+                return f"Simulation {sim.sim_id} is {sim.status}."
+
+            # Simulations are briefly off the queue while they are started
+            queued = sim in self._queue
+            if command == "status":
+                if not queued:
+                    return f"Simulation {sim.sim_id} is starting."
+                position = self._queue.index(sim) + 1
+                return f"Simulation {sim.sim_id} is queued at position {position} of {len(self._queue)}."
+            elif command == "kill":
+                sim.status = SimStatus.CANCELLED
+                self._persist(sim)
+                if not queued:
+                    return f"Simulation {sim.sim_id} cancelled while starting."
+                self._queue.remove(sim)
+                return f"Simulation {sim.sim_id} removed from the queue."
+            elif command in ("pause", "resume"):
+                return f"Simulation {sim.sim_id} is queued and has not started yet."
+            else:
+                return "Invalid command. Use 'status', 'pause', 'resume', or 'kill'."
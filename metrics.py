@@ -0,0 +1,184 @@
+# ----------------------------------------------------------------------------
+# File: <metrics>.py
+#
+# Description:
+# <Samples host metrics of running gem5 simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import threading
+import time
+from collections import deque
+
+import psutil
+
+
+class GemaMetricsSampler:
+    """A background sampler of the host resource usage of running simulations.
+
+    A single thread wakes up every ``interval`` seconds and takes one psutil
+    sample of every running gem5 process: CPU utilization, resident memory,
+    bytes read and written, and context switches. Samples are kept in a
+    fixed-size ring buffer per simulation, so memory use is bounded no matter
+    how long a simulation runs.
+
+    The series of a simulation outlives its process, so it can still be
+    inspected after a crash. Only the series of the most recent MAX_SERIES
+    simulations are kept.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+        interval (float): Seconds between two samples.
+        history (int): Number of samples kept per simulation.
+    """
+
+    # Field names of a sample, in the order they are stored
+    FIELDS = (
+        "time",
+        "cpu_percent",
+        "rss",
+        "read_bytes",
+        "write_bytes",
+        "ctx_switches",
+    )
+    # Number of simulations whose series are retained
+    MAX_SERIES = 1000
+
+    def __init__(
+        self, root: Gema, interval: float = 1.0, history: int = 600
+    ) -> None:
+        """Start the sampler thread.
+
+        Args:
+            root (Gema): Reference to the root Gema object.
+            interval (float): Seconds between two samples.
+            history (int): Number of samples kept per simulation.
+        """
+        self.root = root
+        self.interval = interval
+        self.history = history
+        self._lock = threading.Lock()
+        # sim_id -> ring buffer of sample tuples, oldest simulation first
+        self._series: dict[int, deque[tuple]] = {}
+        # sim_id -> (pid, psutil.Process) of the simulations being sampled
+        self._processes: dict[int, tuple[int, psutil.Process]] = {}
+        self._thread = threading.Thread(
+            target=self._sample_loop, name="gema-metrics", daemon=True
+        )
+        self._thread.start()
+
+    def get_metrics(
+        self, sim_id: int, since: Optional[float] = None
+    ) -> Optional[list[dict]]:
+        """Return the recorded samples of a simulation.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+            since (Optional[float]): Only return samples taken after this Unix
+                                   timestamp.
+
+        Returns:
+            Optional[list[dict]]: The samples in chronological order, or None if
+                                nothing has been recorded for the simulation.
+        """
+        with self._lock:
+            series = self._series.get(sim_id)
+            if series is None:
+                return None
+            samples = list(series)
+
+        if since is not None:
+            samples = [sample for sample in samples if sample[0] > since]
+        return [dict(zip(self.FIELDS, sample)) for sample in samples]
+
+    def get_latest(self, sim_id: int) -> Optional[dict]:
+        """Return the most recent sample of a simulation, or None."""
+        with self._lock:
+            series = self._series.get(sim_id)
+            if not series:
+                return None
+            return dict(zip(self.FIELDS, series[-1]))
+
+    def _sample_loop(self) -> None:
+        """Take a sample every interval. Runs forever on the sampler thread."""
+        while True:
+            started = time.monotonic()
+            try:
+                self._sample()
+            except Exception as e:
+                print(f"Metrics sampling failed: {e}")
+            elapsed = time.monotonic() - started
+            time.sleep(max(self.interval - elapsed, 0.0))
+
+    def _sample(self) -> None:
+        """Take one sample of every running simulation."""
+        running = self.root.manager.get_running_pids()
+
+        # Forget the handles of exited simulations, and create handles for
+        # new ones. A handle is kept across samples since cpu_percent()
+        # measures utilization since the previous call on the same handle.
+        for sim_id in list(self._processes):
+            if self._processes[sim_id][0] != running.get(sim_id):
+                del self._processes[sim_id]
+        for sim_id, pid in running.items():
+            if sim_id not in self._processes:
+                try:
+                    process = psutil.Process(pid)
+                    process.cpu_percent(None)
+                except psutil.Error:
+                    continue
+                self._processes[sim_id] = (pid, process)
+
+        now = time.time()
+        samples = {}
+        for sim_id, (_, process) in self._processes.items():
+            try:
+                with process.oneshot():
+                    cpu = process.cpu_percent(None)
+                    rss = process.memory_info().rss
+                    ctx = process.num_ctx_switches()
+                    try:
+                        io = process.io_counters()
+                        read_bytes, write_bytes = io.read_bytes, io.write_bytes
+                    except (psutil.AccessDenied, AttributeError):
+                        # Not available on every platform
+                        read_bytes = write_bytes = None
+            except psutil.Error:
+                # Exited since the scheduler last reaped
+                continue
+            samples[sim_id] = (
+                now,
+                cpu,
+                rss,
+                read_bytes,
+                write_bytes,
+                ctx.voluntary + ctx.involuntary,
+            )
+
+        with self._lock:
+            for sim_id, sample in samples.items():
+                series = self._series.get(sim_id)
+                if series is None:
+                    series = self._series[sim_id] = deque(maxlen=self.history)
+                series.append(sample)
+            # Drop the oldest series of simulations that are no longer running
+            excess = len(self._series) - self.MAX_SERIES
+            for sim_id in list(self._series):
+                if excess <= 0:
+                    break
+                if sim_id not in running:
+                    del self._series[sim_id]
+                    excess -= 1
@@ -14,59 +14,83 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Any, Optional
 
 if TYPE_CHECKING:
     from gem5.utils.gema import Gema
 
+import hashlib
 import inspect
+import json
+import threading
+from dataclasses import fields
 
-from gem5.components import *
-from gem5.components.boards.simple_board import SimpleBoard
-from gem5.components.boards.x86_board import X86Board
-from gem5.components.boards.arm_board import ArmBoard
-from gem5.components.cachehierarchies.classic.no_cache import NoCache
-from gem5.components.cachehierarchies.classic.private_l1_cache_hierarchy import (
-    PrivateL1CacheHierarchy,
+from gem5.utils.gema.exits import (
+    EXIT_ACTIONS,
+    EXIT_EVENTS,
+    SWITCH_EVENTS,
+    check_exit_handlers,
 )
-from gem5.components.cachehierarchies.classic.private_l1_private_l2_cache_hierarchy import (
-    PrivateL1PrivateL2CacheHierarchy,
+from gem5.utils.gema.identity import gem5_build_identity
+from gem5.utils.gema.rpc_data import (
+    GemaBoard,
+    GemaBudget,
+    GemaCache,
+    GemaConfiguration,
+    GemaExitHandlers,
+    GemaMemory,
+    GemaProcessor,
 )
-from gem5.components.cachehierarchies.classic.private_l1_shared_l2_cache_hierarchy import (
-    PrivateL1SharedL2CacheHierarchy,
-)
-from gem5.components.memory import *
-from gem5.components.memory import (
-    multi_channel,
-    single_channel,
-)
-from gem5.components.processors.cpu_types import *
-from gem5.components.processors.cpu_types import get_cpu_types_str_set
-from gem5.components.processors.simple_processor import SimpleProcessor
-from gem5.resources.resource import *
-from gem5.utils.gema.rpc_data import *
 
 
 class GemaOptionRetreiver:
     """A class responsible for discovering and retrieving available gem5 configuration options.
 
-    This class introspectively examines the gem5 library to identify valid configuration
-    options for different simulation components, including memory channels, cache
-    hierarchies, processors, and boards. It provides a centralized way to discover
-    what options are available for configuring a gem5 simulation.
+    This class introspectively examines the components in the shared
+    GemaComponentRegistry to identify valid configuration options for boards,
+    processors, memory and cache hierarchies. It provides a centralized way to
+    discover what options are available for configuring a gem5 simulation.
+    Because the configuration generator constructs gem5 objects from the same
+    registry, every advertised option can also be built.
 
     Attributes:
         root (Gema): Reference to the root Gema object.
+        registry (GemaComponentRegistry): The registry the options come from.
         single_channel_memory (list[str]): List of available single-channel memory configurations.
         multi_channel_memory (list[str]): List of available multi-channel memory configurations.
         cache_types (list[str]): List of supported cache hierarchy types.
+
+    Note:
+        The option tree only depends on the gem5 build, so it is discovered once,
+        on first use, together with its serialized JSON form and a version tag.
+        Both are reused until the gem5 build identity changes.
     """
 
+    _COMPONENTS = {
+        "board": GemaBoard,
+        "processor": GemaProcessor,
+        "memory": GemaMemory,
+        "cache": GemaCache,
+        "budget": GemaBudget,
+        "exit_handlers": GemaExitHandlers,
+    }
+    # GemaProcessor fields that only apply to switchable processors
+    _SWITCH_PARAMETERS = ("switch_after_insts", "switch_on")
+    # GemaCache fields that are passed on to the cache hierarchy constructor
+    _CACHE_PARAMETERS = (
+        "l1d_size",
+        "l1i_size",
+        "l2_size",
+        "l1d_assoc",
+        "l1i_assoc",
+        "l2_assoc",
+    )
+
     def __init__(self, root: Gema) -> None:
         """Initialize the gem5 configuration option retriever.
 
-        This constructor uses introspection to discover available memory configurations
-        and initializes the list of supported cache hierarchy types.
+        This constructor reads the available memory configurations and supported
+        cache hierarchy types from the component registry of the root object.
 
         Args:
             root (Gema): Reference to the root Gema object that this retriever is
@@ -74,25 +98,13 @@ class GemaOptionRetreiver:
                         discovery process.
         """
         self.root = root
-        # Discover available single-channel memory configurations through introspection
-        self.single_channel_memory = [
-            name
-            for name, obj in inspect.getmembers(single_channel)
-            if inspect.isfunction(obj)
-        ]
-        # Discover available multi-channel memory configurations through introspection
-        self.multi_channel_memory = [
-            name
-            for name, obj in inspect.getmembers(multi_channel)
-            if inspect.isfunction(obj)
-        ]
-        # Define supported cache hierarchy types
-        self.cache_types = [
-            "NoCache",
-            "PrivateL1SharedL2CacheHierarchy",
-            "PrivateL1PrivateL2CacheHierarchy",
-            "PrivateL1CacheHierarchy",
-        ]
+        self.registry = root.registry
+        self.single_channel_memory = list(self.registry.single_channel_memory)
+        self.multi_channel_memory = list(self.registry.multi_channel_memory)
+        self.cache_types = self.registry.names("cache")
+        # (build identity, options, version, serialized options)
+        self._options_cache = None
+        self._options_lock = threading.Lock()
 
     def _get_init_parameters(self, *classes):
         """Extract initialization parameters from the provided classes.
@@ -126,10 +138,53 @@ class GemaOptionRetreiver:
         }
 
     def get_config_options(self):
-        """Retrieve all available configuration options from the gem5 library.
+        """Retrieve the available configuration options, discovering them on first use.
+
+        Returns:
+            dict: The option tree described in ``discover_config_options``, or None
+                 if discovery failed. The returned dictionary is shared between
+                 callers and must not be modified.
+        """
+        return self._cached_options()[1]
+
+    def get_config_options_payload(self) -> tuple[str, str]:
+        """Retrieve the serialized configuration options and their version tag.
+
+        The version tag is a digest of the serialized options, so it only changes
+        when the options themselves change.
+
+        Returns:
+            tuple[str, str]: The version tag and the options serialized as JSON.
+        """
+        _, _, version, payload = self._cached_options()
+        return version, payload
+
+    def _cached_options(self) -> tuple:
+        """Return the cached options entry, rebuilding it if the gem5 build changed."""
+        build_id = gem5_build_identity()
+        cached = self._options_cache
+        if cached is not None and cached[0] == build_id:
+            return cached
+
+        with self._options_lock:
+            cached = self._options_cache
+            if cached is not None and cached[0] == build_id:
+                return cached
+
+            options = self.discover_config_options()
+            payload = json.dumps(options, indent=4)
+            version = hashlib.sha256(payload.encode()).hexdigest()[:16]
+            entry = (build_id, options, version, payload)
+            # A failed discovery is not cached so that it is retried
+            if options is not None:
+                self._options_cache = entry
+            return entry
+
+    def discover_config_options(self):
+        """Discover all available configuration options from the gem5 library.
 
         This method performs a comprehensive discovery of configuration options by:
-        1. Loading available cache classes based on supported types
+        1. Taking the board, processor and cache classes from the component registry
         2. Inspecting board, processor, and cache classes for their parameters
         3. Organizing the options into a structured configuration dictionary
 
@@ -141,9 +196,18 @@ class GemaOptionRetreiver:
                          'board': [parameters],
                          'memory': [available_memory_types],
                          'processor': [available_cpu_types],
+                         'processor_types': {
+                             'ProcessorType': [extra_processor_fields],
+                             ...
+                         },
+                         'switch_on': [exit_events_to_switch_cpus_at],
                          'cache_hierarchy': {
                              'CacheType': [parameters],
                              ...
+                         },
+                         'exit_handlers': {
+                             'events': [configurable_exit_events],
+                             'actions': [available_actions]
                          }
                      },
                      ...
@@ -154,36 +218,43 @@ class GemaOptionRetreiver:
             - The method handles both KeyError and general exceptions silently,
               returning None in case of any error
             - Memory types include both single and multi-channel configurations
-            - Processor types are obtained from gem5's CPU type registry
+            - Processor types are the CPU types known to the component registry.
+              Switchable processors start on the atomic CPU and switch to the
+              configured one, and take the extra switch fields
             - Cache parameters are collected for all supported cache hierarchy types
         """
-        cache_classes = [
-            globals()[name] for name in self.cache_types if name in globals()
-        ]
         classes_to_inspect = [
-            SimpleBoard,
-            X86Board,
-            ArmBoard,
-            SimpleProcessor,
-            *cache_classes,
+            *self.registry.boards.values(),
+            *self.registry.processors.values(),
+            *self.registry.caches.values(),
         ]
 
         try:
             class_params = self._get_init_parameters(*classes_to_inspect)
             config = {}
 
-            for board_class in [SimpleBoard, X86Board, ArmBoard]:
-                board_name = board_class.__name__
+            for board_name in self.registry.boards:
                 config[board_name] = {
                     "board": class_params[board_name][0],
                     "memory": self.single_channel_memory
                     + self.multi_channel_memory,
-                    "processor": list(get_cpu_types_str_set()),
+                    "processor": self.registry.names("cpu"),
+                    "processor_types": {
+                        name: list(self._SWITCH_PARAMETERS)
+                        if name in self.registry.switchable_processors
+                        else []
+                        for name in self.registry.processors
+                    },
+                    "switch_on": list(SWITCH_EVENTS),
                     "cache_hierarchy": {
                         name: class_params[name]
                         for name in self.cache_types
                         if name in class_params
                     },
+                    "exit_handlers": {
+                        "events": list(EXIT_EVENTS),
+                        "actions": list(EXIT_ACTIONS),
+                    },
                 }
             return config
         except KeyError:
@@ -192,3 +263,292 @@ class GemaOptionRetreiver:
         except Exception:
             # Handle any other unexpected errors during configuration discovery
             pass
+
+    def check_component(
+        self, name: str, component: Any, partial: bool = False
+    ) -> list[dict]:
+        """Check one component of a configuration.
+
+        Names are checked against the component registry, and cache and memory
+        parameters against the constructor signatures of the gem5 objects that
+        will be built from them.
+
+        Args:
+            name (str): "board", "processor", "memory", "cache", "budget",
+                "exit_handlers" or "resource".
+            component (Any): The GemaBoard, GemaProcessor, GemaMemory,
+                GemaCache, GemaBudget or GemaExitHandlers to check, or the
+                ``{"name", "version"}`` of a resource, as in ``add_config``.
+            partial (bool): If True, fields that are not set yet are not
+                reported. Used for configurations that are still being built.
+
+        Returns:
+            list[dict]: One ``{"field", "message"}`` entry per problem found.
+        """
+        problems = []
+
+        def report(attr, message):
+            problems.append({"field": f"{name}.{attr}", "message": message})
+
+        def check_name(attr, kind):
+            value = getattr(component, attr)
+            if value is None:
+                if not partial:
+                    report(attr, f"No {kind} type is set.")
+            elif self.registry.lookup(kind, value) is None:
+                known = ", ".join(self.registry.names(kind))
+                report(attr, f"Unknown {kind} type '{value}'. Known: {known}.")
+
+        def check_positive(attr, required=True):
+            value = getattr(component, attr)
+            if value is None:
+                if required and not partial:
+                    report(attr, f"{attr} is not set.")
+            elif (
+                isinstance(value, bool)
+                or not isinstance(value, (int, float))
+                or value <= 0
+            ):
+                report(attr, f"{attr} must be greater than 0, got {value!r}.")
+
+        if name == "board":
+            check_name("type", "board")
+            check_positive("clk")
+        elif name == "processor":
+            check_name("type", "processor")
+            check_name("isa", "isa")
+            check_name("cpu", "cpu")
+            check_positive("ncores")
+            if isinstance(component.ncores, float):
+                report("ncores", "ncores must be an integer.")
+            problems.extend(self._check_switch_parameters(component, partial))
+        elif name == "memory":
+            check_name("type", "memory")
+            check_positive("size")
+            if self.registry.lookup("memory", component.type) is not None:
+                accepted = self.registry.accepted_parameters(
+                    "memory", component.type
+                )
+                if accepted is not None and "size" not in accepted:
+                    report("type", f"{component.type} does not take a size.")
+        elif name == "cache":
+            check_name("type", "cache")
+            for attr in self._CACHE_PARAMETERS:
+                check_positive(attr, required=False)
+            if self.registry.lookup("cache", component.type) is not None:
+                problems.extend(self._check_cache_parameters(component, partial))
+        elif name == "budget":
+            # Every limit is optional
+            for attr in ("max_ticks", "max_insts", "timeout"):
+                check_positive(attr, required=False)
+            for attr in ("max_ticks", "max_insts"):
+                if isinstance(getattr(component, attr), float):
+                    report(attr, f"{attr} must be an integer.")
+        elif name == "exit_handlers":
+            problems.extend(check_exit_handlers(component))
+        elif name == "resource":
+            problems.extend(self._check_resource(component, partial))
+        return problems
+
+    def _check_resource(self, resource: dict, partial: bool) -> list[dict]:
+        """Check the name and version of a resource, and that it exists."""
+        name, version = resource.get("name"), resource.get("version")
+        if name is None:
+            if partial:
+                return []
+            return [{"field": "resource.name", "message": "No resource is set."}]
+        if not isinstance(name, str) or not name:
+            return [
+                {
+                    "field": "resource.name",
+                    "message": f"Resource names must be non-empty strings, got {name!r}.",
+                }
+            ]
+        if version is not None and not isinstance(version, str):
+            return [
+                {
+                    "field": "resource.version",
+                    "message": f"Resource versions must be strings, got {version!r}.",
+                }
+            ]
+        problem = self.root.resources.check(name, version)
+        if problem is not None:
+            return [{"field": "resource.name", "message": problem}]
+        return []
+
+    def _check_switch_parameters(
+        self, processor: Any, partial: bool
+    ) -> list[dict]:
+        """Check the CPU switch fields of a processor."""
+        problems = []
+
+        def report(attr, message):
+            problems.append({"field": f"processor.{attr}", "message": message})
+
+        given = [
+            attr
+            for attr in self._SWITCH_PARAMETERS
+            if getattr(processor, attr) is not None
+        ]
+        if processor.type not in self.registry.switchable_processors:
+            for attr in given:
+                report(attr, f"{attr} only applies to switchable processors.")
+            return problems
+
+        if not given and not partial:
+            report(
+                "switch_after_insts",
+                f"{processor.type} needs switch_after_insts or switch_on.",
+            )
+        insts = processor.switch_after_insts
+        if insts is not None and (
+            isinstance(insts, bool) or not isinstance(insts, int) or insts <= 0
+        ):
+            report(
+                "switch_after_insts",
+                f"switch_after_insts must be a positive integer, got {insts!r}.",
+            )
+        if processor.switch_on is not None and processor.switch_on not in SWITCH_EVENTS:
+            known = ", ".join(SWITCH_EVENTS)
+            report(
+                "switch_on",
+                f"Unknown switch event '{processor.switch_on}'. Known: {known}.",
+            )
+        start = self.registry.SWITCH_FROM_CPU
+        if self.registry.lookup("cpu", processor.cpu) == start:
+            report(
+                "cpu",
+                f"{processor.type} starts on the {start.value} CPU and must switch to another one.",
+            )
+        return problems
+
+    def _check_cache_parameters(self, cache: Any, partial: bool) -> list[dict]:
+        """Check cache fields against the cache hierarchy constructor."""
+        accepted = self.registry.accepted_parameters("cache", cache.type)
+        required = self.registry.required_parameters("cache", cache.type)
+        # Zero or unset values are not passed to the constructor
+        given = {attr for attr in self._CACHE_PARAMETERS if getattr(cache, attr)}
+
+        problems = []
+        for attr in self._CACHE_PARAMETERS:
+            if attr in given and accepted is not None and attr not in accepted:
+                problems.append(
+                    {
+                        "field": f"cache.{attr}",
+                        "message": f"{cache.type} does not take {attr}.",
+                    }
+                )
+            elif attr in required and attr not in given and not partial:
+                problems.append(
+                    {
+                        "field": f"cache.{attr}",
+                        "message": f"{cache.type} requires {attr}.",
+                    }
+                )
+        return problems
+
+    def check_configuration(self, config: GemaConfiguration) -> list[dict]:
+        """Check that a configuration is complete and can be built.
+
+        Args:
+            config (GemaConfiguration): The configuration to check.
+
+        Returns:
+            list[dict]: One ``{"field", "message"}`` entry per problem found. An
+                       empty list means the configuration is runnable.
+        """
+        problems = []
+        for name in self._COMPONENTS:
+            problems.extend(self.check_component(name, getattr(config, name)))
+
+        required_isa = self.registry.board_isas.get(config.board.type)
+        isa = self.registry.lookup("isa", config.processor.isa)
+        if required_isa is not None and isa is not None and isa != required_isa:
+            problems.append(
+                {
+                    "field": "processor.isa",
+                    "message": f"{config.board.type} requires the {required_isa.value} ISA, got '{config.processor.isa}'.",
+                }
+            )
+        switch_insts = config.processor.switch_after_insts
+        max_insts = config.budget.max_insts
+        if (
+            isinstance(switch_insts, int)
+            and isinstance(max_insts, int)
+            and max_insts <= switch_insts
+        ):
+            problems.append(
+                {
+                    "field": "budget.max_insts",
+                    "message": f"max_insts must exceed processor.switch_after_insts ({switch_insts}), or the run ends before the CPUs switch.",
+                }
+            )
+        if not config.resource:
+            problems.append(
+                {"field": "resource", "message": "No resource is set."}
+            )
+        return problems
+
+    def check_config_data(self, data: Any, complete: bool = False) -> list[dict]:
+        """Check configuration data in the dictionary format of ``add_config``.
+
+        Args:
+            data (Any): The configuration dictionary.
+            complete (bool): If True, the data must describe a runnable
+                configuration. Otherwise only the fields that are given are
+                checked.
+
+        Returns:
+            list[dict]: One ``{"field", "message"}`` entry per problem found.
+        """
+        if not isinstance(data, dict):
+            return [{"field": "", "message": "Configuration data must be a dict."}]
+
+        problems = []
+        for key in data:
+            if key != "resource" and key not in self._COMPONENTS:
+                problems.append(
+                    {"field": key, "message": f"Unknown section '{key}'."}
+                )
+
+        sections = dict(self._COMPONENTS, resource=None)
+        for key, cls in sections.items():
+            section = data.get(key, {})
+            if not isinstance(section, dict):
+                problems.append(
+                    {"field": key, "message": f"Section '{key}' must be a dict."}
+                )
+                continue
+            allowed = (
+                ("name", "version") if cls is None else [f.name for f in fields(cls)]
+            )
+            for attr in section:
+                if attr not in allowed:
+                    problems.append(
+                        {
+                            "field": f"{key}.{attr}",
+                            "message": f"Unknown field '{attr}'.",
+                        }
+                    )
+        if problems:
+            return problems
+
+        config = GemaConfiguration(
+            config_id=0,
+            resource=data.get("resource", {}).get("name"),
+            **{
+                key: cls(**data.get(key, {}))
+                for key, cls in self._COMPONENTS.items()
+            },
+        )
+        # A missing resource is reported by check_configuration
+        problems = self.check_component(
+            "resource", data.get("resource", {}), partial=True
+        )
+        if complete:
+            return self.check_configuration(config) + problems
+        for key in self._COMPONENTS:
+            problems.extend(
+                self.check_component(key, getattr(config, key), partial=True)
+            )
+        return problems
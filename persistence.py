@@ -0,0 +1,424 @@
+# ----------------------------------------------------------------------------
+# File: <persistence>.py
+#
+# Description:
+# <Crash-safe on-disk store for gEMA configurations and simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import hashlib
+import json
+import sqlite3
+import threading
+from dataclasses import (
+    asdict,
+    dataclass,
+    field,
+    fields,
+)
+from pathlib import Path
+from typing import Optional
+
+from gem5.utils.gema.index import GemaConfigIndex
+from gem5.utils.gema.rpc_data import (
+    GemaCachedResult,
+    GemaConfiguration,
+    GemaSimulation,
+    GemaSweep,
+    SimStatus,
+)
+
+# Indexed configuration fields, stored in their own columns
+_CONFIG_COLUMNS = tuple(
+    name.replace(".", "_") for name in GemaConfigIndex.INDEXED_FIELDS
+)
+# Every simulation field but the configuration snapshot, in field order
+_SIM_COLUMNS = tuple(
+    f.name for f in fields(GemaSimulation) if f.name != "config"
+)
+# Simulation fields stored as JSON, and booleans, which SQLite returns as ints
+_SIM_DECODERS = {"cpus": json.loads, "checkpoint_restored": bool}
+
+_SCHEMA = f"""
+CREATE TABLE IF NOT EXISTS configs (
+    seq INTEGER PRIMARY KEY AUTOINCREMENT,
+    config_id INTEGER NOT NULL UNIQUE,
+    {", ".join(_CONFIG_COLUMNS)},
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS config_snapshots (
+    key TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS sims (
+    sim_id INTEGER PRIMARY KEY,
+    config_id INTEGER NOT NULL,
+    config_key TEXT NOT NULL REFERENCES config_snapshots (key),
+    {", ".join(_SIM_COLUMNS[1:])}
+);
+CREATE INDEX IF NOT EXISTS sims_config_id ON sims (config_id);
+CREATE INDEX IF NOT EXISTS sims_status ON sims (status);
+CREATE INDEX IF NOT EXISTS sims_pid ON sims (pid);
+CREATE INDEX IF NOT EXISTS sims_config_hash ON sims (config_hash);
+CREATE TABLE IF NOT EXISTS sweeps (
+    sweep_id INTEGER PRIMARY KEY,
+    data TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS results (
+    config_hash TEXT PRIMARY KEY,
+    data TEXT NOT NULL
+);
+"""
+
+# Most IDs bound to a single query, below SQLite's variable limit
+_BATCH = 900
+
+
+@dataclass
+class GemaStateSnapshot:
+    """What is loaded from the state store at startup.
+
+    Only the IDs of stored configurations and simulations are read, along
+    with the simulations that were still queued or running. Everything else
+    is loaded from the store when it is first used.
+    """
+
+    config_ids: list[int] = field(default_factory=list)
+    sim_ids: list[int] = field(default_factory=list)
+    active_sims: list[GemaSimulation] = field(default_factory=list)
+    sweeps: list[GemaSweep] = field(default_factory=list)
+
+
+class GemaStateStore:
+    """A write-through SQLite store for configurations, simulations and sweeps.
+
+    The in-memory structures of the configurator, manager, sweeper and result
+    cache stay the hot path. Every mutation is additionally written through
+    to this store in its own transaction, so the state on disk is consistent
+    after a crash. The database runs in WAL mode with ``synchronous=NORMAL``,
+    which keeps each write cheap while still surviving a process crash.
+
+    Simulations are stored one field per column, the queried ones indexed.
+    Their configuration snapshot is stored once per distinct content in
+    ``config_snapshots`` and referenced by its SHA-256 digest. Configurations
+    keep their indexed fields in columns next to the JSON document.
+
+    Startup only reads IDs, so it takes well under a second even with 100k
+    configurations and simulations. Stored configurations, simulations and
+    cached results are then loaded on first use by ``load_configs``,
+    ``load_sims`` and ``load_result``.
+
+    When constructed without a path the store is disabled and every method is
+    a no-op, so callers never need to check whether persistence is enabled.
+    """
+
+    def __init__(self, path: Optional[Path] = None) -> None:
+        """Open (and create, if needed) the state database.
+
+        Args:
+            path (Optional[Path]): Location of the SQLite database. If None,
+                                 nothing is persisted.
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._conn = None
+        if path is None:
+            return
+
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(
+            str(path), check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._create_tables()
+
+    @property
+    def enabled(self) -> bool:
+        return self._conn is not None
+
+    def close(self) -> None:
+        """Close the database connection."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def load(self) -> GemaStateSnapshot:
+        """Load what is needed at startup.
+
+        Returns:
+            GemaStateSnapshot: The IDs of the stored configurations (in
+                             insertion order) and simulations, the queued and
+                             running simulations, and the sweeps (in ID order).
+        """
+        snapshot = GemaStateSnapshot()
+        if not self.enabled:
+            return snapshot
+
+        with self._lock:
+            rows = self._conn.execute
+            snapshot.config_ids = [
+                config_id
+                for (config_id,) in rows("SELECT config_id FROM configs ORDER BY seq")
+            ]
+            snapshot.sim_ids = [
+                sim_id for (sim_id,) in rows("SELECT sim_id FROM sims ORDER BY sim_id")
+            ]
+            snapshot.sweeps = [
+                GemaSweep(**json.loads(data))
+                for (data,) in rows("SELECT data FROM sweeps ORDER BY sweep_id")
+            ]
+        snapshot.active_sims = self._select_sims(
+            "s.status IN (?, ?)", (SimStatus.QUEUED, SimStatus.RUNNING)
+        )
+        return snapshot
+
+    def load_configs(
+        self, config_ids: Optional[list[int]] = None
+    ) -> dict[int, GemaConfiguration]:
+        """Load stored configurations.
+
+        Args:
+            config_ids (Optional[list[int]]): The configurations to load, or
+                                            None for all of them.
+
+        Returns:
+            dict[int, GemaConfiguration]: The configurations found, by ID.
+        """
+        rows = self._select(
+            "SELECT config_id, data FROM configs", "config_id", config_ids
+        )
+        return {
+            config_id: GemaConfiguration.from_json(data)
+            for config_id, data in rows
+        }
+
+    def load_config_index(self) -> list[tuple]:
+        """Return the indexed fields of every stored configuration.
+
+        Returns:
+            list[tuple]: One ``(config_id, *values)`` row per configuration,
+                        with the values of ``GemaConfigIndex.INDEXED_FIELDS``.
+        """
+        return self._select(
+            f"SELECT config_id, {', '.join(_CONFIG_COLUMNS)} FROM configs"
+        )
+
+    def load_sims(
+        self, sim_ids: Optional[list[int]] = None
+    ) -> list[GemaSimulation]:
+        """Load stored simulations.
+
+        Args:
+            sim_ids (Optional[list[int]]): The simulations to load, or None for
+                                         all of them.
+
+        Returns:
+            list[GemaSimulation]: The simulations found, in ID order.
+        """
+        if sim_ids is None:
+            return self._select_sims()
+        sims = []
+        for start in range(0, len(sim_ids), _BATCH):
+            batch = sim_ids[start : start + _BATCH]
+            sims += self._select_sims(
+                f"s.sim_id IN ({', '.join('?' * len(batch))})", batch
+            )
+        return sorted(sims, key=lambda sim: sim.sim_id)
+
+    def find_sim_ids(self, where: str, params: tuple = ()) -> list[int]:
+        """Return the IDs of the stored simulations matching a condition.
+
+        Args:
+            where (str): An SQL condition on the simulation columns.
+            params (tuple): The parameters of the condition.
+        """
+        rows = self._select(
+            f"SELECT sim_id FROM sims WHERE {where} ORDER BY sim_id",
+            params=params,
+        )
+        return [sim_id for (sim_id,) in rows]
+
+    def load_result(self, config_hash: str) -> Optional[GemaCachedResult]:
+        """Load the cached result of a configuration hash, if there is one."""
+        rows = self._select(
+            "SELECT data FROM results WHERE config_hash = ?", params=(config_hash,)
+        )
+        return GemaCachedResult(**json.loads(rows[0][0])) if rows else None
+
+    def load_results(self) -> list[GemaCachedResult]:
+        """Load all cached results, oldest first."""
+        return [
+            GemaCachedResult(**json.loads(data))
+            for (data,) in self._select("SELECT data FROM results ORDER BY rowid")
+        ]
+
+    def save_configs(self, configs: list[GemaConfiguration]) -> None:
+        """Insert or update configurations, keeping their original order."""
+        columns = ", ".join(("config_id", *_CONFIG_COLUMNS, "data"))
+        updates = ", ".join(
+            f"{name} = excluded.{name}" for name in (*_CONFIG_COLUMNS, "data")
+        )
+        self._write(
+            f"INSERT INTO configs ({columns}) "
+            f"VALUES ({', '.join('?' * (len(_CONFIG_COLUMNS) + 2))}) "
+            f"ON CONFLICT(config_id) DO UPDATE SET {updates}",
+            [
+                (
+                    cfg.config_id,
+                    *GemaConfigIndex.indexed_values(cfg),
+                    cfg.to_json(),
+                )
+                for cfg in configs
+            ],
+        )
+
+    def delete_config(self, config_id: int) -> None:
+        """Remove a configuration."""
+        self._write("DELETE FROM configs WHERE config_id = ?", [(config_id,)])
+
+    def save_sims(self, sims: list[GemaSimulation]) -> None:
+        """Insert or update simulation records."""
+        snapshots, rows = {}, []
+        for sim in sims:
+            config = sim.config_json()
+            key = hashlib.sha256(config.encode()).hexdigest()
+            snapshots[key] = config
+            values = [getattr(sim, name) for name in _SIM_COLUMNS]
+            values[_SIM_COLUMNS.index("path")] = str(sim.path)
+            if sim.cpus is not None:
+                values[_SIM_COLUMNS.index("cpus")] = json.dumps(sim.cpus)
+            rows.append((sim.config.config_id, key, *values))
+        columns = ", ".join(("config_id", "config_key", *_SIM_COLUMNS))
+        self._write(
+            "INSERT OR IGNORE INTO config_snapshots (key, data) VALUES (?, ?)",
+            list(snapshots.items()),
+            f"INSERT OR REPLACE INTO sims ({columns}) "
+            f"VALUES ({', '.join('?' * (len(_SIM_COLUMNS) + 2))})",
+            rows,
+        )
+
+    def save_sweep(self, sweep: GemaSweep) -> None:
+        """Insert or update a sweep record."""
+        self._write(
+            "INSERT OR REPLACE INTO sweeps (sweep_id, data) VALUES (?, ?)",
+            [(sweep.sweep_id, self._encode(asdict(sweep)))],
+        )
+
+    def save_result(self, result: GemaCachedResult) -> None:
+        """Insert or update a result cache entry."""
+        self._write(
+            "INSERT OR REPLACE INTO results (config_hash, data) VALUES (?, ?)",
+            [(result.config_hash, self._encode(asdict(result)))],
+        )
+
+    def delete_result(self, config_hash: str) -> None:
+        """Remove a result cache entry."""
+        self._write(
+            "DELETE FROM results WHERE config_hash = ?", [(config_hash,)]
+        )
+
+    def clear_results(self) -> None:
+        """Remove all result cache entries."""
+        self._write("DELETE FROM results", [()])
+
+    def _write(self, *batches) -> None:
+        """Execute statements for every row inside a single transaction.
+
+        Args:
+            batches: Alternating statements and the lists of rows each of
+                     them is executed for.
+        """
+        pairs = list(zip(batches[::2], batches[1::2]))
+        if not self.enabled or not any(rows for _, rows in pairs):
+            return
+
+        with self._lock:
+            self._conn.execute("BEGIN")
+            try:
+                for statement, rows in pairs:
+                    self._conn.executemany(statement, rows)
+            except Exception:
+                self._conn.execute("ROLLBACK")
+                raise
+            self._conn.execute("COMMIT")
+
+    def _select(
+        self,
+        query: str,
+        column: Optional[str] = None,
+        ids: Optional[list[int]] = None,
+        params: tuple = (),
+    ) -> list[tuple]:
+        """Run a query, restricted to the rows whose ``column`` is in ``ids``.
+
+        Args:
+            query (str): The query, without a WHERE clause if ``ids`` is given.
+            column (Optional[str]): The ID column to restrict.
+            ids (Optional[list[int]]): The IDs to select, or None for all rows.
+            params (tuple): The parameters of the query.
+        """
+        if not self.enabled:
+            return []
+        with self._lock:
+            if ids is None:
+                return self._conn.execute(query, params).fetchall()
+            rows = []
+            for start in range(0, len(ids), _BATCH):
+                batch = ids[start : start + _BATCH]
+                rows += self._conn.execute(
+                    f"{query} WHERE {column} IN ({', '.join('?' * len(batch))})",
+                    batch,
+                ).fetchall()
+            return rows
+
+    def _select_sims(
+        self, where: Optional[str] = None, params: tuple = ()
+    ) -> list[GemaSimulation]:
+        """Load the simulations matching a condition on the ``s`` table alias."""
+        rows = self._select(
+            "SELECT c.data, "
+            + ", ".join(f"s.{name}" for name in _SIM_COLUMNS)
+            + " FROM sims AS s JOIN config_snapshots AS c ON c.key = s.config_key"
+            + (f" WHERE {where}" if where else "")
+            + " ORDER BY s.sim_id",
+            params=tuple(params),
+        )
+        sims = [GemaSimulation(row[1], row[0], *row[2:]) for row in rows]
+        for name, decode in _SIM_DECODERS.items():
+            for sim in sims:
+                value = getattr(sim, name)
+                if value is not None:
+                    setattr(sim, name, decode(value))
+        return sims
+
+    def _create_tables(self) -> None:
+        """Create the tables, adding the columns of new simulation fields.
+
+        Simulation fields added since a store was written get a column of
+        their own, which is NULL for the simulations already stored.
+        """
+        self._conn.executescript(_SCHEMA)
+        sim_columns = self._columns("sims")
+        for name in _SIM_COLUMNS:
+            if name not in sim_columns:
+                self._conn.execute(f"ALTER TABLE sims ADD COLUMN {name}")
+
+    def _columns(self, table: str) -> set[str]:
+        """Return the column names of a table, empty if it does not exist."""
+        return {
+            row[1] for row in self._conn.execute(f"PRAGMA table_info({table})")
+        }
+
+    @staticmethod
+    def _encode(data: dict) -> str:
+        return json.dumps(data, separators=(",", ":"))
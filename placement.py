@@ -0,0 +1,247 @@
+# ----------------------------------------------------------------------------
+# File: <placement>.py
+#
+# Description:
+# <Pins simulation processes to host cores and their local NUMA node>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema.rpc_data import GemaSimulation
+
+import ctypes
+import ctypes.util
+import os
+from pathlib import Path
+
+SYSFS_NODES = Path("/sys/devices/system/node")
+SYSFS_CPUS = Path("/sys/devices/system/cpu")
+
+
+def parse_cpulist(text: str) -> list[int]:
+    """Parse a kernel CPU list such as ``0-3,8,10-11``."""
+    cpus = []
+    for part in text.strip().split(","):
+        if not part:
+            continue
+        first, _, last = part.partition("-")
+        cpus.extend(range(int(first), int(last or first) + 1))
+    return cpus
+
+
+def placement_supported() -> bool:
+    """Return whether processes can be pinned to cores on this host."""
+    return hasattr(os, "sched_setaffinity")
+
+
+def read_host_cores() -> dict[int, list[tuple[int, ...]]]:
+    """Return the physical cores this process may run on, by NUMA node.
+
+    Every physical core is the tuple of its logical CPUs, its SMT siblings.
+    Without NUMA information in sysfs, all cores are reported on node 0.
+
+    Returns:
+        dict[int, list[tuple[int, ...]]]: The cores of every node, in CPU order.
+    """
+    allowed = os.sched_getaffinity(0)
+    node_cpus = {}
+    for node_dir in SYSFS_NODES.glob("node[0-9]*"):
+        try:
+            cpus = parse_cpulist((node_dir / "cpulist").read_text())
+        except (OSError, ValueError):
+            continue
+        node_cpus[int(node_dir.name[len("node") :])] = cpus
+    if not node_cpus:
+        node_cpus = {0: sorted(allowed)}
+
+    nodes = {}
+    for node, cpus in sorted(node_cpus.items()):
+        cores = []
+        seen = set()
+        for cpu in cpus:
+            if cpu not in allowed or cpu in seen:
+                continue
+            core = tuple(sorted(set(_thread_siblings(cpu)) & allowed))
+            seen.update(core)
+            cores.append(core)
+        if cores:
+            nodes[node] = cores
+    return nodes
+
+
+def _thread_siblings(cpu: int) -> list[int]:
+    """Return the logical CPUs sharing a physical core with ``cpu``."""
+    topology = SYSFS_CPUS / f"cpu{cpu}" / "topology"
+    for name in ("core_cpus_list", "thread_siblings_list"):
+        try:
+            return parse_cpulist((topology / name).read_text())
+        except (OSError, ValueError):
+            continue
+    return [cpu]
+
+
+class GemaCorePlacement:
+    """Assigns host cores and a NUMA node to every running simulation.
+
+    Each simulation gets ``cores_per_sim`` physical cores of its own, with
+    their SMT siblings so no other simulation shares them, taken from a
+    single NUMA node whenever one has enough free cores. The node with the
+    most free cores is picked, which spreads simulations across sockets and
+    their memory bandwidth. The cores are returned once the simulation has
+    been reaped.
+
+    The assignment is recorded on the simulation as ``cpus`` and
+    ``numa_node`` and applied by its gem5 child, see ``apply_placement``.
+    The scheduler holds simulations back while no cores are free, so at most
+    ``cores / cores_per_sim`` simulations run at once, whatever
+    ``sim_limit`` is.
+
+    The pinning only takes effect once the child receives its simulation,
+    so anything the child allocated before then is not covered by it. A
+    fresh child is pinned before it builds the board, but a warm worker
+    (see ``GemaWorkerPool``) has already imported gem5 on whichever cores
+    and node it happened to run on. ``numa_set_preferred`` only affects
+    later allocations, so those imported modules stay where they are, and
+    only the board and simulated memory, allocated afterwards, are local.
+
+    Attributes:
+        cores_per_sim (int): Physical cores per simulation. Placement is
+            disabled if 0.
+        nodes (dict[int, list[tuple[int, ...]]]): The usable cores by node.
+    """
+
+    def __init__(self, cores_per_sim: int = 0) -> None:
+        self.cores_per_sim = cores_per_sim
+        self.nodes: dict[int, list[tuple[int, ...]]] = {}
+        if cores_per_sim and not placement_supported():
+            print("Pinning simulations is not supported on this host.")
+            self.cores_per_sim = 0
+        if self.cores_per_sim:
+            self.nodes = read_host_cores()
+            total = sum(len(cores) for cores in self.nodes.values())
+            if self.cores_per_sim > total:
+                raise ValueError(
+                    f"Cannot pin simulations to {self.cores_per_sim} cores; "
+                    f"only {total} are available."
+                )
+        self._free = {node: list(cores) for node, cores in self.nodes.items()}
+        # sim_id -> node and cores assigned to it
+        self._assigned: dict[int, list[tuple[int, tuple[int, ...]]]] = {}
+
+    @property
+    def enabled(self) -> bool:
+        return self.cores_per_sim > 0
+
+    def can_place(self) -> bool:
+        """Return whether another simulation can be assigned cores."""
+        if not self.enabled:
+            return True
+        return sum(map(len, self._free.values())) >= self.cores_per_sim
+
+    def assign(self, sim: GemaSimulation) -> bool:
+        """Assign free cores to a simulation about to be started.
+
+        Args:
+            sim (GemaSimulation): The simulation. Its ``cpus`` and
+                ``numa_node`` are set.
+
+        Returns:
+            bool: False if placement is disabled or no cores are free.
+        """
+        if not self.enabled or not self.can_place():
+            return False
+        need = self.cores_per_sim
+        # Nodes with the most free cores first
+        order = sorted(self._free, key=lambda node: (-len(self._free[node]), node))
+        if len(self._free[order[0]]) >= need:
+            order = order[:1]
+
+        taken = []
+        for node in order:
+            while self._free[node] and len(taken) < need:
+                taken.append((node, self._free[node].pop(0)))
+        self._assigned[sim.sim_id] = taken
+
+        sim.cpus = sorted(cpu for _, core in taken for cpu in core)
+        spanned = {node for node, _ in taken}
+        # Memory is only bound when all cores are local to it
+        sim.numa_node = spanned.pop() if len(spanned) == 1 else None
+        return True
+
+    def release(self, sim: GemaSimulation) -> None:
+        """Return the cores of a simulation that has exited or failed to start."""
+        for node, core in self._assigned.pop(sim.sim_id, []):
+            self._free[node].append(core)
+            self._free[node].sort()
+
+    def get_status(self) -> Optional[dict]:
+        """Return the cores of every node and how many of them are free.
+
+        Returns:
+            Optional[dict]: The cores per simulation and, by node, the
+                           ``cpus`` and the number of ``free_cores``, or None
+                           if placement is disabled.
+        """
+        if not self.enabled:
+            return None
+        return {
+            "cores_per_sim": self.cores_per_sim,
+            "nodes": {
+                node: {
+                    "cpus": sorted(cpu for core in cores for cpu in core),
+                    "free_cores": len(self._free[node]),
+                }
+                for node, cores in self.nodes.items()
+            },
+        }
+
+
+def apply_placement(sim: GemaSimulation) -> None:
+    """Pin the calling process to the cores and memory node of a simulation.
+
+    Runs in the gem5 child. Every thread is pinned, and threads started
+    later inherit the pinning. Memory is allocated on the simulation's node
+    through libnuma, if it is installed. Without libnuma, the kernel's
+    default policy still allocates new memory on the node of the CPU that
+    first touches it, which pinning keeps local. Either way, memory the
+    process allocated before this call is not moved.
+
+    Args:
+        sim (GemaSimulation): The simulation about to run.
+    """
+    if not sim.cpus:
+        return
+    for task in os.listdir("/proc/self/task"):
+        try:
+            os.sched_setaffinity(int(task), sim.cpus)
+        except OSError:
+            # The thread has exited since it was listed
+            continue
+    if sim.numa_node is not None:
+        libnuma = _load_libnuma()
+        if libnuma is not None:
+            libnuma.numa_set_preferred(sim.numa_node)
+
+
+def _load_libnuma() -> Optional[ctypes.CDLL]:
+    """Return libnuma, or None if it is not installed or NUMA is unavailable."""
+    name = ctypes.util.find_library("numa")
+    if name is None:
+        return None
+    try:
+        libnuma = ctypes.CDLL(name)
+    except OSError:
+        return None
+    if libnuma.numa_available() < 0:
+        return None
+    return libnuma
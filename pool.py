@@ -0,0 +1,153 @@
+# ----------------------------------------------------------------------------
+# File: <pool>.py
+#
+# Description:
+# <Keeps gem5 children started ahead of the simulations they will run>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema.manager import GemaSimulationManager
+
+import threading
+import time
+from collections import deque
+from multiprocessing import Pipe
+from multiprocessing.connection import Connection
+
+from gem5.utils.multiprocessing import Process
+
+
+class GemaWarmWorker:
+    """An idle gem5 child waiting for its simulation.
+
+    Attributes:
+        process (Process): The child.
+        jobs (Connection): End the simulation is sent through, after the
+            child has reported that it is ready.
+        log (Connection): Read end of the child's stdout and stderr.
+    """
+
+    def __init__(self, process: Process, jobs: Connection, log: Connection):
+        self.process = process
+        self.jobs = jobs
+        self.log = log
+
+    def close(self) -> None:
+        """Close the parent's ends, which makes an idle child exit."""
+        self.jobs.close()
+        self.log.close()
+
+
+class GemaWorkerPool:
+    """Keeps up to ``size`` gem5 children started ahead of time.
+
+    Starting a simulation in a fresh child means spawning a gem5 binary,
+    initializing its Python interpreter and importing the gem5 standard
+    library and every component module gEMA knows. For short simulations
+    this dominates the launch latency. Warm workers have done all of that
+    already and block on a pipe until the scheduler sends them a simulation
+    (see ``GemaSimulationManager.run_warm_worker``).
+
+    gem5 can instantiate only one board per process, so every worker runs a
+    single simulation. A background thread replaces every worker that is
+    taken, so spawning never delays the scheduler.
+
+    Attributes:
+        manager (GemaSimulationManager): Owner of the worker entry point.
+        size (int): Number of idle workers kept. The pool is disabled if 0.
+    """
+
+    # Seconds a worker may take to start, and to wait before retrying after
+    # a worker failed to start
+    START_TIMEOUT = 120.0
+    RETRY_DELAY = 5.0
+
+    def __init__(self, manager: GemaSimulationManager, size: int = 0) -> None:
+        self.manager = manager
+        self.size = size
+        self._idle: deque[GemaWarmWorker] = deque()
+        self._changed = threading.Condition()
+        self._thread = threading.Thread(
+            target=self._replenish_loop, name="gema-pool", daemon=True
+        )
+        self._thread.start()
+
+    def __len__(self) -> int:
+        return len(self._idle)
+
+    def set_size(self, size: int) -> None:
+        """Change the number of idle workers kept."""
+        with self._changed:
+            self.size = size
+            self._changed.notify()
+
+    def take(self) -> Optional[GemaWarmWorker]:
+        """Return the oldest idle worker that is still alive, if any."""
+        with self._changed:
+            while self._idle:
+                worker = self._idle.popleft()
+                self._changed.notify()
+                if worker.process.is_alive():
+                    return worker
+                worker.close()
+                worker.process.join()
+        return None
+
+    def _replenish_loop(self) -> None:
+        """Start or stop idle workers until there are ``size`` of them."""
+        while True:
+            with self._changed:
+                self._changed.wait_for(lambda: len(self._idle) != self.size)
+                excess = self._idle.pop() if len(self._idle) > self.size else None
+            if excess is not None:
+                excess.close()
+                excess.process.join()
+                continue
+            try:
+                worker = self._start()
+            except Exception as e:
+                print(f"Failed to start a warm worker: {e}")
+                time.sleep(self.RETRY_DELAY)
+                continue
+            with self._changed:
+                self._idle.append(worker)
+
+    def _start(self) -> GemaWarmWorker:
+        """Start a worker and wait until it is ready for a simulation."""
+        jobs, child_jobs = Pipe()
+        log_r, log_w = Pipe(duplex=False)
+        process = Process(
+            target=self.manager.run_warm_worker,
+            args=[child_jobs, log_w],
+            name="gema_warm_worker",
+        )
+        try:
+            process.start()
+        finally:
+            # Only the child keeps these ends
+            child_jobs.close()
+            log_w.close()
+        worker = GemaWarmWorker(process, jobs, log_r)
+
+        # The worker only counts as warm once its startup is over
+        try:
+            if not jobs.poll(self.START_TIMEOUT):
+                raise TimeoutError(f"not ready after {self.START_TIMEOUT}s")
+            jobs.recv_bytes()
+        except (EOFError, OSError) as e:
+            worker.close()
+            process.terminate()
+            process.join()
+            raise RuntimeError(f"warm worker exited during startup: {e}")
+        return worker
@@ -0,0 +1,190 @@
+# ----------------------------------------------------------------------------
+# File: <progress>.py
+#
+# Description:
+# <Progress reporting of running gem5 simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import json
+import os
+import time
+from pathlib import Path
+from typing import Optional
+
+# Written by the gem5 child into its output directory while it runs
+PROGRESS_FILE = "gema_progress.json"
+
+
+def write_json_atomic(path: Path, data: dict) -> None:
+    """Write a JSON file so that readers never see it half-written.
+
+    Args:
+        path (Path): The file to write.
+        data (dict): The data to serialize.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    partial = path.with_name(f"{path.name}.tmp")
+    partial.write_text(json.dumps(data))
+    os.replace(partial, path)
+
+
+def read_json(path: Path) -> Optional[dict]:
+    """Read a JSON file, returning None if it is missing or unreadable."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def estimate_remaining(
+    progress: dict,
+    max_ticks: Optional[int] = None,
+    max_insts: Optional[int] = None,
+) -> Optional[float]:
+    """Estimate the host seconds left until a budget is reached.
+
+    Args:
+        progress (dict): A progress record written by GemaProgressReporter.
+        max_ticks (Optional[int]): Tick budget of the run.
+        max_insts (Optional[int]): Committed instruction budget per core. The
+                                 run stops when any core reaches it.
+
+    Returns:
+        Optional[float]: The seconds until the first budget is reached at the
+                       current rate, counted from now rather than from when
+                       the record was written, or None if no estimate can be
+                       made.
+    """
+    estimates = []
+    for budget, current, rate in (
+        (max_ticks, progress.get("tick"), progress.get("ticks_per_second")),
+        (
+            max_insts,
+            progress.get("core_insts"),
+            progress.get("core_insts_per_second"),
+        ),
+    ):
+        if budget is None or current is None or not rate:
+            continue
+        estimates.append(max(budget - current, 0) / rate)
+    if not estimates:
+        return None
+    age = time.time() - progress.get("time", time.time())
+    return max(min(estimates) - age, 0.0)
+
+
+class GemaProgressReporter:
+    """Reports the progress of a simulation from inside the gem5 child.
+
+    gem5 offers no callback while ``simulator.run()`` executes, so the reporter
+    schedules a tick exit, records the progress when it fires and schedules the
+    next one. The distance between two exits is adapted to the measured
+    simulation speed so that a record is written roughly every ``interval``
+    host seconds, whether the CPU model is fast or slow.
+
+    Every record replaces PROGRESS_FILE in the simulation's output directory.
+    It holds the current tick, the committed instructions of all cores and of
+    the leading core, and their rates and the simulated seconds per host
+    second over the last interval.
+
+    Args:
+        board: The gem5 board being simulated.
+        outdir (Path): The simulation's output directory.
+        interval (float): Host seconds between two progress records.
+    """
+
+    # Distance in ticks of the first scheduled exit, before any rate is known
+    FIRST_EXIT = 10**9
+
+    def __init__(self, board, outdir: Path, interval: float) -> None:
+        self.board = board
+        self.path = Path(outdir) / PROGRESS_FILE
+        self.interval = interval
+        self._started = None
+        self._last = None
+
+    def start(self) -> None:
+        """Schedule the first progress exit. Call once the board is instantiated."""
+        self._started = time.monotonic()
+        self._last = (self._started, self._current_tick(), *self._insts())
+        self._schedule(self.FIRST_EXIT)
+
+    def on_scheduled_tick(self):
+        """Exit event generator for ExitEvent.SCHEDULED_TICK.
+
+        Yields:
+            bool: Always False, so the simulation continues.
+        """
+        while True:
+            self.report()
+            yield False
+
+    def report(self) -> None:
+        """Write a progress record and schedule the next progress exit."""
+        now = time.monotonic()
+        tick, insts, core_insts = self._current_tick(), *self._insts()
+        last_time, last_tick, last_insts, last_core_insts = self._last
+        elapsed = max(now - last_time, 1e-9)
+
+        def rate(current, last):
+            if current is None or last is None:
+                return None
+            return (current - last) / elapsed
+
+        ticks_per_second = rate(tick, last_tick)
+        write_json_atomic(
+            self.path,
+            {
+                "time": time.time(),
+                "host_seconds": now - self._started,
+                "tick": tick,
+                "insts": insts,
+                "core_insts": core_insts,
+                "ticks_per_second": ticks_per_second,
+                "insts_per_second": rate(insts, last_insts),
+                "core_insts_per_second": rate(core_insts, last_core_insts),
+                "sim_seconds_per_host_second": ticks_per_second
+                / self._tick_frequency(),
+            },
+        )
+        self._last = (now, tick, insts, core_insts)
+        self._schedule(max(int(ticks_per_second * self.interval), 1))
+
+    def _schedule(self, ticks: int) -> None:
+        import m5
+
+        m5.scheduleTickExitFromCurrent(ticks)
+
+    def _current_tick(self) -> int:
+        import m5
+
+        return m5.curTick()
+
+    def _tick_frequency(self) -> float:
+        from _m5 import core
+
+        return float(core.getClockFrequency())
+
+    def _insts(self) -> tuple[Optional[int], Optional[int]]:
+        """Return the committed instructions of all cores and of the leading one.
+
+        Both are None if the cores do not expose an instruction count.
+        """
+        try:
+            counts = [
+                core.get_simobject().totalInsts()
+                for core in self.board.get_processor().get_cores()
+            ]
+        except Exception:
+            return None, None
+        return sum(counts), max(counts, default=0)
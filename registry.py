@@ -0,0 +1,197 @@
+# ----------------------------------------------------------------------------
+# File: <registry>.py
+#
+# Description:
+# <Registry of the gem5 components that gEMA can configure>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+import inspect
+from typing import (
+    Any,
+    Optional,
+)
+
+from gem5.components.boards.arm_board import ArmBoard
+from gem5.components.boards.simple_board import SimpleBoard
+from gem5.components.boards.x86_board import X86Board
+from gem5.components.cachehierarchies.classic.no_cache import NoCache
+from gem5.components.cachehierarchies.classic.private_l1_cache_hierarchy import (
+    PrivateL1CacheHierarchy,
+)
+from gem5.components.cachehierarchies.classic.private_l1_private_l2_cache_hierarchy import (
+    PrivateL1PrivateL2CacheHierarchy,
+)
+from gem5.components.cachehierarchies.classic.private_l1_shared_l2_cache_hierarchy import (
+    PrivateL1SharedL2CacheHierarchy,
+)
+from gem5.components.memory import (
+    multi_channel,
+    single_channel,
+)
+from gem5.components.processors.cpu_types import CPUTypes
+from gem5.components.processors.simple_processor import SimpleProcessor
+from gem5.components.processors.simple_switchable_processor import (
+    SimpleSwitchableProcessor,
+)
+from gem5.isas import ISA
+
+
+class GemaComponentRegistry:
+    """A lookup table from configuration names to gem5 component factories.
+
+    The registry is built once and shared by the option retriever, which
+    advertises its contents, and the configuration generator, which validates
+    names and constructs gem5 objects from them. Both therefore always agree
+    on what can be configured.
+
+    Board, processor, memory and cache names are matched exactly, as they are
+    gem5 class and function names. ISA and CPU type names are matched
+    case-insensitively.
+
+    Attributes:
+        boards (dict[str, type]): Board classes by name.
+        processors (dict[str, type]): Processor classes by name.
+        switchable_processors (dict[str, type]): The processor classes that
+            start on SWITCH_FROM_CPU and switch to the configured CPU type.
+        single_channel_memory (dict[str, Callable]): Single-channel memory
+            factories by name.
+        multi_channel_memory (dict[str, Callable]): Multi-channel memory
+            factories by name.
+        memories (dict[str, Callable]): All memory factories by name.
+        caches (dict[str, type]): Cache hierarchy classes by name.
+        cpu_types (dict[str, CPUTypes]): CPU types by lowercase name.
+        isas (dict[str, ISA]): ISAs by lowercase name.
+        board_isas (dict[str, ISA]): The ISA required by boards that only
+            support one.
+    """
+
+    KINDS = ("board", "processor", "memory", "cache", "cpu", "isa")
+    # The CPU type switchable processors fast-forward on
+    SWITCH_FROM_CPU = CPUTypes.ATOMIC
+
+    def __init__(self) -> None:
+        self.boards = {
+            cls.__name__: cls for cls in (SimpleBoard, X86Board, ArmBoard)
+        }
+        self.switchable_processors = {
+            SimpleSwitchableProcessor.__name__: SimpleSwitchableProcessor
+        }
+        self.processors = {
+            SimpleProcessor.__name__: SimpleProcessor,
+            **self.switchable_processors,
+        }
+        self.single_channel_memory = dict(
+            inspect.getmembers(single_channel, inspect.isfunction)
+        )
+        self.multi_channel_memory = dict(
+            inspect.getmembers(multi_channel, inspect.isfunction)
+        )
+        self.memories = {
+            **self.single_channel_memory,
+            **self.multi_channel_memory,
+        }
+        self.caches = {
+            cls.__name__: cls
+            for cls in (
+                NoCache,
+                PrivateL1SharedL2CacheHierarchy,
+                PrivateL1PrivateL2CacheHierarchy,
+                PrivateL1CacheHierarchy,
+            )
+        }
+        self.cpu_types = {cpu.value.lower(): cpu for cpu in CPUTypes}
+        self.isas = {isa.value.lower(): isa for isa in ISA}
+        self.board_isas = {
+            X86Board.__name__: ISA.X86,
+            ArmBoard.__name__: ISA.ARM,
+        }
+        # (kind, name) -> (accepted keyword arguments or None, required ones)
+        self._parameters: dict[tuple, tuple] = {}
+        self._tables = {
+            "board": self.boards,
+            "processor": self.processors,
+            "memory": self.memories,
+            "cache": self.caches,
+            "cpu": self.cpu_types,
+            "isa": self.isas,
+        }
+
+    def lookup(self, kind: str, name: Optional[str]) -> Optional[Any]:
+        """Return the component registered under a name.
+
+        Args:
+            kind (str): One of KINDS.
+            name (Optional[str]): The configured name.
+
+        Returns:
+            Optional[Any]: The class, factory or enum member, or None if the
+                         name is not registered.
+        """
+        if not isinstance(name, str):
+            return None
+        if kind in ("cpu", "isa"):
+            name = name.lower()
+        return self._tables[kind].get(name)
+
+    def get(self, kind: str, name: Optional[str]) -> Any:
+        """Return the component registered under a name.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        component = self.lookup(kind, name)
+        if component is None:
+            raise ValueError(f"Unknown {kind} type '{name}'.")
+        return component
+
+    def names(self, kind: str) -> list[str]:
+        """Return the registered names of a kind, in registration order."""
+        return list(self._tables[kind])
+
+    def accepted_parameters(self, kind: str, name: str) -> Optional[set[str]]:
+        """Return the keyword arguments a registered factory accepts.
+
+        Returns:
+            Optional[set[str]]: The parameter names, or None if the factory
+                              takes arbitrary keyword arguments.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        return self._signature(kind, name)[0]
+
+    def required_parameters(self, kind: str, name: str) -> set[str]:
+        """Return the parameters a registered factory cannot be called without.
+
+        Raises:
+            ValueError: If the name is not registered.
+        """
+        return self._signature(kind, name)[1]
+
+    def _signature(self, kind: str, name: str) -> tuple:
+        key = (kind, name)
+        if key not in self._parameters:
+            factory = self.get(kind, name)
+            target = factory.__init__ if inspect.isclass(factory) else factory
+            accepted, required = set(), set()
+            for param in inspect.signature(target).parameters.values():
+                if param.name in ("self", "cls"):
+                    continue
+                if param.kind is param.VAR_KEYWORD:
+                    accepted = None
+                elif param.kind is not param.VAR_POSITIONAL:
+                    if accepted is not None:
+                        accepted.add(param.name)
+                    if param.default is param.empty:
+                        required.add(param.name)
+            self._parameters[key] = (accepted, required)
+        return self._parameters[key]
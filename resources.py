@@ -0,0 +1,275 @@
+# ----------------------------------------------------------------------------
+# File: <resources>.py
+#
+# Description:
+# <Prefetches simulation resources into a content-addressed cache>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import hashlib
+import os
+import shutil
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from datetime import datetime
+from pathlib import Path
+
+from gem5.resources.client import get_resource_json_obj
+from gem5.resources.resource import obtain_resource
+from gem5.utils.gema.progress import read_json, write_json_atomic
+
+# Maps resource names and versions to their entries in the cache directory
+RESOURCE_INDEX = "index.json"
+
+
+def resource_key(name: str, version: Optional[str] = None) -> str:
+    """Return the key of a resource in the cache index."""
+    return f"{name}@{version}" if version else name
+
+
+def file_digest(path: Path) -> str:
+    """Return the SHA-256 digest of a file."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for block in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+class GemaResourceCache:
+    """Resolves simulation resources once, ahead of the simulations using them.
+
+    Resources are fetched in the server as soon as they are set on a
+    configuration or a simulation is queued, rather than by every gem5
+    child. Concurrent requests for the same resource share one fetch. A
+    fetched file is stored under its SHA-256 digest below the cache
+    directory, as ``<digest>/<file name>``, so identical resources are kept
+    once, and children are handed the ready local path.
+
+    With ``local_dir`` set, resources are taken from that directory instead
+    of gem5's resource sources, which needs no network access: a resource is
+    looked up as ``<name>-<version>`` when a version is given, and then as
+    ``<name>``. Resources missing there are still obtained from gem5.
+
+    Resources without a version are resolved again once per server run to
+    pick up new releases. If that fails, for example without a network, the
+    entry of an earlier run is used.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+        directory (Path): The cache directory.
+        local_dir (Optional[Path]): Directory of stand-in resources.
+    """
+
+    def __init__(
+        self,
+        root: Gema,
+        directory: Optional[Path] = None,
+        local_dir: Optional[Path] = None,
+        workers: int = 4,
+    ) -> None:
+        self.root = root
+        self.directory = Path(
+            directory or Path.home() / ".cache" / "gema" / "resources"
+        )
+        self.local_dir = Path(local_dir) if local_dir is not None else None
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._index: dict[str, dict] = (
+            read_json(self.directory / RESOURCE_INDEX) or {}
+        )
+        # key -> fetch of this server run, finished or not
+        self._fetches: dict[str, Future] = {}
+        # key -> what gem5's resource catalogue said about it, see check
+        self._listed: dict[str, Optional[str]] = {}
+        self._lock = threading.Lock()
+        self._pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="gema-resources"
+        )
+
+    def prefetch(self, name: str, version: Optional[str] = None) -> Future:
+        """Start resolving a resource, unless it is resolved or in flight.
+
+        A resource whose last fetch failed is fetched again.
+
+        Args:
+            name (str): The resource name.
+            version (Optional[str]): The resource version, None for the latest.
+
+        Returns:
+            Future: Resolves to the local path of the resource, or raises the
+                   error that prevented fetching it.
+        """
+        return self._get_fetch(name, version, retry=True)
+
+    def resolve(self, name: str, version: Optional[str] = None) -> Future:
+        """Return the fetch of a resource, starting one if there is none yet.
+
+        Unlike ``prefetch``, a failed fetch is returned as it is.
+        """
+        return self._get_fetch(name, version, retry=False)
+
+    def check(self, name: str, version: Optional[str] = None) -> Optional[str]:
+        """Return why a resource cannot be obtained, if it is known not to be.
+
+        Resources that are cached, resolved, or have a stand-in are known.
+        Any other is looked up in gem5's resource catalogue, which only
+        fetches its metadata, once per server run. If the catalogue cannot be
+        reached, the resource is assumed to exist, and its fetch reports any
+        error.
+
+        Args:
+            name (str): The resource name.
+            version (Optional[str]): The resource version, None for the latest.
+
+        Returns:
+            Optional[str]: The problem, or None if the resource can be used.
+        """
+        key = resource_key(name, version)
+        with self._lock:
+            if key in self._listed:
+                return self._listed[key]
+            fetch = self._fetches.get(key)
+            if key in self._index or (
+                fetch is not None and fetch.done() and not fetch.exception()
+            ):
+                return None
+        if self._local_source(name, version) is not None:
+            return None
+        try:
+            get_resource_json_obj(name, resource_version=version)
+            problem = None
+        except Exception as e:
+            if "not found" not in str(e).lower():
+                return None
+            problem = f"Unknown resource {key}."
+        with self._lock:
+            self._listed[key] = problem
+        return problem
+
+    def digest(self, name: str, version: Optional[str] = None) -> Optional[str]:
+        """Return the SHA-256 digest of the copy of a resource this run uses.
+
+        Args:
+            name (str): The resource name.
+            version (Optional[str]): The resource version, None for the latest.
+
+        Returns:
+            Optional[str]: The digest, or None until the resource is resolved
+                          this run, and for directory resources.
+        """
+        key = resource_key(name, version)
+        with self._lock:
+            fetch = self._fetches.get(key)
+            if fetch is None or not fetch.done() or fetch.exception():
+                return None
+            return self._index.get(key, {}).get("digest")
+
+    def get_entries(self) -> list[dict]:
+        """Return every resource of the cache, with the state of its fetch."""
+        with self._lock:
+            keys = dict.fromkeys([*self._index, *self._fetches])
+            entries = []
+            for key in keys:
+                entry = dict(self._index.get(key, {"key": key}))
+                fetch = self._fetches.get(key)
+                if fetch is None:
+                    entry["state"] = "cached"
+                elif not fetch.done():
+                    entry["state"] = "fetching"
+                elif fetch.exception() is not None:
+                    entry["state"] = "failed"
+                    entry["error"] = str(fetch.exception())
+                else:
+                    entry["state"] = "ready"
+                entries.append(entry)
+            return entries
+
+    def _get_fetch(
+        self, name: str, version: Optional[str], retry: bool
+    ) -> Future:
+        key = resource_key(name, version)
+        with self._lock:
+            fetch = self._fetches.get(key)
+            failed = (
+                fetch is not None
+                and fetch.done()
+                and fetch.exception() is not None
+            )
+            if fetch is None or (retry and failed):
+                fetch = self._pool.submit(self._fetch, name, version)
+                self._fetches[key] = fetch
+            return fetch
+
+    def _fetch(self, name: str, version: Optional[str]) -> str:
+        """Resolve a resource into the cache. Runs on a pool thread."""
+        key = resource_key(name, version)
+        with self._lock:
+            cached = self._index.get(key)
+        # Fixed versions never change once they are cached
+        if version and cached and Path(cached["path"]).exists():
+            return cached["path"]
+
+        try:
+            source = self._local_source(name, version)
+            if source is None:
+                resource = obtain_resource(
+                    name, resource_version=version, quiet=True
+                )
+                source = Path(resource.get_local_path())
+            entry = self._store(key, source)
+        except Exception:
+            if cached and Path(cached["path"]).exists():
+                print(f"Could not refresh resource {key}; using the cached copy.")
+                return cached["path"]
+            raise
+
+        with self._lock:
+            self._index[key] = entry
+            write_json_atomic(self.directory / RESOURCE_INDEX, self._index)
+        return entry["path"]
+
+    def _local_source(self, name: str, version: Optional[str]) -> Optional[Path]:
+        """Return the stand-in of a resource in ``local_dir``, if there is one."""
+        if self.local_dir is None:
+            return None
+        candidates = [f"{name}-{version}", name] if version else [name]
+        for candidate in candidates:
+            path = self.local_dir / candidate
+            if path.exists():
+                return path
+        return None
+
+    def _store(self, key: str, source: Path) -> dict:
+        """Add a resolved resource to the content-addressed store."""
+        entry = {
+            "key": key,
+            "source": str(source),
+            "fetched_on": datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        }
+        if not source.is_file():
+            # Directory resources are used in place
+            return {**entry, "digest": None, "path": str(source)}
+
+        digest = file_digest(source)
+        target = self.directory / digest / source.name
+        if not target.exists():
+            target.parent.mkdir(parents=True, exist_ok=True)
+            # Copied rather than linked, so the entry cannot change with
+            # its source
+            partial = target.with_name(f"{target.name}.{os.getpid()}.tmp")
+            shutil.copy2(source, partial)
+            os.replace(partial, target)
+        return {**entry, "digest": digest, "path": str(target)}
@@ -0,0 +1,152 @@
+# ----------------------------------------------------------------------------
+# File: <results>.py
+#
+# Description:
+# <Caches finished simulation results by configuration content hash>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import os
+import shutil
+import threading
+from datetime import datetime
+from pathlib import Path
+
+from gem5.utils.gema.archive import output_exists
+from gem5.utils.gema.rpc_data import (
+    GemaCachedResult,
+    GemaSimulation,
+)
+
+
+class GemaResultCache:
+    """A class that remembers the outputs of finished simulations.
+
+    Results are keyed by the content hash of the simulated configuration (see
+    ``identity.config_content_hash``), which ignores the config ID but covers
+    the resource and the gem5 build. A resource without a version is
+    identified by the digest of the copy that was simulated, so simulations
+    whose copy is not in the resource cache are not remembered. When an
+    identical configuration is submitted again, the existing output
+    directory is hard-linked into the new simulation's output directory
+    instead of running gem5 again.
+
+    Entries whose output directory has disappeared are dropped on lookup.
+    Entries of earlier server runs are read from the state store the first
+    time they are looked up, rather than all at startup.
+    """
+
+    STATS_FILE = "stats.txt"
+
+    def __init__(self, root: Gema) -> None:
+        self.root = root
+        self._entries: dict[str, GemaCachedResult] = {}
+        self._lock = threading.RLock()
+
+    def get_entries(self) -> list[GemaCachedResult]:
+        """Return all cached results, oldest first."""
+        if self.root.state.enabled:
+            # The store holds every entry, including those not looked up yet
+            return self.root.state.load_results()
+        with self._lock:
+            return list(self._entries.values())
+
+    def lookup(self, config_hash: str) -> Optional[GemaCachedResult]:
+        """Return the cached result for a configuration hash.
+
+        Args:
+            config_hash (str): The content hash of the configuration.
+
+        Returns:
+            Optional[GemaCachedResult]: The cached result, or None if there is
+                                      none or its outputs no longer exist.
+        """
+        with self._lock:
+            entry = self._entries.get(config_hash)
+            if entry is None:
+                entry = self.root.state.load_result(config_hash)
+            if entry is None:
+                return None
+            self._entries[config_hash] = entry
+            if not output_exists(Path(entry.stats_path)):
+                del self._entries[config_hash]
+                self.root.state.delete_result(config_hash)
+                return None
+            return entry
+
+    def record(self, sim: GemaSimulation) -> bool:
+        """Cache the outputs of a successfully finished simulation.
+
+        Args:
+            sim (GemaSimulation): The finished simulation.
+
+        Returns:
+            bool: True if the result was cached, False if the simulation has no
+                 configuration hash or produced no statistics.
+        """
+        stats_path = Path(sim.path) / self.STATS_FILE
+        if sim.config_hash is None or not stats_path.is_file():
+            return False
+
+        entry = GemaCachedResult(
+            config_hash=sim.config_hash,
+            sim_id=sim.sim_id,
+            path=str(sim.path),
+            stats_path=str(stats_path),
+            recorded_on=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        )
+        with self._lock:
+            self._entries[sim.config_hash] = entry
+            self.root.state.save_result(entry)
+        return True
+
+    def clear(self) -> int:
+        """Forget all cached results. Output directories are left in place.
+
+        Returns:
+            int: The number of entries removed.
+        """
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+            self.root.state.clear_results()
+            return count
+
+    def materialize(self, entry: GemaCachedResult, destination: Path) -> None:
+        """Recreate a cached output directory at a new location.
+
+        Files are hard-linked so no data is copied. Files on a different
+        filesystem than the cached outputs are copied instead.
+
+        Args:
+            entry (GemaCachedResult): The cached result to reuse.
+            destination (Path): The output directory of the new simulation.
+
+        Raises:
+            OSError: If the outputs could not be linked or copied.
+        """
+        source = Path(entry.path)
+        for directory, _, files in os.walk(source):
+            target_dir = destination / Path(directory).relative_to(source)
+            target_dir.mkdir(parents=True, exist_ok=True)
+            for name in files:
+                target = target_dir / name
+                if target.exists():
+                    continue
+                try:
+                    os.link(Path(directory) / name, target)
+                except OSError:
+                    shutil.copy2(Path(directory) / name, target)
@@ -20,51 +20,180 @@ if TYPE_CHECKING:
     from gem5.utils.gema import Gema
 
 import os
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from urllib.parse import unquote, urlsplit
 from xmlrpc.server import (
     SimpleXMLRPCRequestHandler,
     SimpleXMLRPCServer,
 )
 
+from gem5.utils.gema.archive import ArchivedFile
+from gem5.utils.gema.files import DOWNLOAD_PREFIX, parse_range
+
 
 class GemaServer:
     """A server that provides XML-RPC interface to interact with gem5 configurations and simulations."""
 
-    def __init__(self, root: Gema, port: int):
+    def __init__(self, root: Gema, port: int, workers: int = 1):
         """Initialize the GemaServer.
 
         Args:
             root: The root Gema instance that provides access to gem5 functionality
             port: The port number to run the server on
+            workers: The number of requests served concurrently. A value of 1
+                keeps the original single-threaded behaviour.
         """
         self.root = root
         self.port = port
+        self.workers = workers
 
     def run(self):
         """Start the XML-RPC server and register all available GemaFunctions.
 
         The server runs indefinitely until explicitly shut down. It provides
-        introspection capabilities and serves RPC requests on localhost.
+        introspection capabilities and serves RPC requests on localhost. When
+        more than one worker is configured, requests are dispatched to a
+        bounded thread pool so that a slow call does not block other clients.
         """
-        server = SimpleXMLRPCServer(
-            ("localhost", self.port),
-            requestHandler=RequestHandler,
-            allow_none=True,
-        )
+        if self.workers > 1:
+            server = ThreadPoolXMLRPCServer(
+                ("localhost", self.port),
+                workers=self.workers,
+                requestHandler=RequestHandler,
+                allow_none=True,
+            )
+        else:
+            server = SimpleXMLRPCServer(
+                ("localhost", self.port),
+                requestHandler=RequestHandler,
+                allow_none=True,
+            )
         server.register_introspection_functions()
         server.register_instance(GemaFunctions(self.root))
-        print(f"Starting server on port {self.port}.")
+        # Read by RequestHandler to serve output file downloads
+        server.files = self.root.files
+        print(
+            f"Starting server on port {self.port} with {max(self.workers, 1)} worker(s)."
+        )
         print(
             "For help, call the 'get_endpoints' method or consult the documentation."
         )
         server.serve_forever()
 
 
+class ThreadPoolXMLRPCServer(SimpleXMLRPCServer):
+    """XML-RPC server that handles each request on a bounded pool of threads.
+
+    Unlike ``socketserver.ThreadingMixIn``, which spawns an unbounded thread per
+    connection, requests are submitted to a fixed-size executor so the number
+    of concurrently running RPC calls never exceeds ``workers``.
+    """
+
+    def __init__(self, *args, workers: int, **kwargs):
+        """Initialize the server and its worker pool.
+
+        Args:
+            workers: Maximum number of requests handled at the same time
+            *args: Positional arguments forwarded to SimpleXMLRPCServer
+            **kwargs: Keyword arguments forwarded to SimpleXMLRPCServer
+        """
+        super().__init__(*args, **kwargs)
+        self.pool = ThreadPoolExecutor(
+            max_workers=workers, thread_name_prefix="gema-rpc"
+        )
+
+    def process_request(self, request, client_address):
+        """Hand the accepted connection over to the worker pool."""
+        self.pool.submit(self._process_request_worker, request, client_address)
+
+    def _process_request_worker(self, request, client_address):
+        """Serve a single connection on a pool thread."""
+        try:
+            self.finish_request(request, client_address)
+        except Exception:
+            self.handle_error(request, client_address)
+        finally:
+            self.shutdown_request(request)
+
+    def server_close(self):
+        """Close the listening socket and wait for in-flight requests."""
+        super().server_close()
+        self.pool.shutdown(wait=True)
+
+
 class RequestHandler(SimpleXMLRPCRequestHandler):
-    """Custom request handler for the XML-RPC server that restricts paths to /RPC2"""
+    """Custom request handler for the XML-RPC server that restricts paths to /RPC2
+
+    GET requests below DOWNLOAD_PREFIX download simulation output files, with
+    support for single byte ranges. The file is sent with ``sendfile``, so it
+    never passes through the server's memory. Compacted files are sent as
+    they are decompressed, one block at a time.
+    """
 
     rpc_paths = ("/RPC2",)
 
+    def do_GET(self):
+        """Serve GET /files/<sim_id>/<path>, optionally with a Range header."""
+        path = unquote(urlsplit(self.path).path)
+        if not path.startswith(DOWNLOAD_PREFIX):
+            self.send_error(404)
+            return
+        sim_id, _, relative = path[len(DOWNLOAD_PREFIX) :].partition("/")
+        try:
+            target = self.server.files.resolve(int(sim_id), relative)
+        except ValueError as e:
+            self.send_error(404, explain=str(e))
+            return
+
+        if isinstance(target, ArchivedFile):
+            byte_range = self._send_headers(target.size)
+            if byte_range is not None:
+                # Decompressed block by block, never as a whole
+                for data in target.iter_range(byte_range[0], byte_range[1] + 1):
+                    self.wfile.write(data)
+            return
+        with open(target, "rb") as f:
+            byte_range = self._send_headers(os.fstat(f.fileno()).st_size)
+            if byte_range is not None and byte_range[1] >= byte_range[0]:
+                start, end = byte_range
+                self.connection.sendfile(f, start, end - start + 1)
+
+    def _send_headers(self, size: int) -> Optional[tuple[int, int]]:
+        """Answer the Range header of a download of ``size`` bytes.
+
+        Returns:
+            Optional[tuple[int, int]]: The first and last byte to send, or
+                None if the range could not be satisfied.
+        """
+        byte_range = parse_range(self.headers.get("Range"), size)
+        if byte_range is None:
+            self.send_response(416)
+            self.send_header("Content-Range", f"bytes */{size}")
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return None
+        start, end = byte_range
+        partial = "Range" in self.headers and (start, end) != (0, size - 1)
+        self.send_response(206 if partial else 200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Accept-Ranges", "bytes")
+        self.send_header("Content-Length", str(max(end - start + 1, 0)))
+        if partial:
+            self.send_header("Content-Range", f"bytes {start}-{end}/{size}")
+        self.end_headers()
+        # The handler buffers its output, and sendfile bypasses the buffer
+        self.wfile.flush()
+        return byte_range
+
+
+class RawJSON(str):
+    """A string that already holds a JSON document.
+
+    RPC methods return it to skip serialization in ``rpc_json_response``, which
+    lets expensive, rarely changing responses be serialized once and reused.
+    """
+
 
 class GemaFunctions:
     """Provides the XML-RPC accessible functions for interacting with gem5 configurations and simulations."""
@@ -92,6 +221,8 @@ class GemaFunctions:
         def wrapper(*args, **kwargs):
             try:
                 result = func(*args, **kwargs)
+                if isinstance(result, RawJSON):
+                    return str(result)
 
                 def convert(obj):
                     if is_dataclass(obj):
@@ -116,6 +247,34 @@ class GemaFunctions:
 
         return wrapper
 
+    @staticmethod
+    def _invalid(message: str, problems: list[dict]) -> dict:
+        """Build the error response for a request that failed validation."""
+        return {"status": "error", "message": message, "details": problems}
+
+    @classmethod
+    def _setter_response(
+        cls,
+        config_id: int,
+        problems: list[dict] | None,
+        invalid: str,
+        updated: str,
+    ) -> str | dict:
+        """Build the response to a configurator ``set_*`` call.
+
+        Args:
+            config_id: The identifier of the modified configuration
+            problems: What the setter returned: the problems found, or None
+                if the configuration does not exist
+            invalid: The message if there are problems
+            updated: The message if the configuration was updated
+        """
+        if problems is None:
+            return f"Config with ID {config_id} does not exist."
+        if problems:
+            return cls._invalid(invalid, problems)
+        return updated
+
     @rpc_json_response
     def get_endpoints(self) -> dict:
         """Retrieve a comprehensive list of all available RPC endpoints and their descriptions.
@@ -131,29 +290,60 @@ class GemaFunctions:
                 "returns": "dict: Dictionary of all endpoints with descriptions and parameters",
             },
             "get_config_options": {
-                "desc": "Retrieve all available configuration options and their valid values from the gem5 system",
+                "desc": "Retrieve all available configuration options and their valid values from the gem5 system. The options are computed once per gem5 build",
+                "params": "(version: Optional[str])",
+                "details": {
+                    "version": "Version tag of the options the client already holds. If omitted, the options are returned as before",
+                },
+                "returns": "dict: Configuration options if no version is given, {'version', 'options'} if the given version is outdated, or {'status': 'unchanged', 'version'} if it is current",
+            },
+            "get_config_options_version": {
+                "desc": "Retrieve the version tag of the configuration options. It changes only when the options change",
                 "params": None,
-                "returns": "dict: Configuration options and their acceptable values",
+                "returns": "str: Version tag",
             },
             "get_configs": {
-                "desc": "Retrieve a list of all stored configurations in the system",
-                "params": None,
-                "returns": "list[GemaConfiguration]: List of all configuration objects",
+                "desc": "Retrieve a list of all stored configurations in the system, optionally filtered by indexed fields",
+                "params": "(filters: Optional[dict])",
+                "details": {
+                    "filters": "Optional mapping of fields to required values. Supported fields: board.type, processor.isa, processor.cpu, memory.type, cache.type",
+                },
+                "returns": "list[GemaConfiguration]: List of matching configuration objects",
             },
             "get_sims": {
-                "desc": "Retrieve a list of all stored simulations in the system",
+                "desc": "Retrieve a list of all stored simulations in the system, including the exit code, end time, final tick and exit cause of those that have exited",
                 "params": None,
                 "returns": "list[GemaSimulation]: List of all simulation objects",
             },
             "manage_sim": {
                 "desc": "Control a running simulation by ID or process ID",
-                "params": "(id: int, cmd: str)",
+                "params": "(id: int, cmd: str, kind: Optional[str])",
                 "details": {
                     "id": "Simulation ID or process ID",
                     "cmd": "Command to execute on the simulation (status, pause, resume, or kill)",
+                    "kind": "How to interpret id: 'sim_id', 'pid' or 'auto' (default). With 'auto', a matching simulation ID takes precedence",
                 },
                 "returns": "str: Result message of the management command",
             },
+            "get_sim_progress": {
+                "desc": "Retrieve the progress of a simulation: current tick, committed instructions, simulation speed and, given a budget, the estimated time left",
+                "params": "(id: int, max_ticks: Optional[int], max_insts: Optional[int])",
+                "details": {
+                    "id": "Simulation ID",
+                    "max_ticks": "Tick budget to estimate the remaining host time against. Defaults to the configured budget",
+                    "max_insts": "Per-core committed instruction budget to estimate against. Defaults to the configured budget",
+                },
+                "returns": "dict: Status, tick, insts, ticks_per_second, insts_per_second, sim_seconds_per_host_second and eta_seconds",
+            },
+            "get_sim_metrics": {
+                "desc": "Retrieve the sampled host metrics of a simulation: CPU utilization, resident memory, bytes read and written, and context switches",
+                "params": "(id: int, since: Optional[float])",
+                "details": {
+                    "id": "Simulation ID",
+                    "since": "Only return samples taken after this Unix timestamp",
+                },
+                "returns": "dict: The sampling interval and the samples in chronological order",
+            },
             "shutdown": {
                 "desc": "Gracefully terminate the gEMA server with a 1-second delay to allow response transmission",
                 "params": None,
@@ -180,13 +370,15 @@ class GemaFunctions:
             },
             "set_processor": {
                 "desc": "Set processor configuration parameters",
-                "params": "(config_id: int, isa: str, type: str, cpu: str, ncores: int)",
+                "params": "(config_id: int, isa: str, type: str, cpu: str, ncores: int, switch_after_insts: Optional[int], switch_on: Optional[str])",
                 "details": {
                     "config_id": "Configuration identifier",
                     "isa": "Instruction Set Architecture",
                     "type": "Processor type",
-                    "cpu": "CPU model identifier",
+                    "cpu": "CPU model identifier. Switchable processors start on the atomic CPU and switch to this one",
                     "ncores": "Number of CPU cores",
+                    "switch_after_insts": "Switchable processors only: switch CPUs after this many instructions per core",
+                    "switch_on": "Switchable processors only: switch CPUs at this exit event ('workbegin' or 'workend')",
                 },
                 "returns": "str: Configuration update status",
             },
@@ -217,20 +409,184 @@ class GemaFunctions:
             },
             "set_resource": {
                 "desc": "Set additional resource for a specific configuration",
-                "params": "(config_id: int, resource: str)",
+                "params": "(config_id: int, resource: str, version: Optional[str])",
                 "details": {
                     "config_id": "Configuration identifier",
-                    "resource": "Resource identifier or path",
+                    "resource": "Resource identifier. Rejected if it is not cached, has no stand-in and gem5's resource catalogue does not list it",
+                    "version": "Optional resource version. The latest compatible version is used if omitted",
                 },
                 "returns": "str: Resource update status",
             },
+            "set_budget": {
+                "desc": "Limit how long simulations of a specific configuration may run. Omitted limits are removed",
+                "params": "(config_id: int, max_ticks: Optional[int], max_insts: Optional[int], timeout: Optional[float])",
+                "details": {
+                    "config_id": "Configuration identifier",
+                    "max_ticks": "Stop the simulation after this many simulated ticks",
+                    "max_insts": "Stop the simulation once any core has committed this many instructions",
+                    "timeout": "Terminate the simulation after this many wall-clock seconds",
+                },
+                "returns": "str: Budget update status",
+            },
+            "set_exit_handlers": {
+                "desc": "Set the actions taken when simulations of a specific configuration hit workbegin, workend or m5 exit events. Omitted events keep the gem5 default",
+                "params": "(config_id: int, workbegin: Optional[list[str]], workend: Optional[list[str]], m5_exit: Optional[list[str]])",
+                "details": {
+                    "config_id": "Configuration identifier",
+                    "workbegin": "Actions on a workbegin event, e.g. ['reset_stats']",
+                    "workend": "Actions on a workend event, e.g. ['dump_stats', 'stop']",
+                    "m5_exit": "Actions on an m5 exit event. Must include 'stop'",
+                    "actions": "'reset_stats', 'dump_stats' and 'stop', run in order",
+                },
+                "returns": "str: Exit handler update status",
+            },
             "run_simulation": {
-                "desc": "Start a new simulation using the specified configuration",
+                "desc": "Queue a new simulation using the specified configuration. It starts as soon as a simulation slot is free. If an identical configuration already finished, its result is reused immediately. Configurations that fail validate_config are refused",
+                "params": "(config_id: int, bypass_cache: Optional[bool])",
+                "details": {
+                    "config_id": "Identifier of the configuration to use",
+                    "bypass_cache": "Force a fresh run even if a cached result exists (default False)",
+                },
+                "returns": "str: Simulation queue status message including the simulation ID",
+            },
+            "validate_config": {
+                "desc": "Check a configuration against the available components and their parameters, reporting every problem at once",
                 "params": "(config_id: int)",
                 "details": {
-                    "config_id": "Identifier of the configuration to use"
+                    "config_id": "Identifier of the configuration to check"
                 },
-                "returns": "str: Simulation start status message",
+                "returns": "dict: {'config_id', 'valid', 'problems'}, where each problem has a 'field' and a 'message'",
+            },
+            "get_cached_results": {
+                "desc": "Retrieve the result cache, which maps configuration content hashes to finished simulation outputs",
+                "params": None,
+                "returns": "list[GemaCachedResult]: All cached results",
+            },
+            "clear_result_cache": {
+                "desc": "Forget all cached results. Existing output directories are kept",
+                "params": None,
+                "returns": "str: Number of removed entries",
+            },
+            "get_resources": {
+                "desc": "Retrieve the resources resolved by the server, with their local path, digest and fetch state",
+                "params": None,
+                "returns": "dict: Cache directory, stand-in resource directory and the resources",
+            },
+            "get_checkpoints": {
+                "desc": "Retrieve the warm-up checkpoint cache, least recently used first, with its size limit",
+                "params": None,
+                "returns": "dict: Cache directory, size limit in MB, total size in MB and the cached checkpoints",
+            },
+            "clear_checkpoints": {
+                "desc": "Delete all cached warm-up checkpoints that no running simulation uses",
+                "params": None,
+                "returns": "str: Number of removed checkpoints",
+            },
+            "set_checkpoint_limit": {
+                "desc": "Set the size limit of the warm-up checkpoint cache. Least recently used checkpoints are evicted beyond it",
+                "params": "(limit: Optional[float])",
+                "details": {
+                    "limit": "Size limit in MB. Omit to remove the limit"
+                },
+                "returns": "str: Limit update status",
+            },
+            "set_retention": {
+                "desc": "Set the retention policies of simulation outputs and apply them. Pruned outputs keep stats.txt, config.ini, config.json and gEMA's own files",
+                "params": "(max_age: Optional[float], max_size: Optional[float])",
+                "details": {
+                    "max_age": "Days after a simulation ended before its outputs are pruned. Omit to keep outputs regardless of age",
+                    "max_size": "Total size of all outputs in GB beyond which the oldest are pruned. Omit to remove the limit",
+                },
+                "returns": "str: Retention update status",
+            },
+            "sweep": {
+                "desc": "Expand a parameter sweep on the server, validate every point, then create and queue all configurations in one batch",
+                "params": "(base: dict, axes: dict, mode: Optional[str], samples: Optional[int], seed: Optional[int], bypass_cache: Optional[bool])",
+                "details": {
+                    "base": "Base configuration in the add_config dictionary format",
+                    "axes": "Mapping of fields such as 'processor.ncores', 'cache.l2_size' or 'memory.type' to a list of values, {'values': [...]}, {'start', 'stop', 'step'} or {'start', 'stop', 'factor'}",
+                    "mode": "'product' (default) for the cartesian product, or 'sample' for a random subset",
+                    "samples": "Number of points to draw in 'sample' mode",
+                    "seed": "Optional random seed for 'sample' mode",
+                    "bypass_cache": "Force fresh runs even for points with a cached result (default False)",
+                },
+                "returns": "GemaSweep: Sweep ID with the generated config and simulation IDs, or an error listing the invalid points",
+            },
+            "get_sweeps": {
+                "desc": "Retrieve all recorded parameter sweeps",
+                "params": None,
+                "returns": "list[GemaSweep]: List of all sweeps",
+            },
+            "set_sim_limit": {
+                "desc": "Set the maximum number of simulations that run at once. Defaults to the number of physical cores",
+                "params": "(limit: int)",
+                "details": {
+                    "limit": "Maximum number of concurrently running simulations"
+                },
+                "returns": "str: Limit update status",
+            },
+            "set_warm_workers": {
+                "desc": "Set how many gem5 processes are kept started ahead of new simulations, which then skip the startup of gem5",
+                "params": "(count: int)",
+                "details": {"count": "Number of idle warm workers. 0 disables the pool"},
+                "returns": "str: Pool update status",
+            },
+            "get_sim_stats": {
+                "desc": "Retrieve the stats of a simulation whose names match any of the given patterns, per stats dump",
+                "params": "(id: int, patterns: list[str], dump: Optional[int])",
+                "details": {
+                    "id": "Simulation ID",
+                    "patterns": "Globs such as 'board.processor.*.ipc', or regular expressions prefixed with 're:'",
+                    "dump": "Only return this dump. Negative values count from the last dump",
+                },
+                "returns": "dict: The number of dumps and the matching stats of each selected dump",
+            },
+            "aggregate_stats": {
+                "desc": "Tabulate stats across simulations or a whole sweep, with configuration parameters as columns, optionally grouped and reduced on the server",
+                "params": "(stats: list[str], sim_ids: Optional[list[int]], sweep_id: Optional[int], params: Optional[list[str]], group_by: Optional[list[str]], reductions: Optional[list[str]], dump: Optional[int])",
+                "details": {
+                    "stats": "Stat names, globs, or regular expressions prefixed with 're:'",
+                    "sim_ids": "Simulations to tabulate",
+                    "sweep_id": "Tabulate the simulations of this sweep",
+                    "params": "Configuration fields to add as columns, e.g. 'cache.l2_size'. Defaults to the sweep axes, or to the fields that differ",
+                    "group_by": "Parameter columns to group rows by",
+                    "reductions": "'mean', 'min', 'max', 'geomean' and 'count', applied per group. Defaults to 'mean' when grouping",
+                    "dump": "Stats dump to read from each simulation. Defaults to the last one",
+                },
+                "returns": "dict: Column names, the values of each column, and the simulations without the requested dump",
+            },
+            "get_sim_log": {
+                "desc": "Read the captured stdout and stderr of a simulation. Pass back 'next_offset' to follow the log",
+                "params": "(id: int, offset: Optional[int], max_bytes: Optional[int])",
+                "details": {
+                    "id": "Simulation ID",
+                    "offset": "Byte position in the log to read from. Defaults to the end of the log minus max_bytes",
+                    "max_bytes": "Most bytes to return, up to 1 MiB. Defaults to 64 KiB",
+                },
+                "returns": "dict: The data read, its offset, the offset to continue from, the log size and whether the log is complete",
+            },
+            "get_sim_files": {
+                "desc": "List the files in the output directory of a simulation",
+                "params": "(id: int)",
+                "details": {"id": "Simulation ID"},
+                "returns": "list[dict]: Path, size, modification time and download URL of every file. The URL is served over HTTP GET on the RPC port and accepts a Range header",
+            },
+            "read_sim_file": {
+                "desc": "Read a byte range of a simulation output file. Pass back 'next_offset' to page through the file",
+                "params": "(id: int, path: str, offset: Optional[int], length: Optional[int], encoding: Optional[str])",
+                "details": {
+                    "id": "Simulation ID",
+                    "path": "Path of the file relative to the output directory, as listed by get_sim_files",
+                    "offset": "Byte position to read from. Negative values count from the end of the file. Defaults to 0",
+                    "length": "Most bytes to return, up to 4 MiB. Defaults to 64 KiB",
+                    "encoding": "'text' to decode the data as UTF-8 or 'base64' for binary files. Defaults to 'text'",
+                },
+                "returns": "dict: The data read, its offset, the offset to continue from, the file size and whether the end was reached",
+            },
+            "get_queue_status": {
+                "desc": "Retrieve the simulation concurrency limit, the running and queued simulation IDs, the number of warm workers kept and idle, and the free host cores when simulations are pinned",
+                "params": None,
+                "returns": "dict: Scheduler state",
             },
             "get_config_by_id": {
                 "desc": "Retrieve a specific configuration by its identifier",
@@ -252,31 +608,465 @@ class GemaFunctions:
         return endpoints
 
     @rpc_json_response
-    def get_config_options(self) -> dict|None:
+    def get_config_options(self, version: str | None = None):
         """Retrieve all available configuration options from the gem5 system.
 
+        The options are discovered and serialized once per gem5 build, so this
+        call only returns a prepared document.
+
+        Args:
+            version: Version tag of the options the client already holds
+
         Returns:
-            dict: A dictionary containing all valid configuration options and their acceptable values
+            dict: The configuration options if no version is given. Otherwise the
+                 current version and options, or an "unchanged" status if the
+                 client's version is current
         """
-        return self.root.retriever.get_config_options()
+        current, payload = self.root.retriever.get_config_options_payload()
+        if version is None:
+            return RawJSON(payload)
+        if version == current:
+            return {"status": "unchanged", "version": current}
+        return RawJSON(f'{{"version": "{current}", "options": {payload}}}')
 
     @rpc_json_response
-    def run_simulation(self, config_id: int):
+    def get_config_options_version(self):
+        """Retrieve the version tag of the configuration options.
+
+        Returns:
+            str: A tag that changes only when the configuration options change
+        """
+        version, _ = self.root.retriever.get_config_options_payload()
+        return version
+
+    @rpc_json_response
+    def run_simulation(self, config_id: int, bypass_cache: bool = False):
         """Start a new simulation using the specified configuration.
 
+        If an identical configuration has already finished, its outputs are
+        reused and the simulation completes immediately, unless bypass_cache
+        is set.
+
         Args:
             config_id: The identifier of the configuration to use for the simulation
+            bypass_cache: Force a fresh run even if a cached result exists
 
         Returns:
             str: A message indicating whether the simulation was successfully started
         """
-        if self.root.configurator._get_config_by_id(config_id) is None:
+        config = self.root.configurator.snapshot_config(config_id)
+        if config is None:
             response = f"Config with ID {config_id} does not exist."
             return response
-        response = f"Starting simulation using Config ID: {config_id}"
-        self.root.manager.start_subprocess(config_id)
+        problems = self.root.retriever.check_configuration(config)
+        if problems:
+            return self._invalid(
+                f"Config with ID {config_id} is not runnable; no simulation was started.",
+                problems,
+            )
+        sim_id = self.root.manager.start_subprocess(
+            config_id, use_cache=not bypass_cache
+        )
+        sim = self.root.manager._get_simulation_by_id(sim_id, config_id)
+        if sim is not None and sim.cached_from is not None:
+            response = f"Simulation {sim_id} reused the result of simulation {sim.cached_from} for Config ID: {config_id}"
+            return response
+        response = f"Queued simulation {sim_id} using Config ID: {config_id}"
+        return response
+
+    @rpc_json_response
+    def validate_config(self, config_id: int):
+        """Check whether a configuration is complete and can be simulated.
+
+        Args:
+            config_id: The identifier of the configuration to check
+
+        Returns:
+            dict: The config ID, whether it is valid, and every problem found
+        """
+        config = self.root.configurator.snapshot_config(config_id)
+        if config is None:
+            response = f"Config with ID {config_id} does not exist."
+            return response
+        problems = self.root.retriever.check_configuration(config)
+        return {
+            "config_id": config_id,
+            "valid": not problems,
+            "problems": problems,
+        }
+
+    @rpc_json_response
+    def get_cached_results(self):
+        """Retrieve all entries of the simulation result cache.
+
+        Returns:
+            list[GemaCachedResult]: Cached results keyed by configuration hash
+        """
+        return self.root.results.get_entries()
+
+    @rpc_json_response
+    def clear_result_cache(self):
+        """Forget all cached simulation results. Output directories are kept.
+
+        Returns:
+            str: A message with the number of removed entries
+        """
+        count = self.root.results.clear()
+        response = f"Removed {count} cached result(s)."
+        return response
+
+    @rpc_json_response
+    def get_resources(self):
+        """Retrieve the resources resolved by the server.
+
+        Returns:
+            dict: The cache directory, the stand-in resource directory, and
+                  every resource with its local path, digest and fetch state
+        """
+        cache = self.root.resources
+        return {
+            "directory": str(cache.directory),
+            "local_dir": str(cache.local_dir) if cache.local_dir else None,
+            "resources": cache.get_entries(),
+        }
+
+    @rpc_json_response
+    def get_checkpoints(self):
+        """Retrieve the warm-up checkpoint cache.
+
+        Returns:
+            dict: The cache directory, its size limit and total size in MB,
+                  and the cached checkpoints, least recently used first
+        """
+        cache = self.root.checkpoints
+        entries = cache.get_entries()
+        return {
+            "directory": str(cache.directory) if cache.enabled else None,
+            "limit_mb": cache.limit / 2**20 if cache.limit is not None else None,
+            "size_mb": sum(entry.size for entry in entries) / 2**20,
+            "checkpoints": entries,
+        }
+
+    @rpc_json_response
+    def clear_checkpoints(self):
+        """Delete all cached warm-up checkpoints that are not in use.
+
+        Returns:
+            str: A message with the number of removed checkpoints
+        """
+        count = self.root.checkpoints.clear()
+        response = f"Removed {count} cached checkpoint(s)."
+        return response
+
+    @rpc_json_response
+    def set_checkpoint_limit(self, limit: float | None = None):
+        """Set the size limit of the warm-up checkpoint cache.
+
+        Args:
+            limit: The size limit in MB, or None for no limit
+
+        Returns:
+            str: A message indicating whether the limit was updated
+        """
+        if limit is not None and (isinstance(limit, bool) or limit < 0):
+            response = f"Invalid checkpoint cache limit {limit}; it must not be negative."
+            return response
+        evicted = self.root.checkpoints.set_limit(
+            int(limit * 2**20) if limit is not None else None
+        )
+        response = f"Checkpoint cache limit set to {limit} MB; evicted {evicted} checkpoint(s)."
+        return response
+
+    @rpc_json_response
+    def set_retention(
+        self, max_age: float | None = None, max_size: float | None = None
+    ):
+        """Set the retention policies of simulation outputs and apply them.
+
+        Args:
+            max_age: Days after which the outputs of a simulation are pruned,
+                     or None to keep them regardless of age
+            max_size: Total size of all outputs in GB beyond which the oldest
+                      are pruned, or None for no limit
+
+        Returns:
+            str: A message indicating whether the policies were updated
+        """
+        for name, value in (("age", max_age), ("size", max_size)):
+            if value is not None and (isinstance(value, bool) or value < 0):
+                response = f"Invalid retention {name} {value}; it must not be negative."
+                return response
+        pruned = self.root.archive.set_retention(
+            max_age * 86400 if max_age is not None else None,
+            int(max_size * 2**30) if max_size is not None else None,
+        )
+        response = f"Retention set to {max_age} day(s) and {max_size} GB; pruned the outputs of {pruned} simulation(s)."
+        return response
+
+    @rpc_json_response
+    def sweep(
+        self,
+        base: dict,
+        axes: dict,
+        mode: str = "product",
+        samples: int | None = None,
+        seed: int | None = None,
+        bypass_cache: bool = False,
+    ):
+        """Expand a parameter sweep server-side and queue all of its points.
+
+        Args:
+            base: Base configuration in the dictionary format accepted by add_config
+            axes: Mapping of dotted field names (e.g. "processor.ncores") to a list
+                of values or a range such as {"start": 64, "stop": 1024, "factor": 2}
+            mode: "product" for the cartesian product, or "sample" for a random subset
+            samples: Number of points to draw in "sample" mode
+            seed: Optional seed for reproducible sampling
+            bypass_cache: Force fresh runs even for points with a cached result
+
+        Returns:
+            Union[GemaSweep, dict]: The queued sweep with its config and simulation IDs,
+                                  or an error listing every invalid design point
+        """
+        try:
+            sweep, problems = self.root.sweeper.create_sweep(
+                base, axes, mode, samples, seed, use_cache=not bypass_cache
+            )
+        except ValueError as e:
+            return {"status": "error", "message": str(e)}
+        if sweep is None:
+            return {
+                "status": "error",
+                "message": "Sweep contains invalid design points; nothing was created.",
+                "details": problems,
+            }
+        return sweep
+
+    @rpc_json_response
+    def get_sweeps(self):
+        """Retrieve all recorded sweeps.
+
+        Returns:
+            list[GemaSweep]: A list of all sweeps with their config and simulation IDs
+        """
+        return self.root.sweeper.get_sweeps()
+
+    @rpc_json_response
+    def set_sim_limit(self, limit: int):
+        """Set the maximum number of simulations that may run at once.
+
+        Args:
+            limit: The new concurrency limit
+
+        Returns:
+            str: A message indicating whether the limit was updated
+        """
+        if self.root.manager.set_sim_limit(limit) is False:
+            response = f"Invalid simulation limit {limit}; it must be at least 1."
+            return response
+        response = f"Simulation limit set to {limit}."
         return response
 
+    @rpc_json_response
+    def set_warm_workers(self, count: int):
+        """Set how many gem5 processes are kept started ahead of new simulations.
+
+        Args:
+            count: The number of idle warm workers, 0 to disable the pool
+
+        Returns:
+            str: A message indicating whether the pool was updated
+        """
+        if self.root.manager.set_warm_workers(count) is False:
+            response = f"Invalid number of warm workers {count}; it must not be negative."
+            return response
+        response = f"Warm workers set to {count}."
+        return response
+
+    @rpc_json_response
+    def get_sim_progress(
+        self,
+        id: int,
+        max_ticks: int | None = None,
+        max_insts: int | None = None,
+    ):
+        """Retrieve the progress of a simulation.
+
+        Args:
+            id: The simulation ID
+            max_ticks: Tick budget to estimate the remaining host time against.
+                Defaults to the budget of the simulation's configuration
+            max_insts: Per-core committed instruction budget to estimate against.
+                Defaults to the budget of the simulation's configuration
+
+        Returns:
+            dict: The latest progress report of the simulation
+        """
+        progress = self.root.manager.get_progress(id, max_ticks, max_insts)
+        if progress is None:
+            response = f"Simulation {id} does not exist."
+            return response
+        return progress
+
+    @rpc_json_response
+    def get_sim_metrics(self, id: int, since: float | None = None):
+        """Retrieve the host metrics sampled for a simulation.
+
+        Args:
+            id: The simulation ID
+            since: Only return samples taken after this Unix timestamp
+
+        Returns:
+            dict: The sampling interval and the samples in chronological order
+        """
+        samples = self.root.metrics.get_metrics(id, since)
+        if samples is None:
+            response = f"No metrics recorded for simulation {id}."
+            return response
+        return {
+            "sim_id": id,
+            "interval": self.root.metrics.interval,
+            "samples": samples,
+        }
+
+    @rpc_json_response
+    def get_sim_stats(
+        self, id: int, patterns: list[str], dump: int | None = None
+    ):
+        """Retrieve the stats of a simulation whose names match any pattern.
+
+        Args:
+            id: The simulation ID
+            patterns: Globs, or regular expressions prefixed with "re:"
+            dump: Only return this dump. Negative values count from the last dump
+
+        Returns:
+            dict: The number of dumps and the matching stats of each selected dump
+        """
+        if isinstance(patterns, str):
+            patterns = [patterns]
+        try:
+            stats = self.root.stats.get_stats(id, patterns, dump)
+        except ValueError as e:
+            response = str(e)
+            return response
+        if stats is None:
+            response = f"Simulation {id} does not exist."
+            return response
+        return stats
+
+    @rpc_json_response
+    def aggregate_stats(
+        self,
+        stats: list[str],
+        sim_ids: list[int] | None = None,
+        sweep_id: int | None = None,
+        params: list[str] | None = None,
+        group_by: list[str] | None = None,
+        reductions: list[str] | None = None,
+        dump: int = -1,
+    ):
+        """Tabulate stats across simulations, optionally grouped and reduced.
+
+        Args:
+            stats: Stat names, globs, or regular expressions prefixed with "re:"
+            sim_ids: The simulations to tabulate
+            sweep_id: Tabulate the simulations of this sweep
+            params: Configuration fields to add as columns
+            group_by: Parameter columns to group rows by
+            reductions: Reductions applied to every stat column per group
+            dump: The stats dump to read from each simulation
+
+        Returns:
+            dict: The column names, the values of each column, and the
+                  simulations without the requested dump
+        """
+        if isinstance(stats, str):
+            stats = [stats]
+        try:
+            return self.root.aggregator.aggregate(
+                stats, sim_ids, sweep_id, params, group_by, reductions, dump
+            )
+        except ValueError as e:
+            response = str(e)
+            return response
+
+    @rpc_json_response
+    def get_sim_log(
+        self, id: int, offset: int | None = None, max_bytes: int = 65536
+    ):
+        """Read the captured stdout and stderr of a simulation.
+
+        Args:
+            id: The simulation ID
+            offset: Byte position in the log to read from. Defaults to the end
+                    of the log minus max_bytes
+            max_bytes: Most bytes to return
+
+        Returns:
+            dict: The data read, its offset, the offset to continue from, the
+                  log size and whether the log is complete
+        """
+        log = self.root.logs.read(id, offset, max_bytes)
+        if log is None:
+            response = f"Simulation {id} does not exist."
+            return response
+        return log
+
+    @rpc_json_response
+    def get_sim_files(self, id: int):
+        """List the files in the output directory of a simulation.
+
+        Args:
+            id: The simulation ID
+
+        Returns:
+            list[dict]: The path, size, modification time and download URL
+                        of every file
+        """
+        try:
+            return self.root.files.list_files(id)
+        except ValueError as e:
+            response = str(e)
+            return response
+
+    @rpc_json_response
+    def read_sim_file(
+        self,
+        id: int,
+        path: str,
+        offset: int = 0,
+        length: int = 65536,
+        encoding: str = "text",
+    ):
+        """Read a byte range of a simulation output file.
+
+        Args:
+            id: The simulation ID
+            path: The path of the file relative to the output directory
+            offset: Position to read from. Negative values count from the end
+            length: Most bytes to return
+            encoding: "text" or "base64"
+
+        Returns:
+            dict: The data read, its offset, the offset to continue from, the
+                  file size and whether the end of the file was reached
+        """
+        try:
+            return self.root.files.read(id, path, offset, length, encoding)
+        except (ValueError, OSError) as e:
+            response = str(e)
+            return response
+
+    @rpc_json_response
+    def get_queue_status(self):
+        """Retrieve the state of the simulation scheduler.
+
+        Returns:
+            dict: The concurrency limit and the IDs of running and queued simulations
+        """
+        return self.root.manager.get_queue_status()
+
     @rpc_json_response
     def shutdown(self):
         """Gracefully terminate the gema server process.
@@ -309,6 +1099,13 @@ class GemaFunctions:
         Returns:
             str: A message indicating success or failure of the configuration creation
         """
+        if d_data is not None:
+            problems = self.root.retriever.check_config_data(d_data)
+            if problems:
+                return self._invalid(
+                    f"Config data for ID {config_id} is invalid; nothing was created.",
+                    problems,
+                )
         if self.root.configurator.add_config(config_id, d_data) is False:
             response = f"Config with ID {config_id} already exists."
             return response
@@ -345,17 +1142,23 @@ class GemaFunctions:
         Returns:
             str: A message indicating whether the board configuration was successfully updated
         """
-        if self.root.configurator.set_board(config_id, type, clk) is False:
-            response = f"Config with ID {config_id} does not exist, or given parameter is invalid."
-            return response
-        response = (
-            f"Board configuration updated for ID {config_id} successfully."
+        return self._setter_response(
+            config_id,
+            self.root.configurator.set_board(config_id, type, clk),
+            f"Board configuration for ID {config_id} is invalid; nothing was changed.",
+            f"Board configuration updated for ID {config_id} successfully.",
         )
-        return response
 
     @rpc_json_response
     def set_processor(
-        self, config_id: int, isa: str, type: str, cpu: str, ncores: int
+        self,
+        config_id: int,
+        isa: str,
+        type: str,
+        cpu: str,
+        ncores: int,
+        switch_after_insts: int | None = None,
+        switch_on: str | None = None,
     ):
         """Configure the processor parameters for a specific configuration.
 
@@ -363,24 +1166,28 @@ class GemaFunctions:
             config_id: The identifier of the configuration to modify
             isa: The instruction set architecture
             type: The type of processor
-            cpu: The CPU model to use
+            cpu: The CPU model to use, or to switch to for switchable processors
             ncores: The number of CPU cores
+            switch_after_insts: Switchable processors only: switch CPUs after this many instructions per core
+            switch_on: Switchable processors only: switch CPUs at this exit event
 
         Returns:
             str: A message indicating whether the processor configuration was successfully updated
         """
-        if (
+        return self._setter_response(
+            config_id,
             self.root.configurator.set_processor(
-                config_id, isa, type, cpu, ncores
-            )
-            is False
-        ):
-            response = f"Config with ID {config_id} does not exist, or given parameter is invalid."
-            return response
-        response = (
-            f"Processor configuration updated for ID {config_id} successfully."
+                config_id,
+                isa,
+                type,
+                cpu,
+                ncores,
+                switch_after_insts,
+                switch_on,
+            ),
+            f"Processor configuration for ID {config_id} is invalid; nothing was changed.",
+            f"Processor configuration updated for ID {config_id} successfully.",
         )
-        return response
 
     @rpc_json_response
     def set_memory(self, config_id: int, type: str, size: int):
@@ -394,13 +1201,12 @@ class GemaFunctions:
         Returns:
             str: A message indicating whether the memory configuration was successfully updated
         """
-        if self.root.configurator.set_memory(config_id, type, size) is False:
-            response = f"Config with ID {config_id} does not exist, or given parameter is invalid."
-            return response
-        response = (
-            f"Memory configuration updated for ID {config_id} successfully."
+        return self._setter_response(
+            config_id,
+            self.root.configurator.set_memory(config_id, type, size),
+            f"Memory configuration for ID {config_id} is invalid; nothing was changed.",
+            f"Memory configuration updated for ID {config_id} successfully.",
         )
-        return response
 
     @rpc_json_response
     def set_cache(
@@ -429,7 +1235,8 @@ class GemaFunctions:
         Returns:
             str: A message indicating whether the cache configuration was successfully updated
         """
-        if (
+        return self._setter_response(
+            config_id,
             self.root.configurator.set_cache(
                 config_id,
                 type,
@@ -439,32 +1246,87 @@ class GemaFunctions:
                 l1d_assoc,
                 l1i_assoc,
                 l2_assoc,
-            )
-            is False
-        ):
-            response = f"Config with ID {config_id} does not exist, or given parameter is invalid."
-            return response
-        response = (
-            f"Cache configuration updated for ID {config_id} successfully."
+            ),
+            f"Cache configuration for ID {config_id} is invalid; nothing was changed.",
+            f"Cache configuration updated for ID {config_id} successfully.",
         )
-        return response
 
     @rpc_json_response
-    def set_resource(self, config_id: int, resource: str):
+    def set_resource(
+        self, config_id: int, resource: str, version: str | None = None
+    ):
         """Set a specific resource for a configuration.
 
         Args:
             config_id: The identifier of the configuration to modify
             resource: The resource to set
+            version: Optional resource version; the latest is used if omitted
 
         Returns:
             str: A message indicating whether the resource was successfully updated
         """
-        if self.root.configurator.set_resource(config_id, resource) is False:
-            response = f"Config with ID {config_id} does not exist."
-            return response
-        response = f"Resource updated for ID {config_id} successfully."
-        return response
+        return self._setter_response(
+            config_id,
+            self.root.configurator.set_resource(config_id, resource, version),
+            f"Resource for ID {config_id} is invalid; nothing was changed.",
+            f"Resource updated for ID {config_id} successfully.",
+        )
+
+    @rpc_json_response
+    def set_budget(
+        self,
+        config_id: int,
+        max_ticks: int | None = None,
+        max_insts: int | None = None,
+        timeout: float | None = None,
+    ):
+        """Limit how long simulations of a specific configuration may run.
+
+        Args:
+            config_id: The identifier of the configuration to modify
+            max_ticks: Stop the simulation after this many simulated ticks
+            max_insts: Stop the simulation once any core has committed this many instructions
+            timeout: Terminate the simulation after this many wall-clock seconds
+
+        Returns:
+            str: A message indicating whether the budget was successfully updated
+        """
+        return self._setter_response(
+            config_id,
+            self.root.configurator.set_budget(
+                config_id, max_ticks, max_insts, timeout
+            ),
+            f"Budget for ID {config_id} is invalid; nothing was changed.",
+            f"Budget updated for ID {config_id} successfully.",
+        )
+
+    @rpc_json_response
+    def set_exit_handlers(
+        self,
+        config_id: int,
+        workbegin: list[str] | None = None,
+        workend: list[str] | None = None,
+        m5_exit: list[str] | None = None,
+    ):
+        """Set the actions taken when simulations of a configuration hit exit events.
+
+        Args:
+            config_id: The identifier of the configuration to modify
+            workbegin: Actions on a workbegin event
+            workend: Actions on a workend event
+            m5_exit: Actions on an m5 exit event
+
+        Returns:
+            str: A message indicating whether the handlers were successfully updated
+        """
+        return self._setter_response(
+            config_id,
+            self.root.configurator.set_exit_handlers(
+                config_id, workbegin, workend, m5_exit
+            ),
+            f"Exit handlers for ID {config_id} are invalid; nothing was changed.",
+            f"Exit handlers updated for ID {config_id} successfully.",
+        )
 
     @rpc_json_response
     def get_config_by_id(self, config_id: int):
@@ -485,13 +1347,17 @@ class GemaFunctions:
             return response
 
     @rpc_json_response
-    def get_configs(self):
-        """Retrieve all stored configurations.
+    def get_configs(self, filters: dict | None = None):
+        """Retrieve all stored configurations, optionally filtered.
+
+        Args:
+            filters: Optional mapping of indexed fields to required values, e.g.
+                {"board.type": "SimpleBoard", "processor.cpu": "timing"}
 
         Returns:
-            list[GemaConfiguration]: A list of all stored configuration objects
+            list[GemaConfiguration]: A list of the matching configuration objects
         """
-        return self.root.configurator.configs
+        return self.root.configurator.get_configs(filters)
 
     @rpc_json_response
     def get_sims(self):
@@ -500,18 +1366,20 @@ class GemaFunctions:
         Returns:
             list[GemaSimulation]: A list of all stored simulation objects
         """
-        return [sim.to_dict() for sim in self.root.sims]
+        return self.root.manager.get_sims()
 
     @rpc_json_response
-    def manage_sim(self, id: int, cmd: str):
+    def manage_sim(self, id: int, cmd: str, kind: str = "auto"):
         """Manage a running simulation by ID or PID.
 
         Args:
             id: The simulation ID or process ID
             cmd: The command to execute on the simulation
+            kind: How to interpret id: "sim_id", "pid" or "auto". With "auto",
+                a matching simulation ID takes precedence over a process ID.
 
         Returns:
             str: A message indicating the result of the management command
         """
-        response = self.root.manager.manage_simulation(id, cmd)
+        response = self.root.manager.manage_simulation(id, cmd, kind)
         return response
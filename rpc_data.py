@@ -17,8 +17,9 @@ from dataclasses import (
     field,
     asdict
 )
-from typing import Optional
+from typing import Callable, Optional
 from pathlib import Path
+import json
 
 @dataclass
 class GemaBoard:
@@ -32,6 +33,10 @@ class GemaProcessor:
     type: Optional[str] = None
     cpu: Optional[str] = None
     ncores: Optional[int] = None
+    # Switchable processors only: switch from the atomic CPU to ``cpu`` after
+    # this many instructions per core or at this exit event, whichever is first
+    switch_after_insts: Optional[int] = None
+    switch_on: Optional[str] = None
 
 
 @dataclass
@@ -51,25 +56,172 @@ class GemaCache:
     l2_assoc: Optional[int] = None
 
 
+@dataclass
+class GemaBudget:
+    # Simulated ticks and committed instructions per core
+    max_ticks: Optional[int] = None
+    max_insts: Optional[int] = None
+    # Wall-clock seconds
+    timeout: Optional[float] = None
+
+
+@dataclass
+class GemaExitHandlers:
+    # Actions run when the exit event fires, in order. None keeps the gem5 default
+    workbegin: Optional[list[str]] = None
+    workend: Optional[list[str]] = None
+    m5_exit: Optional[list[str]] = None
+
+
 @dataclass
 class GemaConfiguration:
     config_id: int
     resource: Optional[str] = None
+    resource_version: Optional[str] = None
     board: GemaBoard = field(default_factory=GemaBoard)
     processor: GemaProcessor = field(default_factory=GemaProcessor)
     memory: GemaMemory = field(default_factory=GemaMemory)
     cache: GemaCache = field(default_factory=GemaCache)
+    budget: GemaBudget = field(default_factory=GemaBudget)
+    exit_handlers: GemaExitHandlers = field(default_factory=GemaExitHandlers)
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "GemaConfiguration":
+        data = dict(data)
+        data["board"] = GemaBoard(**data.get("board", {}))
+        data["processor"] = GemaProcessor(**data.get("processor", {}))
+        data["memory"] = GemaMemory(**data.get("memory", {}))
+        data["cache"] = GemaCache(**data.get("cache", {}))
+        data["budget"] = GemaBudget(**data.get("budget", {}))
+        data["exit_handlers"] = GemaExitHandlers(**data.get("exit_handlers", {}))
+        return cls(**data)
+
+    def to_json(self) -> str:
+        return json.dumps(asdict(self), separators=(",", ":"))
+
+    @classmethod
+    def from_json(cls, data: str) -> "GemaConfiguration":
+        return cls.from_dict(json.loads(data))
+
+
+class _Deferred:
+    """A dataclass field that is converted from its stored form on first access.
+
+    The state store loads simulations with their configuration snapshot still
+    encoded as JSON and their path as a string. Decoding both for every
+    stored simulation would dominate startup, so it is left to the first
+    read of the field. Any value that is not a string is stored as it is.
+    """
+
+    def __init__(self, decode: Callable[[str], object]) -> None:
+        self.decode = decode
+
+    def __set_name__(self, owner, name: str) -> None:
+        self.name = name
+        self.attr = f"_{name}"
+
+    def __get__(self, obj, owner=None):
+        if obj is None:
+            # Tells dataclasses that the field has no default
+            raise AttributeError(self.name)
+        value = obj.__dict__[self.attr]
+        if isinstance(value, str):
+            value = obj.__dict__[self.attr] = self.decode(value)
+        return value
+
+    def __set__(self, obj, value) -> None:
+        obj.__dict__[self.attr] = value
+
+
+class SimStatus:
+    """Lifecycle states of a GemaSimulation."""
+
+    QUEUED = "queued"
+    RUNNING = "running"
+    FINISHED = "finished"
+    FAILED = "failed"
+    KILLED = "killed"
+    CANCELLED = "cancelled"
+    # Was running when a previous server instance stopped
+    INTERRUPTED = "interrupted"
+    # Stopped by the manager when its wall-clock budget ran out
+    TIMED_OUT = "timed_out"
+
+    # States from which a simulation never leaves
+    DONE = (FINISHED, FAILED, KILLED, CANCELLED, INTERRUPTED, TIMED_OUT)
 
 
 @dataclass
 class GemaSimulation:
     sim_id: int
-    config: GemaConfiguration
+    # Either may be given in stored form, a JSON document and a string
+    config: GemaConfiguration = _Deferred(GemaConfiguration.from_json)
     generated_on: str
-    path: Path
+    path: Path = _Deferred(Path)
     pid: Optional[int] = None
+    status: str = SimStatus.QUEUED
+    config_hash: Optional[str] = None
+    cached_from: Optional[int] = None
+    # Recorded when the gem5 process exits
+    exit_code: Optional[int] = None
+    ended_on: Optional[str] = None
+    final_tick: Optional[int] = None
+    exit_cause: Optional[str] = None
+    # Checkpoint cache entry the warm-up was restored from, or saved to
+    checkpoint: Optional[str] = None
+    checkpoint_restored: bool = False
+    # What ended the run early: a budget limit ("max_ticks", "max_insts" or
+    # "timeout") or the exit event whose handler stopped it ("workend", ...)
+    ended_by: Optional[str] = None
+    # Set by the archiver once the outputs were "compacted", and once
+    # retention has "pruned" them, with their size on disk afterwards
+    archived: Optional[str] = None
+    output_size: Optional[int] = None
+    # Local path of the resource, resolved by the server before launch
+    resource_path: Optional[str] = None
+    # Host CPUs the gem5 process is pinned to, and the NUMA node its memory
+    # is allocated on, when the server pins simulations
+    cpus: Optional[list[int]] = None
+    numa_node: Optional[int] = None
+
+    def config_json(self) -> str:
+        """Return the configuration snapshot as JSON, decoding it only if needed."""
+        config = self.__dict__["_config"]
+        return config if isinstance(config, str) else config.to_json()
 
     def to_dict(self):
         data = asdict(self)
         data["path"] = str(self.path)
         return data
+
+
+@dataclass
+class GemaSweep:
+    sweep_id: int
+    generated_on: str
+    mode: str
+    axes: dict
+    config_ids: list[int] = field(default_factory=list)
+    sim_ids: list[int] = field(default_factory=list)
+
+
+@dataclass
+class GemaCheckpoint:
+    key: str
+    path: str
+    size: int
+    created_on: str
+    # Unix time of the last restore, used for LRU eviction
+    last_used: float
+    # Tick and leading core instruction count at which it was taken
+    tick: int
+    insts: int
+
+
+@dataclass
+class GemaCachedResult:
+    config_hash: str
+    sim_id: int
+    path: str
+    stats_path: str
+    recorded_on: str
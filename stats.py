@@ -0,0 +1,263 @@
+# ----------------------------------------------------------------------------
+# File: <stats>.py
+#
+# Description:
+# <Parses and queries the statistics of gem5 simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Iterable, Iterator, Optional, Union
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import gzip
+import os
+import re
+import threading
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+from pathlib import Path
+
+from gem5.utils.gema.archive import ARCHIVE_SUFFIX
+from gem5.utils.gema.results import GemaResultCache
+
+# Prefix that marks a pattern as a regular expression rather than a glob
+REGEX_PREFIX = "re:"
+
+_BEGIN = b"---------- Begin Simulation Statistics ----------"
+_END = b"---------- End Simulation Statistics"
+
+
+def parse_stats(
+    lines: Iterable[bytes],
+) -> Iterator[tuple[int, dict[str, Union[int, float, str]]]]:
+    """Parse the dumps of a gem5 stats.txt file as it is read.
+
+    Only complete dumps are yielded, so a file that gem5 is still writing can
+    be parsed up to its last complete dump.
+
+    Args:
+        lines (Iterable[bytes]): The lines of the file, e.g. the open file.
+
+    Yields:
+        tuple[int, dict]: The number of bytes read up to and including the end
+                         of the dump, and the dump itself, mapping stat names
+                         to their first value. Values are ints or floats where
+                         possible.
+    """
+    offset = 0
+    dump = None
+    for line in lines:
+        offset += len(line)
+        if line.startswith(_BEGIN):
+            dump = {}
+        elif line.startswith(_END):
+            if dump is not None:
+                yield offset, dump
+            dump = None
+        elif dump is not None:
+            fields = line.split(None, 2)
+            if len(fields) >= 2 and not fields[0].startswith(b"#"):
+                dump[fields[0].decode(errors="replace")] = _value(fields[1])
+
+
+def _value(token: bytes) -> Union[int, float, str]:
+    text = token.decode(errors="replace")
+    try:
+        return int(text)
+    except ValueError:
+        pass
+    try:
+        return float(text)
+    except ValueError:
+        return text
+
+
+def compile_patterns(patterns: list[str]):
+    """Turn stat name patterns into a predicate.
+
+    Patterns are globs (``board.processor.*.ipc``), or regular expressions
+    searched in the stat name when prefixed with REGEX_PREFIX
+    (``re:cores?\\d*\\.ipc$``).
+
+    Args:
+        patterns (list[str]): The patterns. A stat matches if any matches.
+
+    Returns:
+        Callable[[str], bool]: The predicate.
+
+    Raises:
+        ValueError: If a pattern is not a string or not a valid regex.
+    """
+    globs, regexes = [], []
+    for pattern in patterns:
+        if not isinstance(pattern, str):
+            raise ValueError(f"Stat patterns must be strings, got {pattern!r}.")
+        if pattern.startswith(REGEX_PREFIX):
+            try:
+                regexes.append(re.compile(pattern[len(REGEX_PREFIX) :]))
+            except re.error as e:
+                raise ValueError(f"Invalid stat pattern '{pattern}': {e}.")
+        else:
+            globs.append(pattern)
+
+    def matches(name: str) -> bool:
+        return any(fnmatchcase(name, glob) for glob in globs) or any(
+            regex.search(name) for regex in regexes
+        )
+
+    return matches
+
+
+class _ParsedStats:
+    """The parsed dumps of one stats file, and how far it has been read."""
+
+    def __init__(self, inode: int) -> None:
+        self.inode = inode
+        self.size = -1
+        self.mtime_ns = -1
+        # Bytes of the file covered by the complete dumps
+        self.offset = 0
+        self.dumps: list[dict] = []
+
+
+class GemaStatsReader:
+    """Parses the stats.txt files of simulations and answers queries on them.
+
+    Parsed files are cached per simulation and revalidated against the
+    file's size and modification time on every query. gem5 only ever
+    appends dumps, so a file that grew is parsed from where the last
+    complete dump ended instead of from the start. Files that were replaced
+    or truncated are parsed again. Files compacted by the archiver are
+    parsed once from their gzip stream, and parsed again only if their
+    inode, size or modification time changes. Only the MAX_CACHED most
+    recently queried files are kept.
+
+    Queries return only the stats matching the given patterns, so clients
+    never have to download whole stats files.
+
+    Attributes:
+        root (Gema): Reference to the root Gema object.
+    """
+
+    MAX_CACHED = 64
+
+    def __init__(self, root: Gema) -> None:
+        self.root = root
+        self._parsed: OrderedDict[Path, _ParsedStats] = OrderedDict()
+        self._lock = threading.RLock()
+
+    def get_stats(
+        self, sim_id: int, patterns: list[str], dump: Optional[int] = None
+    ) -> Optional[dict]:
+        """Return the stats of a simulation whose names match any pattern.
+
+        Args:
+            sim_id (int): The ID of the simulation.
+            patterns (list[str]): Globs, or regexes prefixed with "re:".
+            dump (Optional[int]): Only return this dump. Negative indexes count
+                                from the last dump. All dumps if None.
+
+        Returns:
+            Optional[dict]: The number of dumps and the matching stats of the
+                          selected dumps, or None if the simulation does not
+                          exist.
+
+        Raises:
+            ValueError: If a pattern is invalid or the dump does not exist.
+        """
+        sim = self.root.manager.get_sim(sim_id)
+        if sim is None:
+            return None
+        matches = compile_patterns(patterns)
+        dumps = self.get_dumps(Path(sim.path) / GemaResultCache.STATS_FILE)
+
+        indexes = range(len(dumps))
+        if dump is not None:
+            if not -len(dumps) <= dump < len(dumps):
+                raise ValueError(
+                    f"Simulation {sim_id} has {len(dumps)} stat dump(s), no dump {dump}."
+                )
+            indexes = [indexes[dump]]
+        return {
+            "sim_id": sim_id,
+            "dump_count": len(dumps),
+            "dumps": [
+                {
+                    "dump": index,
+                    "stats": {
+                        name: value
+                        for name, value in dumps[index].items()
+                        if matches(name)
+                    },
+                }
+                for index in indexes
+            ],
+        }
+
+    def get_dumps(self, path: Path) -> list[dict]:
+        """Return the complete dumps of a stats file, parsing what is new.
+
+        Args:
+            path (Path): The stats file.
+
+        Returns:
+            list[dict]: The dumps in file order. Empty if the file does not
+                       exist yet. The dumps are shared and must not be
+                       modified.
+        """
+        path = Path(path)
+        with self._lock:
+            source = path
+            try:
+                stat = os.stat(source)
+            except OSError:
+                source = path.with_name(path.name + ARCHIVE_SUFFIX)
+                try:
+                    stat = os.stat(source)
+                except OSError:
+                    self._parsed.pop(path, None)
+                    return []
+
+            parsed = self._parsed.get(path)
+            key = (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+            if parsed is None or (
+                key != (parsed.inode, parsed.size, parsed.mtime_ns)
+                # The offset counts decompressed bytes, which cannot be
+                # compared with the size of an archive. Archives are written
+                # once, so any change means the file was replaced.
+                and (
+                    source != path
+                    or stat.st_ino != parsed.inode
+                    or stat.st_size < parsed.offset
+                )
+            ):
+                parsed = _ParsedStats(stat.st_ino)
+            if (stat.st_size, stat.st_mtime_ns) != (parsed.size, parsed.mtime_ns):
+                self._read(source, parsed)
+                parsed.size, parsed.mtime_ns = stat.st_size, stat.st_mtime_ns
+
+            self._parsed[path] = parsed
+            self._parsed.move_to_end(path)
+            while len(self._parsed) > self.MAX_CACHED:
+                self._parsed.popitem(last=False)
+            return list(parsed.dumps)
+
+    def _read(self, path: Path, parsed: _ParsedStats) -> None:
+        """Parse the dumps that were appended since the last read."""
+        opener = gzip.open if path.name.endswith(ARCHIVE_SUFFIX) else open
+        with opener(path, "rb") as f:
+            f.seek(parsed.offset)
+            base = parsed.offset
+            for offset, dump in parse_stats(f):
+                parsed.dumps.append(dump)
+                parsed.offset = base + offset
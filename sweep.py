@@ -0,0 +1,276 @@
+# ----------------------------------------------------------------------------
+# File: <sweep>.py
+#
+# Description:
+# <Handles expansion and submission of parameter sweeps>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from gem5.utils.gema import Gema
+
+import copy
+import itertools
+import math
+import random
+import threading
+from dataclasses import fields
+from datetime import datetime
+
+from gem5.utils.gema.rpc_data import (
+    GemaBoard,
+    GemaBudget,
+    GemaCache,
+    GemaExitHandlers,
+    GemaMemory,
+    GemaProcessor,
+    GemaSweep,
+)
+
+
+class GemaSweepGenerator:
+    """A class responsible for expanding and launching parameter sweeps.
+
+    A sweep is described by a base configuration, in the dictionary format
+    accepted by ``add_config``, and a set of axes. Each axis maps a dotted
+    field name (e.g. ``"processor.ncores"`` or ``"cache.l2_size"``) to the
+    values it should take. The axes are expanded server-side into design
+    points, every point is checked against the discovered options, and the
+    resulting configurations are created and queued as a single batch.
+
+    An axis can be given as:
+        - a list of values: ``[1, 2, 4]``
+        - an explicit value list: ``{"values": ["timing", "o3"]}``
+        - an arithmetic range: ``{"start": 1, "stop": 8, "step": 1}``
+        - a geometric range: ``{"start": 64, "stop": 1024, "factor": 2}``
+
+    Ranges include ``stop`` when it is reached exactly.
+    """
+
+    MODES = ("product", "sample")
+    # Upper bound on the number of points a single sweep may create
+    MAX_POINTS = 100_000
+
+    _COMPONENTS = {
+        "board": GemaBoard,
+        "processor": GemaProcessor,
+        "memory": GemaMemory,
+        "cache": GemaCache,
+        "budget": GemaBudget,
+        "exit_handlers": GemaExitHandlers,
+    }
+
+    def __init__(self, root: Gema) -> None:
+        self.root = root
+        self.sweeps: dict[int, GemaSweep] = {}
+        self._last_sweep_id = 0
+        self._lock = threading.RLock()
+
+    def get_sweeps(self) -> list[GemaSweep]:
+        """Return all recorded sweeps in creation order."""
+        with self._lock:
+            return list(self.sweeps.values())
+
+    def get_sweep(self, sweep_id: int) -> Optional[GemaSweep]:
+        """Return the sweep with the given ID, or None."""
+        with self._lock:
+            return self.sweeps.get(sweep_id)
+
+    def create_sweep(
+        self,
+        base: dict,
+        axes: dict,
+        mode: str = "product",
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+        use_cache: bool = True,
+    ) -> tuple[Optional[GemaSweep], list[dict]]:
+        """Expand, validate, create and queue a parameter sweep.
+
+        Nothing is created unless every design point is valid.
+
+        Args:
+            base: The base configuration in ``add_config`` dictionary format.
+            axes: Mapping of dotted field names to axis specifications.
+            mode: "product" for the full cartesian product of all axes, or
+                "sample" for a random subset of it.
+            samples: Number of points to draw in "sample" mode.
+            seed: Optional seed that makes "sample" mode reproducible.
+            use_cache: Whether points identical to finished simulations may
+                reuse their cached results.
+
+        Returns:
+            tuple: The queued sweep and an empty list on success, or None and a
+                list of ``{"point", "values", "problems"}`` entries describing
+                every invalid design point.
+
+        Raises:
+            ValueError: If the mode, an axis name or an axis specification is
+                invalid, or the sweep exceeds MAX_POINTS.
+        """
+        points = self.expand(axes, mode, samples, seed)
+        datas = [self._apply_point(base, point) for point in points]
+
+        configurator = self.root.configurator
+        problems = []
+        for index, (point, data) in enumerate(zip(points, datas)):
+            point_problems = self.root.retriever.check_config_data(
+                data, complete=True
+            )
+            if point_problems:
+                problems.append(
+                    {
+                        "point": index,
+                        "values": point,
+                        "problems": point_problems,
+                    }
+                )
+        if problems:
+            return None, problems
+
+        config_ids = configurator.add_configs(datas)
+        sim_ids = self.root.manager.start_subprocesses(config_ids, use_cache)
+
+        with self._lock:
+            self._last_sweep_id += 1
+            sweep = GemaSweep(
+                sweep_id=self._last_sweep_id,
+                generated_on=datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+                mode=mode,
+                axes=axes,
+                config_ids=config_ids,
+                sim_ids=sim_ids,
+            )
+            self.sweeps[sweep.sweep_id] = sweep
+            self.root.state.save_sweep(sweep)
+        return sweep, []
+
+    def restore(self, sweeps: list[GemaSweep]) -> None:
+        """Load sweeps replayed from the state store at startup."""
+        with self._lock:
+            for sweep in sweeps:
+                self.sweeps[sweep.sweep_id] = sweep
+                self._last_sweep_id = max(self._last_sweep_id, sweep.sweep_id)
+
+    def expand(
+        self,
+        axes: dict,
+        mode: str = "product",
+        samples: Optional[int] = None,
+        seed: Optional[int] = None,
+    ) -> list[dict]:
+        """Expand sweep axes into design points.
+
+        Args:
+            axes: Mapping of dotted field names to axis specifications.
+            mode: "product" or "sample".
+            samples: Number of points to draw in "sample" mode.
+            seed: Optional seed for "sample" mode.
+
+        Returns:
+            list[dict]: One ``{field: value}`` mapping per design point.
+
+        Raises:
+            ValueError: If the mode or any axis is invalid, or the sweep
+                exceeds MAX_POINTS.
+        """
+        if mode not in self.MODES:
+            raise ValueError(
+                f"Invalid sweep mode '{mode}'. Use one of: {', '.join(self.MODES)}."
+            )
+
+        names = list(axes)
+        for name in names:
+            self._check_field(name)
+        values = [self._axis_values(name, axes[name]) for name in names]
+        total = math.prod(len(axis) for axis in values)
+
+        if mode == "product":
+            if total > self.MAX_POINTS:
+                raise ValueError(
+                    f"Sweep expands to {total} points, more than the maximum of {self.MAX_POINTS}."
+                )
+            return [
+                dict(zip(names, combination))
+                for combination in itertools.product(*values)
+            ]
+
+        if samples is None or samples <= 0:
+            raise ValueError("Sample mode requires a positive 'samples' count.")
+        count = min(samples, total, self.MAX_POINTS)
+        # Draw flat indices into the product space and decode them, so the
+        # full product never has to be materialized.
+        indices = sorted(random.Random(seed).sample(range(total), count))
+        points = []
+        for flat in indices:
+            point = {}
+            for name, axis in zip(reversed(names), reversed(values)):
+                flat, digit = divmod(flat, len(axis))
+                point[name] = axis[digit]
+            points.append({name: point[name] for name in names})
+        return points
+
+    def _check_field(self, name: str) -> None:
+        """Raise ValueError unless ``name`` is a field a sweep can vary."""
+        if name in ("resource", "resource.name"):
+            return
+        component, _, attr = name.partition(".")
+        cls = self._COMPONENTS.get(component)
+        if cls is None or attr not in {f.name for f in fields(cls)}:
+            raise ValueError(f"Unknown sweep field '{name}'.")
+
+    def _axis_values(self, name: str, spec: Any) -> list:
+        """Turn an axis specification into its list of values."""
+        if isinstance(spec, list):
+            values = list(spec)
+        elif isinstance(spec, dict) and "values" in spec:
+            values = list(spec["values"])
+        elif isinstance(spec, dict) and "start" in spec and "stop" in spec:
+            start, stop = spec["start"], spec["stop"]
+            if "step" in spec:
+                if spec["step"] <= 0:
+                    raise ValueError(f"Axis '{name}' needs a positive step.")
+                count = int((stop - start) / spec["step"] + 1e-9) + 1
+                values = [start + i * spec["step"] for i in range(count)]
+                if any(isinstance(v, float) for v in (start, spec["step"])):
+                    # Drop accumulated floating point noise (1.7000000000000002)
+                    values = [round(value, 9) for value in values]
+            elif "factor" in spec:
+                if spec["factor"] <= 1 or start <= 0:
+                    raise ValueError(
+                        f"Axis '{name}' needs a factor > 1 and a positive start."
+                    )
+                values = []
+                value = start
+                while value <= stop:
+                    values.append(value)
+                    value *= spec["factor"]
+            else:
+                raise ValueError(f"Axis '{name}' needs a 'step' or 'factor'.")
+        else:
+            values = [spec]
+
+        if not values:
+            raise ValueError(f"Axis '{name}' has no values.")
+        return values
+
+    def _apply_point(self, base: dict, point: dict) -> dict:
+        """Return a copy of ``base`` with the values of one design point set."""
+        data = copy.deepcopy(base)
+        for name, value in point.items():
+            if name in ("resource", "resource.name"):
+                data.setdefault("resource", {})["name"] = value
+                continue
+            component, attr = name.split(".")
+            data.setdefault(component, {})[attr] = value
+        return data
@@ -0,0 +1,107 @@
+# ----------------------------------------------------------------------------
+# File: <test_aggregate>.py
+#
+# Description:
+# <Tests of the stats tables built across simulations and sweeps>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.utils.gema.aggregate import GemaStatsAggregator
+from gem5.utils.gema.rpc_data import (
+    GemaConfiguration,
+    GemaProcessor,
+    GemaSimulation,
+    GemaSweep,
+)
+
+
+def make_sim(sim_id: int, resource: str, ncores: int) -> GemaSimulation:
+    return GemaSimulation(
+        sim_id=sim_id,
+        config=GemaConfiguration(
+            config_id=sim_id,
+            resource=resource,
+            processor=GemaProcessor(isa="X86", ncores=ncores),
+        ),
+        generated_on="2026-01-01 00:00:00",
+        path=Path(f"/tmp/m5out/sim_{sim_id}"),
+    )
+
+
+class GemaStatsAggregatorTest(unittest.TestCase):
+    def setUp(self):
+        self.sims = {
+            1: make_sim(1, "a", 1),
+            2: make_sim(2, "b", 1),
+            3: make_sim(3, "a", 2),
+            4: make_sim(4, "b", 2),
+        }
+        # The IPC of every simulation is its ID
+        dumps = {
+            sim.path / "stats.txt": [{"ipc": float(sim_id), "policy": "x"}]
+            for sim_id, sim in self.sims.items()
+        }
+        self.sweep = GemaSweep(
+            sweep_id=1,
+            generated_on="2026-01-01 00:00:00",
+            mode="product",
+            axes={"resource.name": ["a", "b"], "processor.ncores": [1, 2]},
+            config_ids=[1, 2, 3, 4],
+            sim_ids=[1, 2, 3, 4],
+        )
+        sweeps = {1: self.sweep}
+        root = SimpleNamespace(
+            manager=mock.Mock(get_sim=self.sims.get),
+            sweeper=mock.Mock(get_sweep=sweeps.get),
+            stats=mock.Mock(get_dumps=lambda path: dumps.get(path, [])),
+        )
+        self.aggregator = GemaStatsAggregator(root)
+
+    def test_sweep_axes_are_columns(self):
+        table = self.aggregator.aggregate(["ipc"], sweep_id=1)
+        self.assertEqual(
+            table["columns"], ["sim_id", "resource", "processor.ncores", "ipc"]
+        )
+        self.assertEqual(table["data"]["resource"], ["a", "b", "a", "b"])
+        self.assertEqual(table["data"]["ipc"], [1.0, 2.0, 3.0, 4.0])
+        self.assertEqual(table["missing"], [])
+
+    def test_group_and_reduce(self):
+        table = self.aggregator.aggregate(
+            ["ipc", "policy"],
+            sim_ids=[1, 2, 3, 4],
+            group_by=["resource"],
+            reductions=["mean", "max"],
+        )
+        self.assertEqual(table["data"]["resource"], ["a", "b"])
+        self.assertEqual(table["data"]["sim_count"], [2, 2])
+        self.assertEqual(table["data"]["ipc:mean"], [2.0, 3.0])
+        self.assertEqual(table["data"]["ipc:max"], [3.0, 4.0])
+        self.assertEqual(table["data"]["policy:mean"], [None, None])
+
+    def test_varying_fields_by_default(self):
+        table = self.aggregator.aggregate(["ipc"], sim_ids=[1, 3])
+        self.assertEqual(table["columns"], ["sim_id", "processor.ncores", "ipc"])
+
+    def test_unknown_names(self):
+        with self.assertRaises(ValueError):
+            self.aggregator.aggregate(["ipc"], sim_ids=[1], params=["nope"])
+        with self.assertRaises(ValueError):
+            self.aggregator.aggregate(["ipc"], sim_ids=[1], reductions=["median"])
+        with self.assertRaises(ValueError):
+            self.aggregator.aggregate(["ipc"], sweep_id=2)
+
+
+if __name__ == "__main__":
+    unittest.main()
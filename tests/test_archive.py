@@ -0,0 +1,155 @@
+# ----------------------------------------------------------------------------
+# File: <test_archive>.py
+#
+# Description:
+# <Tests of output compaction, range reads of compacted files and retention>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import gzip
+import json
+import os
+import random
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.utils.gema.archive import (
+    ARCHIVE_INDEX,
+    ARCHIVE_SUFFIX,
+    GemaOutputArchiver,
+    compress_file,
+    open_archived,
+    output_exists,
+)
+from gem5.utils.gema.rpc_data import GemaConfiguration, GemaSimulation, SimStatus
+
+
+class CompressFileTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "trace.out"
+        self.data = random.Random(5).randbytes(10_000) + b"x" * 7_000
+        self.path.write_bytes(self.data)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def write_index(self, entry: dict) -> None:
+        (Path(self.dir.name) / ARCHIVE_INDEX).write_text(
+            json.dumps({"files": {"trace.out": entry}})
+        )
+
+    def test_result_is_a_gzip_file(self):
+        entry = compress_file(self.path, block_size=4096)
+        archive = self.path.with_name(self.path.name + ARCHIVE_SUFFIX)
+        self.assertEqual(gzip.decompress(archive.read_bytes()), self.data)
+        self.assertEqual(entry["size"], len(self.data))
+        self.assertEqual(len(entry["offsets"]), 6)
+        self.assertEqual(entry["offsets"][-1], archive.stat().st_size)
+        self.assertTrue(self.path.exists())
+
+    def test_ranges_round_trip(self):
+        entry = compress_file(self.path, block_size=4096)
+        archive = self.path.with_name(self.path.name + ARCHIVE_SUFFIX)
+        self.write_index(entry)
+        archived = open_archived(Path(self.dir.name), "trace.out")
+        self.assertEqual(archived.path, archive)
+        self.assertEqual(archived.size, len(self.data))
+        for start, stop in [
+            (0, len(self.data)),
+            (0, 1),
+            (4095, 4097),
+            (4096, 8192),
+            (5000, 13000),
+            (len(self.data) - 3, len(self.data) + 100),
+            (len(self.data), len(self.data) + 1),
+        ]:
+            with self.subTest(start=start, stop=stop):
+                self.assertEqual(
+                    b"".join(archived.iter_range(start, stop)),
+                    self.data[start:stop],
+                )
+        self.assertEqual(archived.read(100, 50), self.data[100:150])
+
+    def test_empty_file(self):
+        self.path.write_bytes(b"")
+        entry = compress_file(self.path)
+        self.assertEqual(entry["offsets"], [0])
+        self.write_index(entry)
+        archived = open_archived(Path(self.dir.name), "trace.out")
+        self.assertEqual(archived.read(0, 10), b"")
+
+
+class GemaOutputArchiverTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.manager = mock.Mock()
+        root = SimpleNamespace(manager=self.manager)
+        self.archiver = GemaOutputArchiver(root, workers=0, min_size=1024)
+        self.sim = GemaSimulation(
+            sim_id=1,
+            config=GemaConfiguration(config_id=1),
+            generated_on="2026-01-01 00:00:00",
+            path=Path(self.dir.name) / "sim_1",
+            status=SimStatus.FINISHED,
+        )
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_compact(self):
+        directory = Path(self.sim.path)
+        os.makedirs(directory / "m5.cpt.1")
+        stats = b"simTicks 1\n" * 1000
+        (directory / "stats.txt").write_bytes(stats)
+        (directory / "small.txt").write_bytes(b"x")
+        (directory / "gema.log").write_bytes(b"y" * 4096)
+        (directory / "m5.cpt.1" / "m5.cpt").write_bytes(b"z" * 4096)
+
+        self.assertEqual(self.archiver.compact(self.sim), 1)
+        self.assertFalse((directory / "stats.txt").exists())
+        self.assertTrue(output_exists(directory / "stats.txt"))
+        archived = open_archived(directory, "stats.txt")
+        self.assertEqual(archived.read(0, len(stats)), stats)
+        for name in ("small.txt", "gema.log", "m5.cpt.1/m5.cpt"):
+            self.assertTrue((directory / name).is_file())
+
+        self.manager.set_archived.assert_called_once()
+        sim, state, size = self.manager.set_archived.call_args.args
+        self.assertIs(sim, self.sim)
+        self.assertEqual(state, "compacted")
+        self.assertGreater(size, 0)
+
+    def test_missing_outputs_are_marked_compacted(self):
+        self.assertEqual(self.archiver.compact(self.sim), 0)
+        self.manager.set_archived.assert_called_once_with(
+            self.sim, "compacted", 0
+        )
+
+    def test_prune_keeps_retained_files(self):
+        directory = Path(self.sim.path)
+        os.makedirs(directory / "m5.cpt.1")
+        for name in ("stats.txt", "config.ini", "gema.log", "trace.out"):
+            (directory / name).write_bytes(b"x" * 2048)
+        (directory / "m5.cpt.1" / "m5.cpt").write_bytes(b"z")
+        self.archiver.compact(self.sim)
+
+        self.archiver.prune(self.sim)
+        self.assertEqual(
+            sorted(os.listdir(directory)),
+            ["config.ini.gz", "gema.log", ARCHIVE_INDEX, "stats.txt.gz"],
+        )
+        self.assertEqual(self.manager.set_archived.call_args.args[1], "pruned")
+
+
+if __name__ == "__main__":
+    unittest.main()
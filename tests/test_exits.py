@@ -0,0 +1,81 @@
+# ----------------------------------------------------------------------------
+# File: <test_exits>.py
+#
+# Description:
+# <Tests of the exit event handlers and CPU switches of configurations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import unittest
+from unittest import mock
+
+from gem5.simulate.exit_event import ExitEvent
+from gem5.utils.gema.exits import GemaExitEventDispatcher
+from gem5.utils.gema.rpc_data import (
+    GemaConfiguration,
+    GemaExitHandlers,
+    GemaProcessor,
+)
+
+
+def make_dispatcher(switch_on=None, **handlers) -> GemaExitEventDispatcher:
+    config = GemaConfiguration(
+        config_id=1,
+        processor=GemaProcessor(
+            type="SimpleSwitchableProcessor", switch_on=switch_on
+        ),
+        exit_handlers=GemaExitHandlers(**handlers),
+    )
+    board = mock.Mock()
+    board.get_processor.return_value.get_cores.return_value = []
+    dispatcher = GemaExitEventDispatcher(config, board)
+    dispatcher.schedule(mock.Mock())
+    return dispatcher
+
+
+class GemaExitEventDispatcherTest(unittest.TestCase):
+    def setUp(self):
+        patcher = mock.patch.dict("sys.modules", {"m5": mock.Mock()})
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        import m5
+
+        self.stats = m5.stats
+
+    def test_switch_keeps_default_stats_reset(self):
+        dispatcher = make_dispatcher(switch_on="workbegin")
+        generators = dispatcher.on_exit_event()
+        self.assertEqual(list(generators), [ExitEvent.WORKBEGIN])
+        self.assertFalse(next(generators[ExitEvent.WORKBEGIN]))
+        self.assertTrue(dispatcher.switched)
+        self.stats.reset.assert_called_once_with()
+        self.stats.dump.assert_not_called()
+
+    def test_switch_keeps_default_stats_dump(self):
+        dispatcher = make_dispatcher(switch_on="workend")
+        self.assertFalse(next(dispatcher.on_exit_event()[ExitEvent.WORKEND]))
+        self.stats.dump.assert_called_once_with()
+        self.stats.reset.assert_not_called()
+
+    def test_configured_actions_replace_defaults(self):
+        dispatcher = make_dispatcher(
+            switch_on="workbegin", workbegin=["dump_stats", "stop"]
+        )
+        self.assertTrue(next(dispatcher.on_exit_event()[ExitEvent.WORKBEGIN]))
+        self.assertEqual(dispatcher.stopped_by, "workbegin")
+        self.stats.dump.assert_called_once_with()
+        self.stats.reset.assert_not_called()
+
+    def test_unconfigured_events_are_left_to_gem5(self):
+        dispatcher = make_dispatcher(m5_exit=["stop"])
+        self.assertEqual(list(dispatcher.on_exit_event()), [ExitEvent.EXIT])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,122 @@
+# ----------------------------------------------------------------------------
+# File: <test_files>.py
+#
+# Description:
+# <Tests of the byte range access to simulation output files>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import base64
+import os
+import tempfile
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.utils.gema.archive import ARCHIVE_INDEX, compress_file
+from gem5.utils.gema.files import GemaOutputFiles, parse_range
+from gem5.utils.gema.progress import write_json_atomic
+
+
+class ParseRangeTest(unittest.TestCase):
+    def test_ranges(self):
+        for header, expected in [
+            ("bytes=0-99", (0, 99)),
+            ("bytes=10-", (10, 999)),
+            ("bytes=-100", (900, 999)),
+            ("bytes=-5000", (0, 999)),
+            ("bytes=500-5000", (500, 999)),
+            ("bytes= 5-6", (5, 6)),
+        ]:
+            with self.subTest(header):
+                self.assertEqual(parse_range(header, 1000), expected)
+
+    def test_unsupported_selects_whole_file(self):
+        for header in [
+            None,
+            "",
+            "items=0-1",
+            "bytes=0-1,5-6",
+            "bytes=5",
+            "bytes=-",
+            "bytes=x-5",
+            "bytes=5-y",
+        ]:
+            with self.subTest(header):
+                self.assertEqual(parse_range(header, 1000), (0, 999))
+
+    def test_unsatisfiable(self):
+        self.assertIsNone(parse_range("bytes=1000-", 1000))
+        self.assertIsNone(parse_range("bytes=7-3", 1000))
+        self.assertIsNone(parse_range("bytes=-0", 1000))
+        self.assertIsNone(parse_range("bytes=0-", 0))
+
+
+class GemaOutputFilesTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.output = Path(self.dir.name) / "sim_1"
+        os.makedirs(self.output / "sub")
+        self.data = bytes(range(256)) * 40
+        (self.output / "trace.out").write_bytes(self.data)
+        (self.output / "sub" / "stats.txt").write_text("simTicks 1\n")
+        (Path(self.dir.name) / "secret").write_text("x")
+        os.symlink(Path(self.dir.name) / "secret", self.output / "link")
+
+        sims = {1: SimpleNamespace(path=self.output)}
+        root = SimpleNamespace(manager=mock.Mock(get_sim=sims.get))
+        self.files = GemaOutputFiles(root)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_read_pages_through_file(self):
+        first = self.files.read(1, "trace.out", 0, 4096, "base64")
+        self.assertEqual(base64.b64decode(first["data"]), self.data[:4096])
+        self.assertFalse(first["eof"])
+        last = self.files.read(1, "trace.out", first["next_offset"] * 2, 4096)
+        self.assertEqual(last["next_offset"], len(self.data))
+        self.assertTrue(last["eof"])
+        tail = self.files.read(1, "trace.out", -10, 100, "base64")
+        self.assertEqual(base64.b64decode(tail["data"]), self.data[-10:])
+        with self.assertRaises(ValueError):
+            self.files.read(1, "trace.out", len(self.data) + 1)
+
+    def test_paths_stay_in_output(self):
+        for path in ("../secret", "link", "missing", "sub"):
+            with self.subTest(path):
+                with self.assertRaises(ValueError):
+                    self.files.resolve(1, path)
+        with self.assertRaises(ValueError):
+            self.files.resolve(2, "trace.out")
+        listed = [entry["path"] for entry in self.files.list_files(1)]
+        self.assertEqual(listed, ["trace.out", "sub/stats.txt"])
+
+    def test_archived_file_served_under_original_path(self):
+        path = self.output / "trace.out"
+        entry = compress_file(path, block_size=1000)
+        write_json_atomic(
+            self.output / ARCHIVE_INDEX, {"files": {"trace.out": entry}}
+        )
+        path.unlink()
+        chunk = self.files.read(1, "trace.out", 2500, 1000, "base64")
+        self.assertEqual(base64.b64decode(chunk["data"]), self.data[2500:3500])
+        self.assertEqual(chunk["size"], len(self.data))
+        (listed,) = [
+            entry
+            for entry in self.files.list_files(1)
+            if entry["path"] == "trace.out"
+        ]
+        self.assertTrue(listed["archived"])
+        self.assertEqual(listed["size"], len(self.data))
+
+
+if __name__ == "__main__":
+    unittest.main()
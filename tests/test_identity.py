@@ -0,0 +1,79 @@
+# ----------------------------------------------------------------------------
+# File: <test_identity>.py
+#
+# Description:
+# <Tests of the content hashes that key cached results and checkpoints>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import unittest
+from dataclasses import replace
+
+from gem5.utils.gema.identity import config_content_hash, warmup_content_hash
+from gem5.utils.gema.rpc_data import GemaConfiguration, GemaProcessor
+
+BUILD = "build"
+
+
+def make_config(config_id: int, version=None) -> GemaConfiguration:
+    return GemaConfiguration(
+        config_id=config_id,
+        resource="x86-hello64-static",
+        resource_version=version,
+        processor=GemaProcessor(isa="X86", type="SimpleProcessor", cpu="timing"),
+    )
+
+
+class ContentHashTest(unittest.TestCase):
+    def test_config_id_and_case_are_ignored(self):
+        config = make_config(1, "1.0.0")
+        other = replace(
+            make_config(2, "1.0.0"),
+            processor=GemaProcessor(isa="x86", type="SimpleProcessor", cpu="timing"),
+        )
+        self.assertEqual(
+            config_content_hash(config, BUILD), config_content_hash(other, BUILD)
+        )
+        self.assertNotEqual(
+            config_content_hash(config, BUILD), config_content_hash(config, "new")
+        )
+
+    def test_unversioned_resource_is_hashed_by_digest(self):
+        for content_hash in (config_content_hash, warmup_content_hash):
+            with self.subTest(content_hash.__name__):
+                config = make_config(1)
+                self.assertIsNone(content_hash(config, BUILD))
+                first = content_hash(config, BUILD, resource_digest="aa" * 32)
+                second = content_hash(config, BUILD, resource_digest="bb" * 32)
+                self.assertIsNotNone(first)
+                self.assertNotEqual(first, second)
+                self.assertEqual(
+                    first, content_hash(make_config(2), BUILD, "aa" * 32)
+                )
+
+    def test_versioned_resource_ignores_digest(self):
+        for content_hash in (config_content_hash, warmup_content_hash):
+            with self.subTest(content_hash.__name__):
+                config = make_config(1, "1.0.0")
+                self.assertEqual(
+                    content_hash(config, BUILD),
+                    content_hash(config, BUILD, resource_digest="aa" * 32),
+                )
+                self.assertNotEqual(
+                    content_hash(config, BUILD),
+                    content_hash(make_config(1, "2.0.0"), BUILD),
+                )
+
+    def test_no_resource(self):
+        config = replace(make_config(1), resource=None)
+        self.assertIsNotNone(config_content_hash(config, BUILD))
+
+
+if __name__ == "__main__":
+    unittest.main()
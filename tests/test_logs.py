@@ -0,0 +1,109 @@
+# ----------------------------------------------------------------------------
+# File: <test_logs>.py
+#
+# Description:
+# <Tests of the per-simulation log capture and its rotation>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import os
+import tempfile
+import time
+import unittest
+from pathlib import Path
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.utils.gema.logs import LOG_FILE, GemaLogCollector
+from gem5.utils.gema.rpc_data import SimStatus
+
+
+class GemaLogCollectorTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.sim = SimpleNamespace(
+            sim_id=1, path=Path(self.dir.name) / "sim_1", status=SimStatus.RUNNING
+        )
+        sims = {1: self.sim}
+        self.root = SimpleNamespace(manager=mock.Mock(get_sim=sims.get))
+        self.collector = self.make_collector()
+        # Lines of 10 bytes, numbered by their position in the log
+        self.data = b"".join(b"%09d\n" % (i * 10) for i in range(100))
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def make_collector(self) -> GemaLogCollector:
+        collector = GemaLogCollector(self.root, max_bytes=300)
+        collector.TAIL_BYTES = 50
+        return collector
+
+    def capture(self) -> None:
+        write = self.collector.open(self.sim)
+        log = self.collector._logs[1]
+        # Each chunk is collected before the next, so every one is appended
+        # and may rotate the log on its own
+        for i in range(70, len(self.data) + 70, 70):
+            os.write(write.fileno(), self.data[i - 70 : i])
+            self.wait_for(lambda: log.end >= min(i, len(self.data)))
+        write.close()
+        self.wait_for(lambda: log.closed)
+
+    def wait_for(self, condition) -> None:
+        deadline = time.monotonic() + 10
+        while not condition():
+            self.assertLess(time.monotonic(), deadline)
+            time.sleep(0.001)
+
+    def test_rotation_keeps_offsets(self):
+        self.capture()
+        # Only the newest BACKUPS rotated files are kept, each named after
+        # the position of its first byte
+        starts = sorted(
+            int(name[len(LOG_FILE) + 1 :])
+            for name in os.listdir(self.sim.path)
+            if name != LOG_FILE
+        )
+        self.assertEqual(len(starts), GemaLogCollector.BACKUPS)
+        for start in starts:
+            rotated = Path(self.sim.path) / f"{LOG_FILE}.{start}"
+            self.assertEqual(
+                rotated.read_bytes(),
+                self.data[start : start + rotated.stat().st_size],
+            )
+
+        tail = self.collector.read(1, max_bytes=30)
+        self.assertEqual(tail["offset"], 970)
+        self.assertEqual(tail["data"].encode(), self.data[970:])
+        self.assertTrue(tail["complete"])
+
+        # Read from disk, across rotated files
+        first = starts[0]
+        middle = self.collector.read(1, first + 5, 500)
+        self.assertEqual(middle["data"].encode(), self.data[first + 5 :][:500])
+
+        # Positions rotated away start at the oldest one still on disk
+        oldest = self.collector.read(1, 0, 25)
+        self.assertEqual(oldest["offset"], first)
+        self.assertEqual(oldest["data"].encode(), self.data[first : first + 25])
+
+    def test_offsets_survive_restart(self):
+        self.capture()
+        self.sim.status = SimStatus.FINISHED
+        collector = self.make_collector()
+        page = collector.read(1, 950, 40)
+        self.assertEqual(page["data"].encode(), self.data[950:990])
+        self.assertEqual(page["size"], len(self.data))
+        end = collector.read(1, 950)
+        self.assertEqual(end["data"].encode(), self.data[950:])
+        self.assertTrue(end["complete"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,212 @@
+# ----------------------------------------------------------------------------
+# File: <test_persistence>.py
+#
+# Description:
+# <Tests of the gEMA state store and the lazily restored configuration index>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import tempfile
+import time
+import unittest
+from pathlib import Path
+
+from gem5.utils.gema.index import GemaConfigIndex
+from gem5.utils.gema.persistence import (
+    _CONFIG_COLUMNS,
+    _SIM_COLUMNS,
+    GemaStateStore,
+)
+from gem5.utils.gema.rpc_data import (
+    GemaBoard,
+    GemaCachedResult,
+    GemaConfiguration,
+    GemaProcessor,
+    GemaSimulation,
+    SimStatus,
+)
+
+
+def make_config(config_id: int, cpu: str = "timing") -> GemaConfiguration:
+    return GemaConfiguration(
+        config_id=config_id,
+        resource="x86-hello64-static",
+        board=GemaBoard(type="SimpleBoard", clk=3.5),
+        processor=GemaProcessor(
+            isa="X86", type="SimpleProcessor", cpu=cpu, ncores=2
+        ),
+    )
+
+
+def make_sim(
+    sim_id: int, config: GemaConfiguration, status: str = SimStatus.FINISHED
+) -> GemaSimulation:
+    return GemaSimulation(
+        sim_id=sim_id,
+        config=config,
+        generated_on="2026-01-01 00:00:00",
+        path=Path(f"/tmp/m5out/sim_{sim_id}_config_{config.config_id}"),
+        pid=1000 + sim_id,
+        status=status,
+        config_hash="ab" * 32,
+        exit_code=0,
+        final_tick=10**9,
+    )
+
+
+class GemaStateStoreTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "state.db"
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def test_round_trip(self):
+        store = GemaStateStore(self.path)
+        configs = [make_config(1), make_config(2, cpu="o3")]
+        sims = [make_sim(1, configs[0]), make_sim(2, configs[1])]
+        sims[1].cpus, sims[1].numa_node = [2, 34], 0
+        sims[1].checkpoint_restored = True
+        store.save_configs(configs)
+        store.save_sims(sims)
+        store.close()
+
+        store = GemaStateStore(self.path)
+        snapshot = store.load()
+        self.assertEqual(snapshot.config_ids, [1, 2])
+        self.assertEqual(snapshot.sim_ids, [1, 2])
+        self.assertEqual(store.load_configs([2]), {2: configs[1]})
+        loaded = store.load_sims([2, 1])
+        self.assertEqual(loaded, sims)
+        self.assertIs(loaded[1].checkpoint_restored, True)
+        self.assertIsInstance(loaded[1].path, Path)
+        self.assertEqual(loaded[1].to_dict(), sims[1].to_dict())
+
+    def test_only_active_sims_loaded_at_startup(self):
+        store = GemaStateStore(self.path)
+        config = make_config(1)
+        store.save_sims(
+            [
+                make_sim(1, config),
+                make_sim(2, config, SimStatus.QUEUED),
+                make_sim(3, config, SimStatus.RUNNING),
+            ]
+        )
+        snapshot = store.load()
+        self.assertEqual(snapshot.sim_ids, [1, 2, 3])
+        self.assertEqual([sim.sim_id for sim in snapshot.active_sims], [2, 3])
+        self.assertEqual(store.find_sim_ids("pid = ?", (1001,)), [1])
+
+    def test_identical_snapshots_stored_once(self):
+        store = GemaStateStore(self.path)
+        config = make_config(1)
+        store.save_sims([make_sim(1, config), make_sim(2, config)])
+        (count,) = store._conn.execute(
+            "SELECT count(*) FROM config_snapshots"
+        ).fetchone()
+        self.assertEqual(count, 1)
+
+    def test_results_read_through(self):
+        store = GemaStateStore(self.path)
+        result = GemaCachedResult("ab", 1, "/out", "/out/stats.txt", "now")
+        store.save_result(result)
+        self.assertEqual(store.load_result("ab"), result)
+        self.assertIsNone(store.load_result("cd"))
+        self.assertEqual(store.load_results(), [result])
+
+    def test_startup_with_100k_sims_under_a_second(self):
+        count = 100_000
+        store = GemaStateStore(self.path)
+        config = make_config(1)
+        store.save_configs([config])
+        store.save_sims([make_sim(1, config)])
+        # Replicate the records in SQL, which is much faster than saving them
+        config_columns = ", ".join(_CONFIG_COLUMNS)
+        sim_columns = ", ".join(_SIM_COLUMNS[1:])
+        numbers = (
+            "WITH RECURSIVE n(i) AS "
+            "(SELECT 2 UNION ALL SELECT i + 1 FROM n WHERE i <= ?) "
+        )
+        conn = store._conn
+        conn.execute("BEGIN")
+        conn.execute(
+            f"{numbers} INSERT INTO configs (config_id, {config_columns}, data) "
+            f"SELECT i, {config_columns}, data FROM n, configs "
+            "WHERE config_id = 1",
+            (count,),
+        )
+        conn.execute(
+            f"{numbers} INSERT INTO config_snapshots (key, data) "
+            "SELECT 'key' || i, data FROM n, config_snapshots",
+            (count,),
+        )
+        conn.execute(
+            f"{numbers} INSERT INTO sims "
+            f"(sim_id, config_id, config_key, {sim_columns}) "
+            f"SELECT i, i, 'key' || i, {sim_columns} FROM n, sims "
+            "WHERE sim_id = 1",
+            (count,),
+        )
+        conn.execute("COMMIT")
+        store.close()
+
+        start = time.perf_counter()
+        store = GemaStateStore(self.path)
+        snapshot = store.load()
+        index = GemaConfigIndex()
+        index.restore(
+            snapshot.config_ids, store.load_configs, store.load_config_index
+        )
+        elapsed = time.perf_counter() - start
+
+        self.assertEqual(len(snapshot.config_ids), count + 1)
+        self.assertEqual(len(snapshot.sim_ids), count + 1)
+        self.assertLess(elapsed, 1.0)
+        self.assertEqual(index.get(500).processor.cpu, "timing")
+
+
+class GemaConfigIndexRestoreTest(unittest.TestCase):
+    def setUp(self):
+        self.stored = {1: make_config(1), 2: make_config(2, cpu="o3")}
+        self.loads = []
+        self.index = GemaConfigIndex()
+        self.index.restore([1, 2], self._load, self._load_index)
+
+    def _load(self, config_ids):
+        self.loads.append(config_ids)
+        return {i: self.stored[i] for i in config_ids if i in self.stored}
+
+    def _load_index(self):
+        return [
+            (i, *GemaConfigIndex.indexed_values(config))
+            for i, config in self.stored.items()
+        ]
+
+    def test_loaded_on_first_read(self):
+        self.assertEqual(self.loads, [])
+        self.assertEqual(self.index.last_id, 2)
+        self.assertEqual(self.index.get(2), self.stored[2])
+        self.index.get(2)
+        self.assertEqual(self.loads, [[2]])
+
+    def test_filter_covers_restored_and_new(self):
+        self.index.add(make_config(3, cpu="o3"))
+        matches = self.index.filter({"processor.cpu": "O3"})
+        self.assertEqual([config.config_id for config in matches], [2, 3])
+
+    def test_remove_before_indexing(self):
+        self.assertIsNotNone(self.index.remove(2))
+        del self.stored[2]
+        self.assertEqual(self.index.filter({"processor.cpu": "o3"}), [])
+        self.assertEqual([c.config_id for c in self.index], [1])
+
+
+if __name__ == "__main__":
+    unittest.main()
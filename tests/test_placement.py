@@ -0,0 +1,72 @@
+# ----------------------------------------------------------------------------
+# File: <test_placement>.py
+#
+# Description:
+# <Tests of the core placement of simulations>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from gem5.utils.gema.placement import GemaCorePlacement, parse_cpulist
+
+
+class ParseCpulistTest(unittest.TestCase):
+    def test_ranges_and_singles(self):
+        self.assertEqual(parse_cpulist("0-3,8,10-11\n"), [0, 1, 2, 3, 8, 10, 11])
+        self.assertEqual(parse_cpulist("5"), [5])
+
+    def test_empty(self):
+        self.assertEqual(parse_cpulist(""), [])
+        self.assertEqual(parse_cpulist("\n"), [])
+
+    def test_malformed(self):
+        with self.assertRaises(ValueError):
+            parse_cpulist("0-x")
+
+
+class GemaCorePlacementTest(unittest.TestCase):
+    def setUp(self):
+        # Two nodes of two cores with two SMT siblings each
+        nodes = {0: [(0, 4), (1, 5)], 1: [(2, 6), (3, 7)]}
+        with mock.patch(
+            "gem5.utils.gema.placement.placement_supported", return_value=True
+        ), mock.patch(
+            "gem5.utils.gema.placement.read_host_cores", return_value=nodes
+        ):
+            self.placement = GemaCorePlacement(cores_per_sim=2)
+
+    def sim(self, sim_id: int) -> SimpleNamespace:
+        return SimpleNamespace(sim_id=sim_id, cpus=None, numa_node=None)
+
+    def test_sims_spread_across_nodes(self):
+        first, second = self.sim(1), self.sim(2)
+        self.assertTrue(self.placement.assign(first))
+        self.assertTrue(self.placement.assign(second))
+        self.assertEqual((first.cpus, first.numa_node), ([0, 1, 4, 5], 0))
+        self.assertEqual((second.cpus, second.numa_node), ([2, 3, 6, 7], 1))
+        self.assertFalse(self.placement.can_place())
+        self.assertFalse(self.placement.assign(self.sim(3)))
+
+        self.placement.release(first)
+        self.assertTrue(self.placement.assign(self.sim(3)))
+
+    def test_spanning_nodes_leaves_memory_unbound(self):
+        # No node has three free cores
+        self.placement.cores_per_sim = 3
+        sim = self.sim(1)
+        self.assertTrue(self.placement.assign(sim))
+        self.assertEqual(sim.cpus, [0, 1, 2, 4, 5, 6])
+        self.assertIsNone(sim.numa_node)
+
+
+if __name__ == "__main__":
+    unittest.main()
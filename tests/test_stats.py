@@ -0,0 +1,131 @@
+# ----------------------------------------------------------------------------
+# File: <test_stats>.py
+#
+# Description:
+# <Tests of the gem5 stats parser and the incremental stats reader>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import gzip
+import tempfile
+import unittest
+from pathlib import Path
+from unittest import mock
+
+from gem5.utils.gema.archive import ARCHIVE_SUFFIX
+from gem5.utils.gema.stats import (
+    GemaStatsReader,
+    compile_patterns,
+    parse_stats,
+)
+
+
+def make_dump(ticks: int, ipc: float) -> bytes:
+    return (
+        b"\n---------- Begin Simulation Statistics ----------\n"
+        b"simSeconds                                   0.000001"
+        b"                       # Number of seconds simulated (Second)\n"
+        + f"simTicks {ticks} # Number of ticks simulated (Tick)\n".encode()
+        + f"board.processor.cores0.core.ipc {ipc} # IPC ((Count/Cycle))\n".encode()
+        + b"board.memory.policy FRFCFS\n"
+        b"# a comment line\n"
+        b"\n---------- End Simulation Statistics   ----------\n"
+    )
+
+
+class ParseStatsTest(unittest.TestCase):
+    def test_values_and_offsets(self):
+        data = make_dump(100, 0.5) + make_dump(200, 1.25)
+        dumps = list(parse_stats(data.splitlines(keepends=True)))
+        self.assertEqual(len(dumps), 2)
+        self.assertEqual(dumps[1][0], len(data))
+        self.assertEqual(
+            dumps[0][1],
+            {
+                "simSeconds": 0.000001,
+                "simTicks": 100,
+                "board.processor.cores0.core.ipc": 0.5,
+                "board.memory.policy": "FRFCFS",
+            },
+        )
+        self.assertEqual(dumps[1][1]["simTicks"], 200)
+
+    def test_incomplete_dump_is_not_yielded(self):
+        complete = make_dump(100, 0.5)
+        partial = make_dump(200, 1.0)[:-30]
+        dumps = list(parse_stats((complete + partial).splitlines(keepends=True)))
+        self.assertEqual([offset for offset, _ in dumps], [len(complete)])
+
+    def test_patterns(self):
+        matches = compile_patterns(["board.processor.*.ipc", r"re:^sim\w+$"])
+        self.assertTrue(matches("board.processor.cores0.core.ipc"))
+        self.assertTrue(matches("simTicks"))
+        self.assertFalse(matches("board.memory.policy"))
+        with self.assertRaises(ValueError):
+            compile_patterns(["re:("])
+        with self.assertRaises(ValueError):
+            compile_patterns([3])
+
+
+class GemaStatsReaderTest(unittest.TestCase):
+    def setUp(self):
+        self.dir = tempfile.TemporaryDirectory()
+        self.path = Path(self.dir.name) / "stats.txt"
+        self.reader = GemaStatsReader(None)
+
+    def tearDown(self):
+        self.dir.cleanup()
+
+    def ticks(self) -> list[int]:
+        return [dump["simTicks"] for dump in self.reader.get_dumps(self.path)]
+
+    def test_appended_dumps_are_parsed_incrementally(self):
+        self.assertEqual(self.ticks(), [])
+        self.path.write_bytes(make_dump(100, 0.5))
+        self.assertEqual(self.ticks(), [100])
+        with open(self.path, "ab") as f:
+            f.write(make_dump(200, 1.0))
+        with mock.patch(
+            "gem5.utils.gema.stats.parse_stats", wraps=parse_stats
+        ) as parser:
+            self.assertEqual(self.ticks(), [100, 200])
+        self.assertEqual(len(parser.call_args_list), 1)
+        # Only the appended bytes are parsed
+        parsed = self.reader._parsed[self.path]
+        self.assertEqual(parsed.offset, self.path.stat().st_size)
+
+    def test_truncated_file_is_parsed_again(self):
+        self.path.write_bytes(make_dump(100, 0.5) + make_dump(200, 1.0))
+        self.assertEqual(self.ticks(), [100, 200])
+        self.path.write_bytes(make_dump(300, 1.0))
+        self.assertEqual(self.ticks(), [300])
+
+    def test_compressed_file_is_not_parsed_again(self):
+        data = b"".join(make_dump(ticks, 1.0) for ticks in range(1, 50))
+        archive = self.path.with_name(self.path.name + ARCHIVE_SUFFIX)
+        with gzip.open(archive, "wb") as f:
+            f.write(data)
+        # The decompressed offset exceeds the size of the archive
+        self.assertLess(archive.stat().st_size, len(data))
+
+        with mock.patch.object(
+            self.reader, "_read", wraps=self.reader._read
+        ) as read:
+            self.assertEqual(self.ticks(), list(range(1, 50)))
+            self.assertEqual(self.ticks(), list(range(1, 50)))
+        self.assertEqual(read.call_count, 1)
+
+        archive.unlink()
+        with gzip.open(archive, "wb") as f:
+            f.write(make_dump(7, 1.0))
+        self.assertEqual(self.ticks(), [7])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,119 @@
+# ----------------------------------------------------------------------------
+# File: <test_sweep>.py
+#
+# Description:
+# <Tests of the expansion of sweep axes into design points>.
+#
+# Contact:
+# For inquiries, please contact Alex Manley (amanley97@ku.edu).
+#
+# License:
+# This project is licensed under the MIT License. See the LICENSE file
+# in the repository root for more information.
+# ----------------------------------------------------------------------------
+
+import itertools
+import unittest
+
+from gem5.utils.gema.sweep import GemaSweepGenerator
+
+
+class ExpandTest(unittest.TestCase):
+    def setUp(self):
+        self.sweeps = GemaSweepGenerator(None)
+
+    def values(self, spec) -> list:
+        points = self.sweeps.expand({"processor.ncores": spec})
+        return [point["processor.ncores"] for point in points]
+
+    def test_axis_specifications(self):
+        self.assertEqual(self.values([1, 2, 4]), [1, 2, 4])
+        self.assertEqual(self.values({"values": [8]}), [8])
+        self.assertEqual(self.values(3), [3])
+        self.assertEqual(self.values({"start": 1, "stop": 7, "step": 2}), [1, 3, 5, 7])
+        self.assertEqual(self.values({"start": 1, "stop": 8, "step": 2}), [1, 3, 5, 7])
+        self.assertEqual(
+            self.values({"start": 64, "stop": 1024, "factor": 2}),
+            [64, 128, 256, 512, 1024],
+        )
+        self.assertEqual(
+            self.values({"start": 1.5, "stop": 2.0, "step": 0.1}),
+            [1.5, 1.6, 1.7, 1.8, 1.9, 2.0],
+        )
+
+    def test_invalid_axes(self):
+        for spec in [
+            [],
+            {"start": 8, "stop": 1, "step": 1},
+            {"start": 1, "stop": 8, "step": 0},
+            {"start": 1, "stop": 8, "factor": 1},
+            {"start": 0, "stop": 8, "factor": 2},
+            {"start": 1, "stop": 8},
+        ]:
+            with self.subTest(spec):
+                with self.assertRaises(ValueError):
+                    self.values(spec)
+        with self.assertRaises(ValueError):
+            self.sweeps.expand({"processor.nope": [1]})
+        with self.assertRaises(ValueError):
+            self.sweeps.expand({"ncores": [1]})
+        with self.assertRaises(ValueError):
+            self.sweeps.expand({"resource": ["a"]}, mode="grid")
+
+    def test_product(self):
+        axes = {
+            "processor.cpu": ["timing", "o3"],
+            "cache.l2_size": [256, 512, 1024],
+            "resource": ["a", "b"],
+        }
+        points = self.sweeps.expand(axes)
+        self.assertEqual(len(points), 12)
+        self.assertEqual(
+            points,
+            [dict(zip(axes, values)) for values in itertools.product(*axes.values())],
+        )
+
+    def test_product_limit(self):
+        axes = {
+            "board.clk": {"start": 1, "stop": 1000, "step": 1},
+            "memory.size": {"start": 1, "stop": 1000, "step": 1},
+        }
+        with self.assertRaises(ValueError):
+            self.sweeps.expand(axes)
+        points = self.sweeps.expand(axes, mode="sample", samples=50, seed=3)
+        self.assertEqual(len(points), 50)
+        self.assertEqual(
+            points, self.sweeps.expand(axes, mode="sample", samples=50, seed=3)
+        )
+
+    def test_sample_draws_distinct_points(self):
+        axes = {"processor.ncores": [1, 2, 4], "processor.cpu": ["timing", "o3"]}
+        product = self.sweeps.expand(axes)
+        sampled = self.sweeps.expand(axes, mode="sample", samples=4, seed=1)
+        self.assertEqual(len(sampled), 4)
+        self.assertTrue(all(point in product for point in sampled))
+        self.assertEqual(len({tuple(p.values()) for p in sampled}), 4)
+        # Asking for more points than exist returns all of them, in order
+        everything = self.sweeps.expand(axes, mode="sample", samples=100)
+        self.assertEqual(everything, product)
+        with self.assertRaises(ValueError):
+            self.sweeps.expand(axes, mode="sample")
+
+    def test_apply_point(self):
+        base = {"processor": {"isa": "X86", "ncores": 1}, "resource": {"name": "x"}}
+        data = self.sweeps._apply_point(
+            base, {"processor.ncores": 4, "resource": "y", "cache.l1d_size": 64}
+        )
+        self.assertEqual(
+            data,
+            {
+                "processor": {"isa": "X86", "ncores": 4},
+                "resource": {"name": "y"},
+                "cache": {"l1d_size": 64},
+            },
+        )
+        self.assertEqual(base["processor"]["ncores"], 1)
+
+
+if __name__ == "__main__":
+    unittest.main()